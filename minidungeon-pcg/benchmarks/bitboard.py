@@ -0,0 +1,74 @@
+"""
+Bitboard frontier expansion against the deque BFS of the list backend for
+calculate_path_length, count_reachable_tiles and count_dead_ends, and for
+GA evaluation: analyze_dungeon alone and compute_fitness_many, which is
+what evaluate_population runs on every cache miss.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.bitboard [map sizes...]
+"""
+
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.pcg.bitboard_generator import BitboardGenerator
+from minidungeon_pcg.pcg.generator import Generator
+
+REPEATS = 7
+CORPUS_SIZE = 100
+
+
+def time_per_call(run, count: int) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [9, 12, 16, 24, 32]
+
+    print(
+        f"{'map':>6} {'function':<24} {'bfs us':>9} {'bitboard us':>12} {'speedup':>8}"
+    )
+    for size in sizes:
+        backends = [
+            cls(width=size, height=size, population_size=CORPUS_SIZE, seed=0)
+            for cls in (Generator, BitboardGenerator)
+        ]
+        corpus = backends[0].initialize_population()
+        for dungeon in corpus:
+            backends[0].repair_dungeon(dungeon)
+        ends = [
+            (backends[0].find_tile(d, "S"), backends[0].find_tile(d, "E"))
+            for d in corpus
+        ]
+
+        cases = {
+            "calculate_path_length": lambda g: [
+                g.calculate_path_length(d, s, e) for d, (s, e) in zip(corpus, ends)
+            ],
+            "count_reachable_tiles": lambda g: [
+                g.count_reachable_tiles(d, s) for d, (s, _) in zip(corpus, ends)
+            ],
+            "count_dead_ends": lambda g: [g.count_dead_ends(d) for d in corpus],
+            "analyze_dungeon": lambda g: [g.analyze_dungeon(d) for d in corpus],
+            "compute_fitness_many": lambda g: g.compute_fitness_many(corpus),
+        }
+        for name, case in cases.items():
+            bfs, bits = (
+                time_per_call(lambda: case(generator), CORPUS_SIZE)
+                for generator in backends
+            )
+            print(
+                f"{size:>4}x{size} {name:<24} {bfs * 1e6:>9.1f} "
+                f"{bits * 1e6:>12.1f} {bfs / bits:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Per-step latency of headless MdTreasureAgent episodes (as `MdEnv.step`
+drives them, plus the observation queries) with the BFS Pather against
+the FieldPather that `MdEnv(distance_fields=True)` uses, on repaired
+dungeons of growing size.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.distance_fields [map sizes...]
+"""
+
+import random
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.envs.agent.field_pather import FieldPather
+from minidungeon_pcg.envs.agent.md_treasure_agent import MdTreasureAgent
+from minidungeon_pcg.envs.agent.pather import Pather
+from minidungeon_pcg.pcg.generator import Generator
+
+CORPUS_SIZE = 20
+MAX_STEPS = 400
+OBSERVATION = (
+    ({"M"}, False),
+    ({"T"}, False),
+    ({"T"}, True),
+    ({"P"}, False),
+    ({"P"}, True),
+    ({"E"}, False),
+    ({"E"}, True),
+)
+
+
+def observe(agent: MdTreasureAgent, grid) -> None:
+    for targets, avoid in OBSERVATION:
+        agent.pather.distance_to_nearest(grid, agent.position, targets, avoid)
+
+
+def play(rows, pather: Pather) -> Tuple[int, float, float]:
+    """
+    One episode: steps, seconds for the reset observation (which builds
+    the fields) and seconds for the steps after it
+    """
+    grid = [list(row) for row in rows]
+    height, width = len(grid), max(len(row) for row in grid)
+    agent = MdTreasureAgent()
+    # One pather for every episode, as MdEnv keeps its agent across resets
+    agent.pather = pather
+    agent.position = next(
+        (x, y)
+        for y, row in enumerate(grid)
+        for x, tile in enumerate(row)
+        if tile == "S"
+    )
+
+    start = time.perf_counter()
+    pather.mark_grid_changed()
+    observe(agent, grid)
+    reset = time.perf_counter() - start
+
+    start = time.perf_counter()
+    steps = 0
+    terminated = False
+    while steps < MAX_STEPS and not terminated:
+        selected = agent.select_action(agent.standard_vector, grid)
+        if selected is None:
+            break
+        _, _, terminated, _, _, grid, _ = agent.take_action(
+            selected, grid, width, height
+        )
+        observe(agent, grid)
+        steps += 1
+    return steps, reset, time.perf_counter() - start
+
+
+def run(stages, pather_class) -> Tuple[float, float, float]:
+    """Mean steps per episode, seconds per reset and seconds per step"""
+    random.seed(0)
+    pather = pather_class()
+    results = [play(rows, pather) for rows in stages]
+    steps = sum(result[0] for result in results)
+    return (
+        steps / len(stages),
+        sum(result[1] for result in results) / len(stages),
+        sum(result[2] for result in results) / max(steps, 1),
+    )
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [9, 16, 32, 64]
+
+    print(
+        f"{'map':>6} {'steps/ep':>9} {'bfs reset us':>13} {'bfs us/step':>12} "
+        f"{'fields reset us':>16} {'fields us/step':>15} {'step speedup':>13}"
+    )
+    for size in sizes:
+        generator = Generator(
+            width=size, height=size, population_size=CORPUS_SIZE, seed=0
+        )
+        stages = []
+        for dungeon in generator.initialize_population():
+            generator.repair_dungeon(dungeon)
+            stages.append(generator.to_rows(dungeon))
+
+        steps, bfs_reset, bfs = run(stages, Pather)
+        _, fields_reset, fields = run(stages, FieldPather)
+        print(
+            f"{size:>4}x{size} {steps:>9.1f} {bfs_reset * 1e6:>13.1f} "
+            f"{bfs * 1e6:>12.1f} {fields_reset * 1e6:>16.1f} "
+            f"{fields * 1e6:>15.1f} {bfs / fields:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
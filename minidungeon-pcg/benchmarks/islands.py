@@ -0,0 +1,66 @@
+"""
+Island-model GA against the plain GA (`Generator.evolve`, the loop behind
+generate_dungeon) at equal evaluation counts.
+
+The islands share the population out between them and run the same number
+of generations, so both spend population_size * generations fitness
+evaluations; the evaluation column reports the real totals.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.islands [islands] [migration_interval] [seeds]
+"""
+
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.islands import run_islands
+
+CHECKPOINTS = (0.1, 0.25, 0.5, 1.0)
+
+
+def describe(label: str, trace, evaluations: int, wall_time: float) -> None:
+    points = " ".join(
+        f"{trace[max(0, int(len(trace) * fraction) - 1)]:7.2f}"
+        for fraction in CHECKPOINTS
+    )
+    print(f"{label:>10} {evaluations:>11} {wall_time:>8.2f}s {points}")
+
+
+def run_plain(generator: Generator, seed: int) -> None:
+    generator.rng.seed(seed)
+    start = time.perf_counter()
+    progress = list(generator.evolve())
+    wall_time = time.perf_counter() - start
+    trace = [step.best_fitness for step in progress]
+    describe("plain GA", trace, progress[-1].evaluations, wall_time)
+
+
+def main():
+    islands = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    migration_interval = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    seeds = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    generator = Generator(population_size=150, generations=300)
+    header = " ".join(f"{int(fraction * 100):>6}%" for fraction in CHECKPOINTS)
+    print(f"{'run':>10} {'evaluations':>11} {'wall':>9} best fitness at {header}")
+
+    for seed in range(seeds):
+        print(f"seed {seed}")
+        run_plain(generator, seed)
+
+        report = run_islands(generator, islands, migration_interval, seed=seed)
+        describe(
+            f"{islands} islands",
+            report.global_trace,
+            report.evaluations,
+            report.wall_time,
+        )
+        for island, trace in enumerate(report.island_traces):
+            print(f"{'':>10} island {island} final best {trace[-1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Speedup of process-pool fitness evaluation over serial evaluation.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.parallel_fitness [max_workers] [population sizes...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.parallel import ParallelEvaluator
+
+REPEATS = 3
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def time_evaluation(evaluate, population) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        evaluate(population)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    sizes = [int(arg) for arg in sys.argv[2:]] or [150, 1_000, 10_000]
+
+    print(f"{'population':>10} {'workers':>8} {'seconds':>10} {'speedup':>8}")
+    for size in sizes:
+        generator = Generator(population_size=size, fitness_cache_size=0, seed=0)
+        population = generator.initialize_population()
+        serial = time_evaluation(generator.evaluate_population, population)
+        print(f"{size:>10} {'serial':>8} {serial:>10.4f} {1.0:>8.2f}")
+
+        for workers in worker_counts(max_workers):
+            with ParallelEvaluator(generator, workers, seed=0) as evaluator:
+                evaluator.evaluate(population)  # warm up the pool
+                seconds = time_evaluation(evaluator.evaluate, population)
+            print(f"{size:>10} {workers:>8} {seconds:>10.4f} {serial / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
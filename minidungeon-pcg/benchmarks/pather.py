@@ -0,0 +1,115 @@
+"""
+Flat-array BFS of Pather against the dict-and-deque BFS it replaced, per
+search from random floor tiles of repaired dungeons: with the passability
+of the grid version already compiled (as within one env step), and with
+it rebuilt for every search (as after a tile changed).
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.pather [map sizes...]
+"""
+
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.envs.agent.pather import Pather
+from minidungeon_pcg.pcg.generator import Generator
+
+REPEATS = 7
+CORPUS_SIZE = 50
+STARTS = 4
+
+
+def dict_bfs(grid, start, avoid_monsters=False):
+    """The previous `Pather.bfs`: tuple keys in dicts and a deque"""
+    height = len(grid)
+    width = 0 if height == 0 else max(len(row) for row in grid)
+    if width == 0 or height == 0:
+        return {}, {}
+
+    distances = {start: 0}
+    prev = {}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        distance = distances[(x, y)]
+        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            next_x, next_y = x + dx, y + dy
+            if not (0 <= next_x < width and 0 <= next_y < height):
+                continue
+            if (next_x, next_y) in distances:
+                continue
+            tile_char = grid[next_y][next_x] if next_x < len(grid[next_y]) else " "
+            if tile_char == "#":
+                continue
+            if avoid_monsters and tile_char == "M":
+                continue
+            distances[(next_x, next_y)] = distance + 1
+            prev[(next_x, next_y)] = (x, y)
+            queue.append((next_x, next_y))
+    return distances, prev
+
+
+def time_per_call(run, count: int) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [9, 16, 32, 64]
+    rng = random.Random(0)
+
+    print(
+        f"{'map':>6} {'dict us':>9} {'flat us':>9} {'speedup':>8} "
+        f"{'flat+compile us':>16} {'speedup':>8}"
+    )
+    for size in sizes:
+        generator = Generator(
+            width=size, height=size, population_size=CORPUS_SIZE, seed=0
+        )
+        cases = []
+        for dungeon in generator.initialize_population():
+            generator.repair_dungeon(dungeon)
+            grid = [list(row) for row in generator.to_rows(dungeon)]
+            floor = [
+                (x, y)
+                for y, row in enumerate(grid)
+                for x, tile in enumerate(row)
+                if tile != "#"
+            ]
+            cases += [(grid, rng.choice(floor)) for _ in range(STARTS)]
+
+        pather = Pather()
+
+        def flat_compiled():
+            for grid, start in cases:
+                pather.search(grid, start, True)
+
+        def flat_rebuilt():
+            for grid, start in cases:
+                pather.mark_grid_changed()
+                pather.search(grid, start, True)
+
+        flat_compiled()  # compile the layout and every grid's passability
+        dictionary = time_per_call(
+            lambda: [dict_bfs(grid, start, True) for grid, start in cases],
+            len(cases),
+        )
+        flat = time_per_call(flat_compiled, len(cases))
+        rebuilt = time_per_call(flat_rebuilt, len(cases))
+        print(
+            f"{size:>4}x{size} {dictionary * 1e6:>9.1f} {flat * 1e6:>9.1f} "
+            f"{dictionary / flat:>8.2f} {rebuilt * 1e6:>16.1f} "
+            f"{dictionary / rebuilt:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
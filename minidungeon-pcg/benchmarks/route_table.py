@@ -0,0 +1,79 @@
+"""
+Stage route tables: build and cache load time, size, and per-step latency
+of headless MdTreasureAgent episodes with the BFS Pather against the
+RoutePather that `MdEnv(route_table=True)` uses, on repaired dungeons of
+growing size. Fallbacks count the avoid-monster queries per step that
+searched because a monster lay on the stored route.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.route_table [map sizes...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, "src")
+
+from benchmarks.distance_fields import play
+from minidungeon_pcg.envs.agent.pather import Pather
+from minidungeon_pcg.envs.agent.route_table import RoutePather, RouteTable
+from minidungeon_pcg.pcg.generator import Generator
+
+CORPUS_SIZE = 10
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [9, 16, 32]
+
+    print(
+        f"{'map':>6} {'build ms':>9} {'load ms':>8} {'table KiB':>10} "
+        f"{'bfs us/step':>12} {'table us/step':>14} {'speedup':>8} "
+        f"{'fallbacks/step':>15}"
+    )
+    for size in sizes:
+        generator = Generator(
+            width=size, height=size, population_size=CORPUS_SIZE, seed=0
+        )
+        build = load = kib = bfs = routes = 0.0
+        steps = fallbacks = 0
+        with tempfile.TemporaryDirectory() as directory:
+            for number, dungeon in enumerate(generator.initialize_population()):
+                generator.repair_dungeon(dungeon)
+                rows = generator.to_rows(dungeon)
+                stage_file = os.path.join(directory, f"{number}.txt")
+                with open(stage_file, "w") as f:
+                    f.write("\n".join(rows))
+                grid = [list(row) for row in rows]
+
+                start = time.perf_counter()
+                table = RouteTable.for_stage(stage_file, grid, directory)
+                build += time.perf_counter() - start
+                start = time.perf_counter()
+                RouteTable.for_stage(stage_file, grid, directory)
+                load += time.perf_counter() - start
+                kib += (table.distance.nbytes + table.next_hop.nbytes) / 1024
+
+                random.seed(0)
+                episode_steps, reset, seconds = play(rows, Pather())
+                bfs += reset + seconds
+                random.seed(0)
+                pather = RoutePather(table)
+                _, reset, seconds = play(rows, pather)
+                routes += reset + seconds
+                steps += episode_steps
+                fallbacks += pather.fallbacks
+
+        print(
+            f"{size:>4}x{size} {build / CORPUS_SIZE * 1e3:>9.1f} "
+            f"{load / CORPUS_SIZE * 1e3:>8.2f} {kib / CORPUS_SIZE:>10.1f} "
+            f"{bfs / max(steps, 1) * 1e6:>12.1f} "
+            f"{routes / max(steps, 1) * 1e6:>14.1f} {bfs / routes:>8.2f} "
+            f"{fallbacks / max(steps, 1):>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Staged fitness against full evaluation on evolved populations: the share
+settled by each stage and the time per individual, for thresholds at
+several quantiles of the population's exact fitnesses. Staging is forced
+on for every map size (min_tiles=0) so the small maps show why it is off
+there by default.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.staged_fitness [generations] [map sizes...]
+"""
+
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.staged import STAGES, StagedFitness
+
+REPEATS = 5
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+def evolved_population(size: int, generations: int):
+    """Population and censuses after `generations` of a seeded GA"""
+    generator = Generator(
+        width=size, height=size, generations=generations, fitness_cache_size=0
+    )
+    generator.rng.seed(0)
+    population = generator.initialize_population()
+    censuses = [generator.census_of(dungeon) for dungeon in population]
+    for _ in range(generations):
+        fitnesses = generator.evaluate_population(population)
+        population, censuses, _ = generator.next_generation(
+            population, censuses, fitnesses
+        )
+    return generator, population, censuses
+
+
+def time_per_individual(evaluate, count: int) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        evaluate()
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def main():
+    generations = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    sizes = [int(arg) for arg in sys.argv[2:]] or [9, 16, 32]
+
+    stages = " ".join(f"{stage:>12}" for stage in STAGES)
+    print(f"{'map':>6} {'threshold':>10} {'us/ind':>8} {'speedup':>8} {stages}")
+    for size in sizes:
+        generator, population, censuses = evolved_population(size, generations)
+        full = time_per_individual(
+            lambda: [generator.compute_fitness(d) for d in population],
+            len(population),
+        )
+        print(f"{size:>4}x{size} {'full':>10} {full * 1e6:>8.1f} {1.0:>8.2f}")
+
+        exact = sorted(generator.compute_fitness(d) for d in population)
+        for quantile in QUANTILES:
+            staged = StagedFitness(quantile, min_tiles=0)
+            staged.update_threshold(exact)
+            seconds = time_per_individual(
+                lambda: staged.evaluate_many(generator, population, censuses),
+                len(population),
+            )
+            rates = staged.take()
+            settled = " ".join(f"{rates[stage]:>12.1%}" for stage in STAGES)
+            print(
+                f"{size:>4}x{size} {f'q={quantile}':>10} {seconds * 1e6:>8.1f} "
+                f"{full / seconds:>8.2f} {settled}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Generator benchmark suite at three levels, for both backends:
+
+- component: every fitness helper and GA operator on a seeded corpus
+- generation: time per generation across population and map sizes
+- end_to_end: a whole default generate_dungeon run
+
+Results are written as JSON (seconds per call / per generation / per run),
+by default to benchmarks/results.json, and compared against a baseline
+recorded on the same machine with --save-baseline (benchmarks/baseline.json
+by default; both files stay out of version control). Timings slower than
+the baseline by more than the threshold are reported and make the run exit
+with 1. A baseline from another host is printed for reference but never
+counts as a regression. The default threshold sits above the 1.3-1.8x
+run-to-run noise measured on a shared single-core host.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.suite [--levels component generation end_to_end]
+        [--output benchmarks/results.json] [--baseline benchmarks/baseline.json]
+        [--threshold 2.0] [--save-baseline]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from os import path
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.pcg.bitboard_generator import BitboardGenerator
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+
+BACKENDS = {"list": Generator, "numpy": NumpyGenerator, "bitboard": BitboardGenerator}
+LEVELS = ("component", "generation", "end_to_end")
+DEFAULT_OUTPUT = path.join(path.dirname(__file__), "results.json")
+DEFAULT_BASELINE = path.join(path.dirname(__file__), "baseline.json")
+
+REPEATS = 7
+CORPUS_SIZE = 100
+COMPONENT_MAP_SIZES = (9, 16, 32)
+GENERATION_POPULATIONS = (50, 150, 300)
+GENERATION_MAP_SIZES = (9, 16, 32)
+GENERATIONS_TIMED = 5
+
+
+def best_time(run, prepare=None) -> float:
+    """Fastest of REPEATS runs; prepare() output is passed to run, untimed"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        argument = prepare() if prepare is not None else None
+        start = time.perf_counter()
+        run(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def component_benchmarks(backend: str, results: dict) -> None:
+    for size in COMPONENT_MAP_SIZES:
+        generator = BACKENDS[backend](
+            width=size, height=size, population_size=CORPUS_SIZE, seed=0
+        )
+        corpus = generator.initialize_population()
+        # Initial dungeons can lack a start or exit until their first repair
+        for dungeon in corpus:
+            generator.repair_dungeon(dungeon)
+        ends = [
+            (
+                generator.find_tile(dungeon, generator.START),
+                generator.find_tile(dungeon, generator.EXIT),
+            )
+            for dungeon in corpus
+        ]
+        pairs = list(zip(corpus, corpus[1:] + corpus[:1]))
+
+        def copies():
+            return [generator.from_rows(generator.to_rows(d)) for d in corpus]
+
+        cases = {
+            "calculate_path_length": lambda _: [
+                generator.calculate_path_length(d, s, e)
+                for d, (s, e) in zip(corpus, ends)
+            ],
+            "count_reachable_tiles": lambda _: [
+                generator.count_reachable_tiles(d, s) for d, (s, _) in zip(corpus, ends)
+            ],
+            "get_path_tiles": lambda _: [
+                generator.get_path_tiles(d, s, e) for d, (s, e) in zip(corpus, ends)
+            ],
+            "count_dead_ends": lambda _: [generator.count_dead_ends(d) for d in corpus],
+            "compute_fitness": lambda _: [generator.compute_fitness(d) for d in corpus],
+            "crossover": lambda _: [generator.crossover(a, b) for a, b in pairs],
+        }
+        for name, run in cases.items():
+            generator.rng.seed(0)
+            seconds = best_time(run)
+            results[f"component/{backend}/{size}x{size}/{name}"] = {
+                "seconds": seconds / CORPUS_SIZE
+            }
+
+        # Operators that change their input work on fresh copies
+        for name, operator in (
+            ("mutate", generator.mutate),
+            ("repair_dungeon", generator.repair_dungeon),
+        ):
+            generator.rng.seed(0)
+            seconds = best_time(lambda dungeons: list(map(operator, dungeons)), copies)
+            results[f"component/{backend}/{size}x{size}/{name}"] = {
+                "seconds": seconds / CORPUS_SIZE
+            }
+
+
+def generation_benchmarks(backend: str, results: dict) -> None:
+    for population_size in GENERATION_POPULATIONS:
+        for size in GENERATION_MAP_SIZES:
+            generator = BACKENDS[backend](
+                width=size,
+                height=size,
+                population_size=population_size,
+                generations=GENERATIONS_TIMED,
+                fitness_cache_size=0,
+                seed=0,
+            )
+
+            def run(_):
+                generator.rng.seed(0)
+                for _ in generator.evolve():
+                    pass
+
+            results[f"generation/{backend}/p{population_size}/{size}x{size}"] = {
+                "seconds": best_time(run) / GENERATIONS_TIMED
+            }
+
+
+def end_to_end_benchmarks(backend: str, results: dict) -> None:
+    generator = BACKENDS[backend]()
+    start = time.perf_counter()
+    dungeon = generator.generate_dungeon(seed=0, save=False, verbose=False)
+    results[f"end_to_end/{backend}/generate_dungeon"] = {
+        "seconds": time.perf_counter() - start,
+        "fitness": generator.compute_fitness(dungeon),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float, gate: bool = True) -> list:
+    """
+    Print every timing against the baseline, return the regressed names
+    (none unless `gate`)
+    """
+    regressions = []
+    print(f"{'benchmark':<52} {'seconds':>12} {'baseline':>12} {'ratio':>7}")
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<52} {result['seconds']:>12.6f} {'-':>12} {'-':>7}")
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  slower"
+            if gate:
+                regressions.append(name)
+                flag = "  REGRESSION"
+        print(
+            f"{name:<52} {result['seconds']:>12.6f} "
+            f"{reference['seconds']:>12.6f} {ratio:>7.2f}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--levels", nargs="+", choices=LEVELS, default=LEVELS)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=2.0)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as baseline"
+    )
+    args = parser.parse_args()
+
+    results: dict = {}
+    for level in args.levels:
+        for backend in args.backends:
+            print(f"running {level} benchmarks ({backend})...", file=sys.stderr)
+            globals()[f"{level}_benchmarks"](backend, results)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "host": platform.node(),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    baseline = {}
+    same_host = False
+    if not path.exists(args.baseline):
+        print(
+            f"No baseline at {args.baseline}: nothing is gated. "
+            "Run with --save-baseline to record one on this machine."
+        )
+    else:
+        with open(args.baseline, "r") as f:
+            stored = json.load(f)
+        baseline = stored["results"]
+        same_host = all(
+            stored.get(key) == report[key] for key in ("host", "machine", "python")
+        )
+        if not same_host:
+            print(
+                f"Baseline was recorded on {stored.get('host', 'another host')} "
+                f"(Python {stored.get('python')}), not here: ratios are for "
+                "reference only. Run with --save-baseline to gate on this machine."
+            )
+    regressions = compare(results, baseline, args.threshold, gate=same_host)
+    if regressions:
+        print(f"{len(regressions)} regressions over {args.threshold:.2f}x baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
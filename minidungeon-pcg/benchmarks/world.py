@@ -0,0 +1,68 @@
+"""
+Chunked world generation against the monolithic GA at the same map size.
+
+Both runs use the same population size and number of generations; the
+chunked run spends them on every chunk, spread over the worker processes.
+Reports wall-clock time, whether the exit is reachable, the path length
+and the share of floor reachable from the start.
+
+Usage (from minidungeon-pcg/):
+    python -m benchmarks.world [workers] [chunk_size] [world sizes...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.world import generate_world
+
+POPULATION_SIZE = 40
+GENERATIONS = 30
+
+
+def describe(label: str, wall_time: float, path_length, reachable: float) -> None:
+    path = "none" if path_length is None else str(path_length)
+    print(f"{label:>14} {wall_time:>9.2f}s {path:>6} {reachable:>9.1%}")
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    sizes = [int(arg) for arg in sys.argv[3:]] or [32, 64, 128]
+
+    print(f"population {POPULATION_SIZE}, {GENERATIONS} generations")
+    print(f"{'run':>14} {'wall':>10} {'path':>6} {'reachable':>9}")
+    for size in sizes:
+        print(f"{size}x{size}")
+        generator = Generator(
+            width=size,
+            height=size,
+            population_size=POPULATION_SIZE,
+            generations=GENERATIONS,
+        )
+
+        start = time.perf_counter()
+        dungeon = generator.generate_dungeon(seed=0, save=False, verbose=False)
+        wall_time = time.perf_counter() - start
+        analysis = generator.analyze_dungeon(dungeon)
+        describe(
+            "monolithic",
+            wall_time,
+            analysis.path_length if analysis.path_exists else None,
+            analysis.reachable_count / max(1, analysis.floor_count),
+        )
+
+        report = generate_world(generator, chunk_size, workers, seed=0)
+        describe(
+            f"{report.chunk_rows}x{report.chunk_cols} chunks",
+            report.wall_time,
+            report.path_length if report.path_exists else None,
+            report.reachable_ratio,
+        )
+
+
+if __name__ == "__main__":
+    main()
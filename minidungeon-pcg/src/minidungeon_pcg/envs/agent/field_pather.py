@@ -0,0 +1,293 @@
+import heapq
+from array import array
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+from .pather import FlatLayout, Pather, Position
+
+UNREACHABLE = 1 << 30
+
+
+class DistanceField:
+    """
+    Reverse multi-source BFS distances over a FlatLayout: `distance[cell]`
+    is the number of moves from `cell` to the nearest target, moving only
+    into passable cells. Like a search from `cell`, the cell itself may be
+    impassable; it then has a distance but passes none on.
+    """
+
+    def __init__(
+        self,
+        layout: FlatLayout,
+        passable: bytearray,
+        tiles: List[str],
+        targets: FrozenSet[str],
+    ) -> None:
+        self.layout = layout
+        self.passable = passable
+        self.targets = targets
+        self.sources = bytearray(layout.size)
+        self.distance = array("l", [UNREACHABLE]) * layout.size
+        seeds = []
+        joined = "".join(tiles)
+        for target in targets:
+            cell = joined.find(target)
+            while cell >= 0:
+                if passable[cell]:
+                    seeds.append(cell)
+                cell = joined.find(target, cell + 1)
+        seeds.sort()
+        for cell in seeds:
+            self.sources[cell] = 1
+            self.distance[cell] = 0
+        self._spread(seeds)
+
+    def _spread(self, queue: List[int]) -> None:
+        """BFS outwards from cells of equal distance"""
+        distance, passable = self.distance, self.passable
+        neighbours = self.layout.neighbours
+        head = 0
+        while head < len(queue):
+            cell = queue[head]
+            head += 1
+            if not passable[cell]:
+                continue
+            next_distance = distance[cell] + 1
+            for neighbour in neighbours[cell]:
+                if next_distance < distance[neighbour]:
+                    distance[neighbour] = next_distance
+                    queue.append(neighbour)
+
+    def _relax(self, heap: List[Tuple[int, int]]) -> None:
+        """Lower distances outwards from seeds of any distance"""
+        distance, passable = self.distance, self.passable
+        neighbours = self.layout.neighbours
+        heapq.heapify(heap)
+        while heap:
+            cell_distance, cell = heapq.heappop(heap)
+            if cell_distance != distance[cell] or not passable[cell]:
+                continue
+            for neighbour in neighbours[cell]:
+                if cell_distance + 1 < distance[neighbour]:
+                    distance[neighbour] = cell_distance + 1
+                    heapq.heappush(heap, (cell_distance + 1, neighbour))
+
+    def feeds(self, cell: int, neighbour: int) -> bool:
+        """Whether `neighbour` lies on a shortest route out of `cell`"""
+        return (
+            self.passable[neighbour]
+            and self.distance[neighbour] != UNREACHABLE
+            and self.distance[neighbour] == self.distance[cell] - 1
+        )
+
+    def repair(self, cell: int, tile: str, passable: bool) -> None:
+        """
+        Update the field after `cell` changed to `tile`, with its new
+        passability already written to the shared bytearray (`passable`
+        is its old value). Only cells whose distance changes are touched.
+        """
+        was_source = self.sources[cell]
+        is_source = 1 if tile in self.targets and self.passable[cell] else 0
+        self.sources[cell] = is_source
+        lost_passability = passable and not self.passable[cell]
+        distance, neighbours = self.distance, self.layout.neighbours
+
+        # Cells that may have lost their shortest route, in BFS layers
+        seeds: List[int] = []
+        if was_source and not is_source:
+            seeds.append(cell)
+        elif lost_passability:
+            seeds.extend(
+                neighbour
+                for neighbour in neighbours[cell]
+                if distance[neighbour] == distance[cell] + 1
+            )
+        orphans: Set[int] = set()
+        queue = seeds
+        head = 0
+        while head < len(queue):
+            orphan = queue[head]
+            head += 1
+            if orphan in orphans or self.sources[orphan]:
+                continue
+            if orphan != cell and any(
+                self.feeds(orphan, neighbour) and neighbour not in orphans
+                for neighbour in neighbours[orphan]
+            ):
+                continue
+            orphans.add(orphan)
+            if self.passable[orphan] or orphan == cell:
+                queue.extend(
+                    neighbour
+                    for neighbour in neighbours[orphan]
+                    if distance[neighbour] == distance[orphan] + 1
+                )
+
+        for orphan in orphans:
+            distance[orphan] = UNREACHABLE
+        heap: List[Tuple[int, int]] = []
+        for orphan in orphans:
+            best = min(
+                (
+                    distance[neighbour] + 1
+                    for neighbour in neighbours[orphan]
+                    if self.passable[neighbour] and distance[neighbour] < UNREACHABLE
+                ),
+                default=UNREACHABLE,
+            )
+            distance[orphan] = best
+            if best < UNREACHABLE:
+                heap.append((best, orphan))
+        if is_source:
+            distance[cell] = 0
+        if is_source or (self.passable[cell] and not passable):
+            heap.append((distance[cell], cell))
+        self._relax(heap)
+
+
+class FieldPather(Pather):
+    """
+    Pather whose `distance_to_nearest` and `next_action` read distance
+    fields (Dijkstra maps) instead of searching from the agent: one
+    reverse BFS field per target set and avoid flag, built on first use
+    and repaired locally when `mark_grid_changed` names the written tile,
+    so a query costs an array lookup and a move one gradient step.
+
+    Distances match Pather. Moves follow a shortest path too, but among
+    equally short ones the gradient takes the first of up, down, left,
+    right instead of heading for the row-major first target. Queries from
+    a target tile itself, and `shortest_path`, still search.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._fields: Dict[Tuple[FrozenSet[str], bool], DistanceField] = {}
+        self._field_grid: Optional[Sequence[Sequence[str]]] = None
+        self._field_version = -1
+        self._field_layout: Optional[FlatLayout] = None
+        self._field_passable: Dict[bool, bytearray] = {}
+        self._field_tiles: List[str] = []
+        self.field_builds = 0
+
+    def mark_grid_changed(self, cell: Optional[Position] = None) -> None:
+        super().mark_grid_changed(cell)
+        if cell is None or self._field_grid is None:
+            self._field_grid = None
+            return
+        self._repair(cell)
+        self._field_version = self.grid_version
+
+    def _compile(self, grid: Sequence[Sequence[str]]) -> FlatLayout:
+        """Tiles and passability of a new grid; drops every field"""
+        size = self._grid_size(grid)
+        layout = self._layouts.get(size)
+        if layout is None:
+            layout = self._layouts[size] = FlatLayout(*size)
+        self._field_layout = layout
+        self._field_grid = grid
+        self._field_version = self.grid_version
+        self._field_passable = {
+            avoid: layout.passability(grid, avoid) for avoid in (False, True)
+        }
+        self._field_tiles = [" "] * layout.size
+        for y, row in enumerate(grid):
+            self._field_tiles[y * layout.width : y * layout.width + len(row)] = row
+        self._fields.clear()
+        return layout
+
+    def field(
+        self, grid: Sequence[Sequence[str]], target_chars: Set[str], avoid: bool
+    ) -> DistanceField:
+        """Distance field of `target_chars` over the current grid version"""
+        if grid is not self._field_grid or self._field_version != self.grid_version:
+            self._compile(grid)
+        key = (frozenset(target_chars), avoid)
+        field = self._fields.get(key)
+        if field is None:
+            self.field_builds += 1
+            field = self._fields[key] = DistanceField(
+                self._field_layout,
+                self._field_passable[avoid],
+                self._field_tiles,
+                key[0],
+            )
+        return field
+
+    def _repair(self, position: Position) -> None:
+        layout = self._field_layout
+        x, y = position
+        if not (0 <= x < layout.width and 0 <= y < layout.height):
+            return
+        row = self._field_grid[y]
+        tile = row[x] if x < len(row) else " "
+        cell = y * layout.width + x
+        if self._field_tiles[cell] == tile:
+            return
+        self._field_tiles[cell] = tile
+        was_passable = {}
+        for avoid, passable in self._field_passable.items():
+            was_passable[avoid] = bool(passable[cell])
+            passable[cell] = tile != "#" and not (avoid and tile == "M")
+        for (_, avoid), field in self._fields.items():
+            field.repair(cell, tile, was_passable[avoid])
+
+    def _lookup(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        target_chars: Set[str],
+        avoid_monsters: bool,
+    ) -> Optional[Tuple[DistanceField, int]]:
+        """The field and start cell, or None where the field cannot answer"""
+        if not grid:
+            return None
+        field = self.field(grid, target_chars, avoid_monsters)
+        x, y = start
+        layout = field.layout
+        if not (0 <= x < layout.width and 0 <= y < layout.height):
+            return None
+        cell = y * layout.width + x
+        # The nearest target must not be the start itself
+        if field.sources[cell]:
+            return None
+        return field, cell
+
+    def distance_to_nearest(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        target_chars: Set[str],
+        avoid_monsters: bool = False,
+    ) -> int:
+        found = self._lookup(grid, start, target_chars, avoid_monsters)
+        if found is None:
+            return super().distance_to_nearest(
+                grid, start, target_chars, avoid_monsters
+            )
+        field, cell = found
+        distance = field.distance[cell]
+        return 1000 if distance == UNREACHABLE else distance
+
+    def next_action(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        target_chars: Set[str],
+        avoid_monsters: bool = False,
+    ) -> int:
+        found = self._lookup(grid, start, target_chars, avoid_monsters)
+        if found is None:
+            return super().next_action(grid, start, target_chars, avoid_monsters)
+        field, cell = found
+        if field.distance[cell] == UNREACHABLE:
+            return 0
+        width = field.layout.width
+        for action, neighbour in (
+            (1, cell - width),
+            (2, cell + width),
+            (3, cell - 1),
+            (4, cell + 1),
+        ):
+            if neighbour in field.layout.neighbours[cell] and field.feeds(
+                cell, neighbour
+            ):
+                return action
+        return 0
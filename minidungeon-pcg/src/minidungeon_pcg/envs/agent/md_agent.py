@@ -1,3 +1,4 @@
+from typing import Optional
 import numpy as np
 import random
 from .pather import Pather
@@ -5,12 +6,17 @@ from minidungeon_pcg.envs.settings import Settings
 
 
 class MdAgent:
-    def __init__(self, debug: bool = False) -> None:
+    def __init__(
+        self, debug: bool = False, rng: Optional[random.Random] = None
+    ) -> None:
         """Agent helper that implements environment actions and movement logic.
 
         A `Pather` instance is attached as `self.pather` to provide BFS-based
-        pathfinding helpers for higher-level action decisions.
+        pathfinding helpers for higher-level action decisions. Ties between
+        equally ranked actions are broken with `rng`, by default the shared
+        generator of the `random` module.
         """
+        self.rng = rng
         self.max_hp = Settings.AGENT_MAX_HEALTH
         self.hp = self.max_hp
         self.position = None
@@ -66,10 +72,11 @@ class MdAgent:
             groups.setdefault(v, []).append(i)
 
         unique_vals = sorted(groups.keys(), reverse=True)
+        shuffle = random.shuffle if self.rng is None else self.rng.shuffle
         candidate_indices = []
         for v in unique_vals:
             inds = groups[v].copy()
-            random.shuffle(inds)
+            shuffle(inds)
             candidate_indices.extend(inds)
 
         start = self.position if self.position is not None else (0, 0)
@@ -126,6 +133,7 @@ class MdAgent:
                         self.hp -= Settings.MONSTER_DAMAGE
                         self.position = (next_x, next_y)
                         grid[next_y][next_x] = "."
+                        self.pather.mark_grid_changed((next_x, next_y))
                         if self.hp <= 0:
                             # player died — do not award kill reward
                             terminated = True
@@ -137,6 +145,7 @@ class MdAgent:
                         if target == "T":
                             reward += 1.0
                             grid[next_y][next_x] = "."
+                            self.pather.mark_grid_changed((next_x, next_y))
                         if target == "P":
                             # restore some HP (to a maximum) and reward the pickup
                             new_hp = min(
@@ -147,6 +156,7 @@ class MdAgent:
                             if healed_amount > 0:
                                 reward += 2.0
                             grid[next_y][next_x] = "."
+                            self.pather.mark_grid_changed((next_x, next_y))
                         if target == "E":
                             reward += 10.0
                             terminated = True
@@ -159,6 +169,7 @@ class MdAgent:
                 if grid[current_y][current_xcx] == "T":
                     reward += 1.0
                     grid[current_y][current_x] = "."
+                    self.pather.mark_grid_changed((current_x, current_y))
                 elif grid[current_y][current_x] == "P":
                     # pick up potion on current tile
                     new_hp = min(self.max_hp, self.hp + Settings.POTION_HEAL_AMOUNT)
@@ -167,6 +178,7 @@ class MdAgent:
                     if healed_amount > 0:
                         reward += 2.0
                     grid[current_y][current_x] = "."
+                    self.pather.mark_grid_changed((current_x, current_y))
 
         # clamp reward to reasonable bounds and optionally log for debugging
         reward = float(reward)
@@ -1,11 +1,15 @@
+from typing import Optional
 import numpy as np
+import random
 from minidungeon_pcg.envs.agent.md_agent import MdAgent
 from minidungeon_pcg.envs.settings import Settings
 
 
 class MdTreasureAgent(MdAgent):
-    def __init__(self, debug: bool = False) -> None:
-        super().__init__(debug)
+    def __init__(
+        self, debug: bool = False, rng: Optional[random.Random] = None
+    ) -> None:
+        super().__init__(debug, rng)
         self.standard_vector = np.array(
             [0.0, 0.9, 1.0, 0.0, 0.7, 0.6, 0.8], dtype=np.float32
         )
@@ -1,10 +1,102 @@
-from collections import deque
-from typing import List, Optional, Sequence, Set, Tuple
+from array import array
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 
 Position = Tuple[int, int]
 
 
+def _blocking(tiles: bytes) -> bytes:
+    """bytes.translate table: 0 for the given tiles, 1 for every other"""
+    return bytes(0 if code in tiles else 1 for code in range(256))
+
+
+_BLOCKING = _blocking(b"#")
+_BLOCKING_MONSTERS = _blocking(b"#M")
+
+
+class FlatLayout:
+    """Flat cell index of one grid shape, compiled once and reused.
+
+    Cell `y * width + x` stands for tile (x, y). Each cell has its in-bounds
+    neighbours precomputed in BFS order (up, down, left, right), and the
+    BFS work arrays are allocated once: a cell counts as visited when its
+    stamp equals the current search generation, so nothing is cleared
+    between searches.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.neighbours: List[Tuple[int, ...]] = []
+        for y in range(height):
+            for x in range(width):
+                self.neighbours.append(
+                    tuple(
+                        (y + dy) * width + x + dx
+                        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0))
+                        if 0 <= x + dx < width and 0 <= y + dy < height
+                    )
+                )
+        self.stamp = array("L", [0]) * self.size
+        self.distance = array("l", [0]) * self.size
+        self.previous = array("l", [0]) * self.size
+        self.queue = array("l", [0]) * self.size
+        self.generation = 0
+
+    def passability(
+        self, grid: Sequence[Sequence[str]], avoid_monsters: bool
+    ) -> bytearray:
+        """1 for every cell a BFS may enter; tiles past a short row read as " " """
+        table = _BLOCKING_MONSTERS if avoid_monsters else _BLOCKING
+        passable = bytearray()
+        for row in grid:
+            line = "".join(row).encode("latin-1", "replace").translate(table)
+            passable += line + b"\x01" * (self.width - len(line))
+        return passable
+
+
+class SearchTree:
+    """One BFS result over a FlatLayout, detached from its work arrays"""
+
+    def __init__(self, layout: FlatLayout, start: int, reached: int) -> None:
+        self.width = layout.width
+        self.start = start
+        # Cells in BFS order, so in nondecreasing distance
+        self.order = layout.queue[:reached]
+        self.distance = layout.distance[:]
+        self.previous = layout.previous[:]
+
+    def nearest(
+        self, grid: Sequence[Sequence[str]], target_chars: Set[str]
+    ) -> Optional[int]:
+        """Nearest reached cell (not the start) holding a target, ties row-major"""
+        width, distance = self.width, self.distance
+        best: Optional[int] = None
+        for cell in self.order:
+            if best is not None and distance[cell] > distance[best]:
+                break
+            y, x = divmod(cell, width)
+            row = grid[y]
+            if cell != self.start and x < len(row) and row[x] in target_chars:
+                if best is None or cell < best:
+                    best = cell
+        return best
+
+    def path(self, cell: int) -> List[Position]:
+        """Positions from the start to `cell`, both included"""
+        width, previous = self.width, self.previous
+        path: List[Position] = []
+        while True:
+            y, x = divmod(cell, width)
+            path.append((x, y))
+            if cell == self.start:
+                break
+            cell = previous[cell]
+        path.reverse()
+        return path
+
+
 class Pather:
     """Pathfinding helper for grid-based stages.
 
@@ -19,16 +111,109 @@ class Pather:
     Action mapping returned by `next_action` follows the agent's discrete
     convention used in this project: 1 up, 2 down, 3 left, 4 right. If no
     movement is possible or no path exists the method returns 0 (noop).
+
+    Queries share BFS trees: `shortest_path`, `next_action` and
+    `distance_to_nearest` build at most one tree per start position and
+    avoid flag for each grid version, so a whole env step needs two BFS
+    runs. Whoever writes into a grid must call `mark_grid_changed`.
+
+    Searches run over a FlatLayout compiled once per grid shape, with
+    passability bytearrays built once per grid version.
     """
 
     def __init__(self) -> None:
-        pass
+        self.grid_version = 0
+        self.bfs_runs = 0
+        self._trees: Dict[Tuple[int, int, Position, bool], SearchTree] = {}
+        self._tree_start: Optional[Position] = None
+        self._layouts: Dict[Tuple[int, int], FlatLayout] = {}
+        # Layout and passable cells per (grid, version, avoid flag)
+        self._passability: Dict[tuple, Tuple[FlatLayout, bytearray]] = {}
+
+    def mark_grid_changed(self, cell: Optional[Position] = None) -> None:
+        """Drop the cached BFS trees after a tile of the grid was written.
+        `cell` is the written tile, if known, for subclasses that repair
+        their caches locally.
+        """
+        self.grid_version += 1
+        self._trees.clear()
+        self._passability.clear()
+
+    def tree(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        avoid_monsters: bool = False,
+    ) -> Optional[SearchTree]:
+        """BFS tree of the current grid version, computed once per start and flag.
+        None for an empty grid or a start outside it.
+        """
+        # Trees of the previous position are not asked for again
+        if start != self._tree_start:
+            self._trees.clear()
+            self._tree_start = start
+        key = (id(grid), self.grid_version, start, avoid_monsters)
+        if key not in self._trees:
+            self._trees[key] = self.search(grid, start, avoid_monsters)
+        return self._trees[key]
 
     def _grid_size(self, grid: Sequence[Sequence[str]]) -> Tuple[int, int]:
         height = len(grid)
         width = 0 if height == 0 else max(len(row) for row in grid)
         return width, height
 
+    def search(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        avoid_monsters: bool = False,
+    ) -> Optional[SearchTree]:
+        """Run the flat-array BFS from `start`, uncached"""
+        self.bfs_runs += 1
+        passability_key = (id(grid), self.grid_version, avoid_monsters)
+        compiled = self._passability.get(passability_key)
+        if compiled is None:
+            size = self._grid_size(grid)
+            layout = self._layouts.get(size)
+            if layout is None:
+                layout = self._layouts[size] = FlatLayout(*size)
+            compiled = layout, layout.passability(grid, avoid_monsters)
+            self._passability[passability_key] = compiled
+        layout, passable = compiled
+
+        start_x, start_y = start
+        if not (0 <= start_x < layout.width and 0 <= start_y < layout.height):
+            return None
+
+        layout.generation += 1
+        generation = layout.generation
+        stamp, distance, previous, queue = (
+            layout.stamp,
+            layout.distance,
+            layout.previous,
+            layout.queue,
+        )
+        neighbours = layout.neighbours
+
+        origin = start_y * layout.width + start_x
+        stamp[origin] = generation
+        distance[origin] = 0
+        queue[0] = origin
+        head, tail = 0, 1
+        while head < tail:
+            cell = queue[head]
+            head += 1
+            next_distance = distance[cell] + 1
+            for neighbour in neighbours[cell]:
+                if stamp[neighbour] != generation and passable[neighbour]:
+                    stamp[neighbour] = generation
+                    distance[neighbour] = next_distance
+                    previous[neighbour] = cell
+                    queue[tail] = neighbour
+                    tail += 1
+
+        return SearchTree(layout, origin, tail)
+
     def bfs(
         self,
         grid: Sequence[Sequence[str]],
@@ -40,35 +225,19 @@ class Pather:
         - distances: dict[(x,y)] -> distance
         - prev: dict[(x,y)] -> previous (x,y) on path from start
         """
-        width, height = self._grid_size(grid)
-        start_x, start_y = start
-        if width == 0 or height == 0:
+        tree = self.search(grid, start, avoid_monsters=avoid_monsters)
+        if tree is None:
             return {}, {}
 
+        width = tree.width
         distances = {}
         prev = {}
-        queue = deque()
-        queue.append((start_x, start_y))
-        distances[(start_x, start_y)] = 0
-
-        while queue:
-            x, y = queue.popleft()
-            distance = distances[(x, y)]
-            for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-                next_x, next_y = x + dx, y + dy
-                if not (0 <= next_x < width and 0 <= next_y < height):
-                    continue
-                if (next_x, next_y) in distances:
-                    continue
-                tile_char = grid[next_y][next_x] if next_x < len(grid[next_y]) else " "
-                if tile_char == "#":
-                    continue
-                if avoid_monsters and tile_char == "M":
-                    continue
-                distances[(next_x, next_y)] = distance + 1
-                prev[(next_x, next_y)] = (x, y)
-                queue.append((next_x, next_y))
-
+        for cell in tree.order:
+            y, x = divmod(cell, width)
+            distances[(x, y)] = tree.distance[cell]
+            if cell != tree.start:
+                py, px = divmod(tree.previous[cell], width)
+                prev[(x, y)] = (px, py)
         return distances, prev
 
     def shortest_path(
@@ -81,42 +250,13 @@ class Pather:
         """Return shortest path (including start and goal) to the nearest tile
         whose character is in `target_chars`. If none found, returns empty list.
         """
-        distances, prev = self.bfs(grid, start, avoid_monsters=avoid_monsters)
-        if not distances:
+        tree = self.tree(grid, start, avoid_monsters=avoid_monsters)
+        if tree is None:
             return []
-
-        # find nearest target cell
-        target_pos: Optional[Position] = None
-        best_d = None
-        h = len(grid)
-        for y in range(h):
-            row = grid[y]
-            for x in range(len(row)):
-                if (x, y) == start:
-                    continue
-                if row[x] in target_chars and (x, y) in distances:
-                    d = distances[(x, y)]
-                    if best_d is None or d < best_d:
-                        best_d = d
-                        target_pos = (x, y)
-
-        if target_pos is None:
+        target = tree.nearest(grid, target_chars)
+        if target is None:
             return []
-
-        # reconstruct path
-        path: List[Position] = []
-        cur = target_pos
-        while True:
-            path.append(cur)
-            if cur == start:
-                break
-            cur = prev.get(cur)
-            if cur is None:
-                # shouldn't happen if distances contains target
-                return []
-
-        path.reverse()
-        return path
+        return tree.path(target)
 
     def next_step(
         self,
@@ -170,20 +310,8 @@ class Pather:
         avoid_monsters: bool = False,
     ) -> int:
         """Return integer distance to nearest target (1000 if unreachable)."""
-        distances, _ = self.bfs(grid, start, avoid_monsters=avoid_monsters)
-        if not distances:
+        tree = self.tree(grid, start, avoid_monsters=avoid_monsters)
+        if tree is None:
             return 1000
-        best = None
-        h = len(grid)
-        for y in range(h):
-            row = grid[y]
-            for x in range(len(row)):
-                if (
-                    row[x] in target_chars
-                    and (x, y) in distances
-                    and not (x, y) == start
-                ):
-                    d = distances[(x, y)]
-                    if best is None or d < best:
-                        best = d
-        return 1000 if best is None else best
+        target = tree.nearest(grid, target_chars)
+        return 1000 if target is None else tree.distance[target]
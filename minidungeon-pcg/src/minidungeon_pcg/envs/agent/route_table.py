@@ -0,0 +1,280 @@
+from os import path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import hashlib
+import os
+import numpy as np
+from .pather import FlatLayout, Pather, Position
+
+DEFAULT_CACHE_DIR = path.join(
+    path.expanduser("~"), ".cache", "minidungeon-pcg", "routes"
+)
+
+# Bump whenever the table layout or the BFS order changes
+ROUTE_TABLE_VERSION = 1
+
+UNREACHABLE = 0xFFFF
+MAX_CELLS = UNREACHABLE - 1
+
+# Sentinel of `RoutePather._route` for "no target is reachable"
+_NO_ROUTE = (-1, -1)
+
+
+class RouteTable:
+    """
+    All-pairs shortest paths over the walls of one stage, which never
+    change during an episode. Open cells (anything but "#") are numbered
+    row-major; `distance[s, t]` is the number of moves from cell s to cell
+    t and `next_hop[s, t]` the first cell of the route, both uint16 with
+    UNREACHABLE for no route. Routes are the ones Pather's BFS picks, so
+    lookups reproduce its moves when monsters are not avoided.
+
+    Building costs one BFS per open cell; `for_stage` caches the tables
+    on disk under the hash of the stage file.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: np.ndarray,
+        distance: np.ndarray,
+        next_hop: np.ndarray,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.distance = distance
+        self.next_hop = next_hop
+        self.index = np.full(width * height, -1, dtype=np.int32)
+        self.index[cells] = np.arange(len(cells), dtype=np.int32)
+
+    @classmethod
+    def build(cls, grid: Sequence[Sequence[str]]) -> "RouteTable":
+        height = len(grid)
+        width = max((len(row) for row in grid), default=0)
+        passable = FlatLayout(width, height).passability(grid, False)
+        cells = np.flatnonzero(np.frombuffer(bytes(passable), dtype=np.uint8))
+        if len(cells) > MAX_CELLS:
+            raise ValueError(
+                f"stage has {len(cells)} open cells, route tables hold at most "
+                f"{MAX_CELLS}"
+            )
+        cells = cells.astype(np.int32)
+        index = np.full(width * height, -1, dtype=np.int32)
+        index[cells] = np.arange(len(cells), dtype=np.int32)
+
+        distance = np.full((len(cells), len(cells)), UNREACHABLE, dtype=np.uint16)
+        next_hop = np.full((len(cells), len(cells)), UNREACHABLE, dtype=np.uint16)
+        pather = Pather()
+        first = [0] * (width * height)
+        for source, cell in enumerate(cells.tolist()):
+            tree = pather.search(grid, divmod(cell, width)[::-1])
+            order = tree.order.tolist()
+            previous = tree.previous
+            # First step of the tree path to every reached cell, in BFS order
+            for reached in order[1:]:
+                parent = previous[reached]
+                first[reached] = reached if parent == cell else first[parent]
+            reached = np.array(order[1:], dtype=np.intp)
+            targets = index[reached]
+            distance[source, targets] = np.asarray(tree.distance)[reached]
+            next_hop[source, targets] = index[[first[hop] for hop in order[1:]]]
+            distance[source, source] = 0
+        return cls(width, height, cells, distance, next_hop)
+
+    @staticmethod
+    def key(stage_file: str) -> str:
+        digest = hashlib.sha256(f"routes-v{ROUTE_TABLE_VERSION}\n".encode())
+        with open(stage_file, "rb") as f:
+            digest.update(f.read())
+        return digest.hexdigest()
+
+    @classmethod
+    def for_stage(
+        cls,
+        stage_file: str,
+        grid: Sequence[Sequence[str]],
+        directory: str = DEFAULT_CACHE_DIR,
+    ) -> "RouteTable":
+        """Tables of a stage file, from the cache or built and cached"""
+        os.makedirs(directory, exist_ok=True)
+        table_file = path.join(directory, f"{cls.key(stage_file)}.npz")
+        try:
+            return cls.load(table_file)
+        except (OSError, ValueError, KeyError):
+            pass
+        table = cls.build(grid)
+        temp_file = f"{table_file}.{os.getpid()}.tmp.npz"
+        table.save(temp_file)
+        os.replace(temp_file, table_file)
+        return table
+
+    def save(self, table_file: str) -> None:
+        np.savez(
+            table_file,
+            shape=np.array([self.width, self.height]),
+            cells=self.cells,
+            distance=self.distance,
+            next_hop=self.next_hop,
+        )
+
+    @classmethod
+    def load(cls, table_file: str) -> "RouteTable":
+        with np.load(table_file) as data:
+            width, height = data["shape"].tolist()
+            return cls(width, height, data["cells"], data["distance"], data["next_hop"])
+
+    def open_mask(self) -> bytes:
+        """The passability bytes of the stage the table was built from"""
+        passable = np.zeros(self.width * self.height, dtype=np.uint8)
+        passable[self.cells] = 1
+        return passable.tobytes()
+
+
+class RoutePather(Pather):
+    """
+    Pather that answers `distance_to_nearest` and `next_action` from a
+    RouteTable: the nearest target is the closest of the current target
+    tiles by table distance (ties row-major, like Pather), and the move is
+    its next hop. Target tiles are indexed once per grid and kept up to
+    date by `mark_grid_changed(cell)`.
+
+    When monsters are avoided, the stored route to the nearest target is
+    walked; if a monster lies on it the query falls back to a search,
+    otherwise the distance is exact, but ties between equally short
+    routes can resolve differently from Pather. A grid whose walls differ
+    from the table's, or a start on a wall, also searches.
+    """
+
+    def __init__(self, table: RouteTable) -> None:
+        super().__init__()
+        self.table = table
+        self.fallbacks = 0
+        self._indexed_grid: Optional[Sequence[Sequence[str]]] = None
+        self._indexed_version = -1
+        self._matches = False
+        self._tiles: List[str] = []
+        self._targets: Dict[str, Set[int]] = {}
+        self._open_mask = table.open_mask()
+
+    def mark_grid_changed(self, cell: Optional[Position] = None) -> None:
+        super().mark_grid_changed(cell)
+        if cell is None or self._indexed_grid is None or not self._matches:
+            self._indexed_grid = None
+            return
+        x, y = cell
+        table = self.table
+        if 0 <= x < table.width and 0 <= y < table.height:
+            source = int(table.index[y * table.width + x])
+            row = self._indexed_grid[y]
+            tile = row[x] if x < len(row) else " "
+            if source < 0 or tile == "#":
+                # A wall moved, so the table no longer fits this grid
+                self._indexed_grid = None
+                return
+            if self._tiles[source] != tile:
+                self._targets[self._tiles[source]].discard(source)
+                self._targets.setdefault(tile, set()).add(source)
+                self._tiles[source] = tile
+        self._indexed_version = self.grid_version
+
+    def _index(self, grid: Sequence[Sequence[str]]) -> None:
+        table = self.table
+        self._indexed_grid = grid
+        self._indexed_version = self.grid_version
+        size = self._grid_size(grid)
+        layout = self._layouts.get(size)
+        if layout is None:
+            layout = self._layouts[size] = FlatLayout(*size)
+        self._matches = (
+            size == (table.width, table.height)
+            and layout.passability(grid, False) == self._open_mask
+        )
+        self._tiles = []
+        self._targets = {}
+        if not self._matches:
+            return
+        for source, cell in enumerate(table.cells.tolist()):
+            y, x = divmod(cell, table.width)
+            row = grid[y]
+            tile = row[x] if x < len(row) else " "
+            self._tiles.append(tile)
+            self._targets.setdefault(tile, set()).add(source)
+
+    def _route(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        target_chars: Set[str],
+        avoid_monsters: bool,
+    ) -> Optional[Tuple[int, int]]:
+        """(distance, next hop) to the nearest target, _NO_ROUTE if there is
+        none, or None where the table cannot answer
+        """
+        if grid is not self._indexed_grid or self._indexed_version != self.grid_version:
+            self._index(grid)
+        table = self.table
+        x, y = start
+        if not self._matches or not (0 <= x < table.width and 0 <= y < table.height):
+            return None
+        source = int(table.index[y * table.width + x])
+        if source < 0:
+            return None
+
+        candidates = [
+            target
+            for tile in target_chars
+            for target in self._targets.get(tile, ())
+            if target != source
+        ]
+        if not candidates:
+            return _NO_ROUTE
+        targets = np.array(candidates, dtype=np.intp)
+        distances = table.distance[source, targets]
+        best = distances.min()
+        if best == UNREACHABLE:
+            return _NO_ROUTE
+        target = int(targets[distances == best].min())
+
+        if avoid_monsters:
+            hop = source
+            while hop != target:
+                hop = int(table.next_hop[hop, target])
+                if self._tiles[hop] == "M":
+                    return None
+        return int(best), int(table.next_hop[source, target])
+
+    def distance_to_nearest(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        target_chars: Set[str],
+        avoid_monsters: bool = False,
+    ) -> int:
+        route = self._route(grid, start, target_chars, avoid_monsters)
+        if route is None:
+            self.fallbacks += 1
+            return super().distance_to_nearest(
+                grid, start, target_chars, avoid_monsters
+            )
+        distance, _ = route
+        return 1000 if route == _NO_ROUTE else distance
+
+    def next_action(
+        self,
+        grid: Sequence[Sequence[str]],
+        start: Position,
+        target_chars: Set[str],
+        avoid_monsters: bool = False,
+    ) -> int:
+        route = self._route(grid, start, target_chars, avoid_monsters)
+        if route is None:
+            self.fallbacks += 1
+            return super().next_action(grid, start, target_chars, avoid_monsters)
+        if route == _NO_ROUTE:
+            return 0
+        next_y, next_x = divmod(int(self.table.cells[route[1]]), self.table.width)
+        start_x, start_y = start
+        return {(0, -1): 1, (0, 1): 2, (-1, 0): 3, (1, 0): 4}.get(
+            (next_x - start_x, next_y - start_y), 0
+        )
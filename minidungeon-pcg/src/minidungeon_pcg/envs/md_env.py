@@ -1,7 +1,9 @@
 from typing import Any
 from pathlib import Path
 import gymnasium as gym
+from minidungeon_pcg.envs.agent.field_pather import FieldPather
 from minidungeon_pcg.envs.agent.md_treasure_agent import MdTreasureAgent
+from minidungeon_pcg.envs.agent.route_table import RoutePather, RouteTable
 from minidungeon_pcg.pcg.stage_renderer import StageRenderer
 import numpy as np
 import pygame
@@ -11,7 +13,16 @@ import random
 class MdEnv(gym.Env[np.ndarray, np.ndarray]):
     metadata = {"render_modes": ["human"], "render_fps": 10}
 
-    def __init__(self, stage_name: str, render_mode=None, debug: bool = False):
+    def __init__(
+        self,
+        stage_name: str,
+        render_mode=None,
+        debug: bool = False,
+        distance_fields: bool = False,
+        route_table: bool = False,
+    ):
+        if distance_fields and route_table:
+            raise ValueError("choose one of distance_fields and route_table")
         self.render_mode = render_mode
         self.debug = debug
 
@@ -20,6 +31,10 @@ class MdEnv(gym.Env[np.ndarray, np.ndarray]):
         self.clock = None
 
         self.agent = MdTreasureAgent(debug=self.debug)
+        if distance_fields:
+            # Observations and moves read per-target distance fields that are
+            # repaired when a tile changes, so a step no longer costs a BFS
+            self.agent.pather = FieldPather()
         self._closed = False
 
         self.stage_renderer = StageRenderer(stage_name, window_size=self.window_size)
@@ -30,6 +45,13 @@ class MdEnv(gym.Env[np.ndarray, np.ndarray]):
         # a deep copy to restore on reset.
         self._initial_grid = [list(r) for r in self.stage_renderer.grid]
 
+        if route_table:
+            # All-pairs routes over the static walls, built once per stage
+            # file and cached on disk, so most queries are table lookups
+            self.agent.pather = RoutePather(
+                RouteTable.for_stage(self.stage_renderer.stage_file, self._initial_grid)
+            )
+
         # actions: gym-md style - a length-7 float vector where the env picks
         # the highest-scoring high-level action (head-to-monster, head-to-treasure, ...)
         # We'll accept either a length-7 float vector or an integer discrete action.
@@ -62,6 +84,7 @@ class MdEnv(gym.Env[np.ndarray, np.ndarray]):
     def reset(self, *, seed: int | None = None, options: dict[str, Any] | None = None):
         # restore a fresh copy of the initial grid
         self.stage_renderer.grid = [list(r) for r in self._initial_grid]
+        self.agent.pather.mark_grid_changed()
 
         if self.stage_renderer.start_pos is not None:
             self.agent.position = self.stage_renderer.start_pos
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+Position = Tuple[int, int]
+
+
+@dataclass
+class DungeonAnalysis:
+    """
+    Everything `Generator.fitness_from_analysis` needs about one dungeon,
+    gathered by a single grid scan and a single BFS from the start.
+    """
+
+    start: Optional[Position]
+    exit: Optional[Position]
+    # Row-major positions of every entity tile type (not walls or floor)
+    positions: Dict[str, List[Position]]
+    wall_count: int
+    floor_count: int
+    dead_end_count: int
+    # BFS from start: distance and predecessor of every reachable tile
+    distances: Dict[Position, int] = field(default_factory=dict)
+    predecessors: Dict[Position, Position] = field(default_factory=dict)
+    # Shortest start -> exit path (inclusive), empty if the exit is unreachable
+    path_tiles: List[Position] = field(default_factory=list)
+
+    @property
+    def path_exists(self) -> bool:
+        return bool(self.path_tiles)
+
+    @property
+    def path_length(self) -> int:
+        return len(self.path_tiles) - 1 if self.path_tiles else 0
+
+    @property
+    def reachable_count(self) -> int:
+        return len(self.distances)
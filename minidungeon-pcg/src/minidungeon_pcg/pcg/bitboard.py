@@ -0,0 +1,197 @@
+"""
+Grids as Python ints: bit i * stride + j stands for tile (i, j), set in
+an open mask for every non-wall tile and in a tile mask for every tile of
+one type. The stride is width + 1, so each row ends in a guard bit that is
+never set and horizontal shifts cannot wrap into the next row.
+
+Flood fills expand a frontier mask by shifting it one tile in every
+direction, so each BFS layer costs a handful of big-int operations
+instead of a queue pop per tile. That suits maps up to a few hundred
+tiles; the cost of each operation grows with the map.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+
+
+class _Table(dict):
+    """str.translate table that maps every tile not listed to `default`"""
+
+    def __init__(self, mapping: Dict[int, str], default: str) -> None:
+        super().__init__(mapping)
+        self.default = default
+
+    def __missing__(self, key: int) -> str:
+        self[key] = self.default
+        return self.default
+
+
+_TABLES: Dict[Tuple[object, bool], _Table] = {}
+
+
+def stride_of(width: int) -> int:
+    return width + 1
+
+
+def bit(i: int, j: int, stride: int) -> int:
+    return 1 << (i * stride + j)
+
+
+def _table(tile, is_open: bool) -> _Table:
+    table = _TABLES.get((tile, is_open))
+    if table is None:
+        if is_open:
+            table = _Table({ord(tile): "0", 0: "0"}, "1")
+        else:
+            table = _Table({ord(tile): "1"}, "0")
+        _TABLES[tile, is_open] = table
+    return table
+
+
+def _text(grid: Sequence[Sequence]) -> str:
+    # Rows joined by a NUL guard, reversed so tile (0, 0) is the lowest bit
+    return "\0".join(["".join(row) for row in grid])[::-1]
+
+
+def _mask(grid: Sequence[Sequence], tile, is_open: bool) -> int:
+    if isinstance(grid, np.ndarray):
+        tiles = np.zeros((grid.shape[0], grid.shape[1] + 1), dtype=bool)
+        tiles[:, :-1] = (grid != tile) if is_open else (grid == tile)
+        return int.from_bytes(np.packbits(tiles, bitorder="little"), "little")
+    return int(_text(grid).translate(_table(tile, is_open)), 2)
+
+
+def open_mask(grid: Sequence[Sequence], wall) -> int:
+    """Bitboard of the non-wall tiles of a grid of characters or tile codes"""
+    return _mask(grid, wall, True)
+
+
+def tile_mask(grid: Sequence[Sequence], tile) -> int:
+    """Bitboard of the tiles of one type"""
+    return _mask(grid, tile, False)
+
+
+def masks(grid: Sequence[Sequence], wall, tiles: Sequence) -> Tuple[int, List[int]]:
+    """`open_mask` and a `tile_mask` per tile type, joining the rows once"""
+    if isinstance(grid, np.ndarray):
+        return open_mask(grid, wall), [tile_mask(grid, tile) for tile in tiles]
+    text = _text(grid)
+    return int(text.translate(_table(wall, True)), 2), [
+        int(text.translate(_table(tile, False)), 2) for tile in tiles
+    ]
+
+
+def positions(mask: int, stride: int) -> List[Tuple[int, int]]:
+    """Row-major (i, j) of every set bit"""
+    found = []
+    while mask:
+        low = mask & -mask
+        found.append(divmod(low.bit_length() - 1, stride))
+        mask ^= low
+    return found
+
+
+def neighbours(mask: int, stride: int) -> Tuple[int, int, int, int]:
+    """Masks of tiles whose right, left, lower and upper neighbour is in `mask`"""
+    return mask >> 1, mask << 1, mask >> stride, mask << stride
+
+
+def expand(frontier: int, stride: int) -> int:
+    """Tiles next to any tile of `frontier`"""
+    return frontier >> 1 | frontier << 1 | frontier >> stride | frontier << stride
+
+
+def flood(passable: int, seed: int, stride: int) -> int:
+    """
+    The seed tiles and every tile of `passable` connected to them, like a
+    BFS over non-wall tiles that starts from the seed whatever its tile
+    """
+    frontier = seed
+    unvisited = passable & ~seed
+    while frontier:
+        frontier = expand(frontier, stride) & unvisited
+        unvisited ^= frontier
+    return seed | (passable & ~unvisited)
+
+
+def flood_distance(
+    passable: int, seed: int, target: int, stride: int
+) -> Tuple[int, int]:
+    """
+    `flood` one BFS layer at a time, also returning the number of steps
+    from the seed to the target tile (-1 if it is not reached)
+    """
+    frontier = seed
+    unvisited = passable & ~seed
+    distance = 0 if seed & target else -1
+    steps = 0
+    while frontier:
+        frontier = expand(frontier, stride) & unvisited
+        unvisited ^= frontier
+        steps += 1
+        if distance < 0 and frontier & target:
+            distance = steps
+    return seed | (passable & ~unvisited), distance
+
+
+def layers(passable: int, seed: int, stride: int) -> List[int]:
+    """BFS layers from the seed: the tiles 0, 1, 2... steps away, one mask each"""
+    found = [seed]
+    frontier = seed
+    unvisited = passable & ~seed
+    while True:
+        frontier = expand(frontier, stride) & unvisited
+        if not frontier:
+            return found
+        unvisited ^= frontier
+        found.append(frontier)
+
+
+def first_path(layers: List[int], target: int, stride: int) -> List[int]:
+    """
+    The shortest path from the single-bit seed of `layers` to the target
+    tile, as one bit per tile, that steps right, left, down, up in that
+    order of preference; [] if no layer holds the target. A deque BFS
+    that queues neighbours in that order traces the same path.
+    """
+    steps = next((k for k, layer in enumerate(layers) if layer & target), -1)
+    if steps < 0:
+        return []
+    # Tiles on some shortest path, layer by layer back from the target
+    on_path = [0] * (steps + 1)
+    on_path[steps] = target
+    for k in range(steps - 1, -1, -1):
+        on_path[k] = expand(on_path[k + 1], stride) & layers[k]
+
+    path = [on_path[0]]
+    for k in range(1, steps + 1):
+        tile = path[-1]
+        path.append(
+            next(
+                step
+                for step in (tile << 1, tile >> 1, tile << stride, tile >> stride)
+                if step & on_path[k]
+            )
+        )
+    return path
+
+
+def distance(passable: int, seed: int, target: int, stride: int) -> int:
+    """BFS steps from the seed to the target tile, -1 if unreachable"""
+    frontier = seed
+    unvisited = passable & ~seed
+    steps = 0
+    while not frontier & target:
+        frontier = expand(frontier, stride) & unvisited
+        if not frontier:
+            return -1
+        unvisited ^= frontier
+        steps += 1
+    return steps
+
+
+def count_dead_ends(passable: int, stride: int) -> int:
+    """Open tiles with at most one open neighbour, like `Generator.is_dead_end`"""
+    a, b, c, d = neighbours(passable, stride)
+    two_or_more = (a & b) | (a & c) | (a & d) | (b & c) | (b & d) | (c & d)
+    return (passable & ~two_or_more).bit_count()
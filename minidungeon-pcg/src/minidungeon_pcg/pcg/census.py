@@ -0,0 +1,75 @@
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+Position = Tuple[int, int]
+
+
+class TileCensus:
+    """
+    Index of a dungeon's tiles that travels with its genome: a position set
+    per entity tile type plus wall counts per row. Writing a tile through
+    `set_tile` keeps it in sync in O(1), so operators never rescan the grid.
+    """
+
+    def __init__(self, wall, floor, height: int) -> None:
+        self.wall = wall
+        self.floor = floor
+        self.positions: Dict[object, Set[Position]] = {}
+        self.wall_rows = [0] * height
+        self.wall_count = 0
+
+    @classmethod
+    def from_dungeon(cls, dungeon: Sequence[Sequence], wall, floor) -> "TileCensus":
+        census = cls(wall, floor, len(dungeon))
+        for i, row in enumerate(dungeon):
+            for j, tile in enumerate(row):
+                if tile == wall:
+                    census.wall_rows[i] += 1
+                elif tile != floor:
+                    census.positions.setdefault(tile, set()).add((i, j))
+        census.wall_count = sum(census.wall_rows)
+        return census
+
+    @classmethod
+    def merge_rows(
+        cls, top: "TileCensus", bottom: "TileCensus", split_row: int
+    ) -> "TileCensus":
+        """Census of a child made of top's rows above split_row and bottom's from it"""
+        census = cls(top.wall, top.floor, len(top.wall_rows))
+        census.wall_rows = top.wall_rows[:split_row] + bottom.wall_rows[split_row:]
+        census.wall_count = sum(census.wall_rows)
+        for tile in top.positions.keys() | bottom.positions.keys():
+            merged = {pos for pos in top.positions.get(tile, ()) if pos[0] < split_row}
+            merged.update(
+                pos for pos in bottom.positions.get(tile, ()) if pos[0] >= split_row
+            )
+            if merged:
+                census.positions[tile] = merged
+        return census
+
+    def count(self, tile) -> int:
+        if tile == self.wall:
+            return self.wall_count
+        return len(self.positions.get(tile, ()))
+
+    def sorted_positions(self, tile) -> List[Position]:
+        """Row-major positions of a tile type, like `Generator.find_all_tiles`"""
+        return sorted(self.positions.get(tile, ()))
+
+    def set_tile(self, dungeon, i: int, j: int, tile) -> None:
+        """Write a tile into the dungeon and update the census"""
+        old = dungeon[i][j]
+        if old == tile:
+            return
+        if old == self.wall:
+            self.wall_rows[i] -= 1
+            self.wall_count -= 1
+        elif old != self.floor:
+            self.positions[old].discard((i, j))
+
+        dungeon[i][j] = tile
+        if tile == self.wall:
+            self.wall_rows[i] += 1
+            self.wall_count += 1
+        elif tile != self.floor:
+            self.positions.setdefault(tile, set()).add((i, j))
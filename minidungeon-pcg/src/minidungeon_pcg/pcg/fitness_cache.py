@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class FitnessCache:
+    """
+    Bounded map from genome key to fitness with least-recently-used eviction.
+    Counts hits and misses so a run can report how much work it saved.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test that leaves the stats and LRU order alone"""
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[float]:
+        """Return the cached fitness for `key`, or None on a miss"""
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key: Hashable, fitness: float) -> None:
+        """Store a fitness, evicting the least recently used entry when full"""
+        self._entries[key] = fitness
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Fitness cache: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate:.1%} hit rate, {len(self)}/{self.max_size} entries)"
+        )
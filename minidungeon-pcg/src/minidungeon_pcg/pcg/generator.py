@@ -1,8 +1,60 @@
+import itertools
+import math
 import random
-import copy
-from typing import List, Tuple, Dict
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from bisect import insort
 from collections import deque
+from dataclasses import dataclass
 from os import path
+from minidungeon_pcg.pcg.analysis import DungeonAnalysis
+from minidungeon_pcg.pcg.census import TileCensus
+from minidungeon_pcg.pcg.fitness_cache import FitnessCache
+from minidungeon_pcg.pcg.stage_cache import StageCache
+from minidungeon_pcg.pcg.telemetry import (
+    GenerationObserver,
+    GenerationRecord,
+    PhaseTimer,
+)
+
+if TYPE_CHECKING:
+    from minidungeon_pcg.pcg.parallel import GeneratedStage
+    from minidungeon_pcg.pcg.map_elites import EliteArchive
+    from minidungeon_pcg.pcg.playtest import PlaytestFitness
+    from minidungeon_pcg.pcg.staged import StagedFitness
+    from minidungeon_pcg.pcg.surrogate import LinearSurrogate, ScreeningResult
+
+
+@dataclass
+class GenerationProgress:
+    """State of a GA run after one generation, see `Generator.evolve`"""
+
+    generation: int
+    best_dungeon: Any
+    best_fitness: float
+    # Whether this generation found a new best dungeon
+    improved: bool
+    evaluations: int
+    elapsed: float
+    # Fraction of distinct genomes, only measured when min_diversity is set
+    diversity: Optional[float] = None
+    stop_reason: Optional[str] = None
+    # Surrogate screening: exact evaluations skipped and the model's error
+    evaluations_saved: int = 0
+    surrogate_error: Optional[float] = None
+    # Staged fitness: share of the evaluations settled by each stage
+    rejection_rates: Optional[Dict[str, float]] = None
 
 
 class Generator:
@@ -10,6 +62,9 @@ class Generator:
     Creates stage using Genetic Algorithm and saves to /pcg/stages
     """
 
+    # Whether dungeons are uint8 tile code arrays instead of character lists
+    uses_tile_codes = False
+
     def __init__(
         self,
         width: int = 9,
@@ -18,6 +73,13 @@ class Generator:
         generations: int = 300,
         mutation_rate: float = 0.15,
         elite_size: int = 10,
+        fitness_cache_size: int = 10_000,
+        incremental_fitness: bool = False,
+        seed: Optional[int] = None,
+        stage_cache: Optional[StageCache] = None,
+        playtest: Optional["PlaytestFitness"] = None,
+        surrogate: Optional["LinearSurrogate"] = None,
+        staged: Optional["StagedFitness"] = None,
     ) -> None:
         self.width = width
         self.height = height
@@ -26,6 +88,38 @@ class Generator:
         self.mutation_rate = mutation_rate
         self.elite_size = elite_size
 
+        # All randomness goes through this RNG so runs are reproducible
+        self.rng = random.Random(seed)
+
+        # Finished seeded runs are stored on disk and served from there
+        self.stage_cache = stage_cache
+        self.fitness_trace: List[float] = []
+
+        # Per-generation telemetry, see `add_observer`. The phase timer only
+        # exists while observers are attached.
+        self.observers: List[GenerationObserver] = []
+        self.phase_timer: Optional[PhaseTimer] = None
+
+        # Fitness is deterministic, so repeated genomes (elites, identical
+        # children) are looked up instead of re-evaluated. 0 disables it.
+        self.fitness_cache = (
+            FitnessCache(fitness_cache_size) if fitness_cache_size > 0 else None
+        )
+
+        # Rescore children from their first parent's analysis and the cells
+        # that changed, instead of from scratch (serial evaluation only)
+        self.incremental_fitness = incremental_fitness
+        self.max_delta_cells = max(4, (width * height) // 16)
+
+        # Optional agent playtest term added to every static fitness
+        self.playtest = playtest
+
+        # Optional model that decides which children get exact fitness
+        self.surrogate = surrogate
+
+        # Optional staged evaluation that rejects hopeless individuals early
+        self.staged = staged
+
         # Tile types
         self.WALL = "#"
         self.FLOOR = "."
@@ -41,66 +135,724 @@ class Generator:
         self.target_potion_count = 1
         self.target_treasure_count = 3
 
-    def generate_dungeon(self, stage_name: str = "generated") -> List[List[str]]:
+    def __getstate__(self) -> Dict[str, object]:
+        # Observers hold files and profilers; worker processes do not report
+        state = self.__dict__.copy()
+        state["observers"] = []
+        state["phase_timer"] = None
+        return state
+
+    def add_observer(self, observer: GenerationObserver) -> None:
+        """Receive a GenerationRecord after every generation of `evolve`"""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: GenerationObserver) -> None:
+        self.observers.remove(observer)
+
+    def generate_dungeon(
+        self,
+        stage_name: str = "generated",
+        workers: int = 1,
+        seed: Optional[int] = None,
+        save: bool = True,
+        verbose: bool = True,
+        time_budget_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None,
+        patience: Optional[int] = None,
+        min_diversity: Optional[float] = None,
+    ) -> List[List[str]]:
         """
         Main method to generate a dungeon using GA
         Returns the best dungeon as a list of strings
+
+        workers > 1 spreads fitness evaluation over a process pool. A seed
+        makes the run reproducible for a given seed and worker count.
+        save=False skips writing the stage files, verbose=False the progress.
+
+        With a stage_cache, seeded runs are looked up on disk first and
+        stored there when finished; unseeded runs are never cached.
+
+        time_budget_s, max_evaluations, patience and min_diversity stop the
+        run early, see `evolve`. Runs with a time budget depend on the
+        machine and are not cached.
         """
-        print(f"Initializing GA with population size {self.population_size}...")
-        population = self.initialize_population()
+        stopping = {
+            "max_evaluations": max_evaluations,
+            "patience": patience,
+            "min_diversity": min_diversity,
+        }
+        cache_key = None
+        if seed is not None and self.stage_cache is not None and time_budget_s is None:
+            cache_key = self.stage_cache.key(
+                {**self.cache_parameters(seed), **stopping}
+            )
+            cached = self.stage_cache.get(cache_key)
+            if cached is not None:
+                rows, self.fitness_trace = cached
+                dungeon = self.from_rows(rows)
+                if verbose:
+                    print(f"Loaded cached dungeon for seed {seed}")
+                if save:
+                    self.save_dungeon(dungeon, stage_name)
+                return dungeon
+
+        if seed is not None:
+            self.rng.seed(seed)
+
+        evaluator = None
+        if workers > 1:
+            from minidungeon_pcg.pcg.parallel import ParallelEvaluator
+
+            evaluator = ParallelEvaluator(self, workers, seed=seed)
+
+        try:
+            dungeon = self._run_ga(
+                stage_name,
+                evaluator,
+                save,
+                verbose,
+                time_budget_s=time_budget_s,
+                **stopping,
+            )
+        finally:
+            if evaluator is not None:
+                evaluator.close()
 
-        best_fitness = float("-inf")
-        best_dungeon = None
-        generations_without_improvement = 0
+        if cache_key is not None:
+            self.stage_cache.put(cache_key, self.to_rows(dungeon), self.fitness_trace)
+        return dungeon
 
-        for generation in range(self.generations):
-            # Evaluate fitness for all individuals
-            fitnesses = [self.calculate_fitness(dungeon) for dungeon in population]
-
-            # Track best individual
-            max_fitness_idx = fitnesses.index(max(fitnesses))
-            if fitnesses[max_fitness_idx] > best_fitness:
-                best_fitness = fitnesses[max_fitness_idx]
-                best_dungeon = copy.deepcopy(population[max_fitness_idx])
-                generations_without_improvement = 0
-                print(f"Generation {generation}: New best fitness = {best_fitness:.2f}")
-            else:
-                generations_without_improvement += 1
+    def cache_parameters(self, seed: int) -> Dict[str, object]:
+        """Everything that determines the outcome of a seeded run"""
+        return {
+            "backend": type(self).__name__,
+            "width": self.width,
+            "height": self.height,
+            "population_size": self.population_size,
+            "generations": self.generations,
+            "mutation_rate": self.mutation_rate,
+            "elite_size": self.elite_size,
+            "min_path_length": self.min_path_length,
+            "target_monster_count": self.target_monster_count,
+            "target_potion_count": self.target_potion_count,
+            "target_treasure_count": self.target_treasure_count,
+            "playtest": self.playtest.parameters() if self.playtest else None,
+            "surrogate": self.surrogate.parameters() if self.surrogate else None,
+            "staged": self.staged.parameters() if self.staged else None,
+            "seed": seed,
+        }
+
+    def generate_many(
+        self,
+        n: int,
+        seeds: Optional[Iterable[int]] = None,
+        workers: int = 1,
+        max_in_flight: Optional[int] = None,
+        save: bool = False,
+        stage_prefix: str = "generated",
+    ) -> Iterator["GeneratedStage"]:
+        """
+        Generate n dungeons, one full GA run per seed (0..n-1 by default),
+        yielding each as soon as it finishes. Runs are spread over `workers`
+        processes with at most `max_in_flight` (default 2 per worker) runs
+        submitted at once, so memory stays bounded however large n is.
+        save=True also writes every stage as "<stage_prefix>_<seed>".
+        """
+        from minidungeon_pcg.pcg.parallel import generate_stages
+
+        stage_seeds = itertools.islice(
+            seeds if seeds is not None else itertools.count(), n
+        )
+        for stage in generate_stages(self, stage_seeds, workers, max_in_flight):
+            if save:
+                self.save_dungeon(stage.dungeon, f"{stage_prefix}_{stage.seed}")
+            yield stage
+
+    def generate_dungeon_islands(
+        self,
+        stage_name: str = "generated",
+        islands: int = 4,
+        migration_interval: int = 10,
+        migrants: int = 2,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Generate a dungeon with the island model: the population is split
+        over `islands` processes that exchange their best individuals every
+        `migration_interval` generations. See `islands.run_islands`.
+        """
+        from minidungeon_pcg.pcg.islands import run_islands
+
+        report = run_islands(self, islands, migration_interval, migrants, seed)
+        print(report.summary())
+        self.save_dungeon(report.best_dungeon, stage_name)
+        return report.best_dungeon
 
-            # Early stopping if no improvement
-            # if generations_without_improvement > 100:
-            #    print(f"Early stopping at generation {generation}")
-            #    break
+    def generate_world(
+        self,
+        stage_name: str = "generated",
+        chunk_size: int = 16,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        save: bool = True,
+    ) -> List[List[str]]:
+        """
+        Generate a large width x height world from chunks of about
+        chunk_size tiles, evolved in parallel and stitched through shared
+        seam doors. See `world.generate_world`.
+        """
+        from minidungeon_pcg.pcg.world import generate_world
+
+        report = generate_world(self, chunk_size, workers, seed)
+        print(report.summary())
+        world = self.from_rows(["".join(row) for row in report.dungeon])
+        if save:
+            self.save_dungeon(world, stage_name)
+        return world
+
+    def generate_archive(
+        self,
+        iterations: Optional[int] = None,
+        seed: Optional[int] = None,
+        archive: Optional["EliteArchive"] = None,
+        filename: Optional[str] = None,
+    ) -> "EliteArchive":
+        """
+        MAP-Elites mode: one run fills an archive of elites indexed by wall
+        ratio, path length and monsters on the path, which then answers
+        `archive.query(...)` for many dungeons without another GA run.
+        filename also saves the archive as JSON. See `map_elites`.
+        """
+        from minidungeon_pcg.pcg.map_elites import run_map_elites
 
-            # Create next generation
-            new_population = []
+        report = run_map_elites(self, iterations, archive=archive, seed=seed)
+        print(report.summary())
+        if filename is not None:
+            report.archive.save(filename)
+        return report.archive
 
-            # Elitism: keep best individuals
-            elite_indices = sorted(
-                range(len(fitnesses)), key=lambda i: fitnesses[i], reverse=True
-            )[: self.elite_size]
-            for idx in elite_indices:
-                new_population.append(copy.deepcopy(population[idx]))
+    def _run_ga(
+        self, stage_name: str, evaluator, save: bool, verbose: bool, **stopping
+    ) -> List[List[str]]:
+        log = print if verbose else lambda *args: None
 
-            # Generate rest of population
-            while len(new_population) < self.population_size:
-                parent1 = self.selection(population, fitnesses)
-                parent2 = self.selection(population, fitnesses)
-                child = self.crossover(parent1, parent2)
-                child = self.mutate(child)
-                new_population.append(child)
+        log(f"Initializing GA with population size {self.population_size}...")
+        if self.fitness_cache is not None:
+            self.fitness_cache.reset_stats()
 
-            population = new_population
+        best_fitness = float("-inf")
+        best_dungeon = None
+        evaluations = saved = 0
+        for progress in self.evolve(evaluator, **stopping):
+            best_fitness = progress.best_fitness
+            best_dungeon = progress.best_dungeon
+            evaluations = progress.evaluations
+            saved += progress.evaluations_saved
+            if progress.improved:
+                log(
+                    f"Generation {progress.generation}: "
+                    f"New best fitness = {best_fitness:.2f}"
+                )
+            if progress.stop_reason is not None:
+                log(
+                    f"Stopped at generation {progress.generation}: "
+                    f"{progress.stop_reason}"
+                )
 
-        print(f"Final best fitness: {best_fitness:.2f}")
+        log(f"Final best fitness: {best_fitness:.2f}")
+        if self.fitness_cache is not None:
+            log(self.fitness_cache.summary())
+        if self.surrogate is not None:
+            log(f"Surrogate: {saved} of {evaluations + saved} evaluations saved")
+        if self.staged is not None:
+            log(self.staged.summary())
 
         # Save the best dungeon
-        if best_dungeon:
-            self.save_dungeon(best_dungeon, stage_name)
+        if best_dungeon is not None:
+            if save:
+                self.save_dungeon(best_dungeon, stage_name)
             return best_dungeon
         else:
             raise Exception("Failed to generate a valid dungeon")
 
+    def evolve(
+        self,
+        evaluator=None,
+        time_budget_s: Optional[float] = None,
+        max_evaluations: Optional[int] = None,
+        patience: Optional[int] = None,
+        min_diversity: Optional[float] = None,
+    ) -> Iterator[GenerationProgress]:
+        """
+        Run the GA one generation at a time, yielding the best-so-far
+        dungeon after every evaluation. The caller may stop iterating at any
+        point and keep the last best dungeon.
+
+        The run ends after `self.generations` generations or earlier when
+        - the next generation would not finish within `time_budget_s`,
+          estimated from the evaluation and breeding time of the previous one
+        - the next generation would exceed `max_evaluations` fitness scores
+        - the best fitness has not improved for `patience` generations
+        - the fraction of distinct genomes drops below `min_diversity`
+        The last progress of an early stopped run carries the stop reason.
+
+        With a surrogate, evaluations only count exact fitness scores and
+        incremental fitness is not used. Staged fitness applies to
+        in-process evaluation, not to incremental or parallel evaluation.
+        """
+        start_time = time.perf_counter()
+        population = self.initialize_population()
+        censuses: List[Optional[TileCensus]] = [
+            self.census_of(dungeon) for dungeon in population
+        ]
+
+        best_fitness = float("-inf")
+        best_dungeon = None
+        generations_without_improvement = 0
+        evaluations = 0
+        self.fitness_trace = []
+
+        # Parent dungeon and analysis of each individual for incremental fitness
+        parents: List[Optional[Tuple[List[List[str]], DungeonAnalysis]]] = [None] * len(
+            population
+        )
+        analyses: List[DungeonAnalysis] = []
+
+        timer = self.phase_timer = PhaseTimer() if self.observers else None
+        screening: Optional["ScreeningResult"] = None
+        if self.surrogate is not None:
+            self.surrogate.reset()
+        rejection_rates: Optional[Dict[str, float]] = None
+        if self.staged is not None:
+            self.staged.reset()
+
+        # Whether observers saw start_generation but not yet on_generation
+        generation_open = False
+        # Evaluation and breeding time of the last full generation, without
+        # the time the caller spent between them
+        last_generation_s: Optional[float] = None
+        try:
+            for generation in range(self.generations):
+                generation_start = time.perf_counter()
+                if timer is not None:
+                    for observer in self.observers:
+                        observer.start_generation(generation)
+                    generation_open = True
+                    cache_stats = self._cache_stats()
+                    timer.enter("evaluation")
+
+                # Evaluate fitness for all individuals
+                if self.surrogate is not None:
+                    fitnesses, screening = self.evaluate_screened(
+                        population,
+                        (
+                            (lambda dungeons: (evaluator.evaluate(dungeons), None))
+                            if evaluator is not None
+                            else self.evaluate_population_bounded
+                        ),
+                    )
+                    evaluations += len(population) - screening.evaluations_saved
+                elif evaluator is not None:
+                    fitnesses = evaluator.evaluate(population)
+                    evaluations += len(population)
+                elif self.incremental_fitness:
+                    fitnesses, analyses = self.evaluate_incremental(population, parents)
+                    evaluations += len(population)
+                else:
+                    fitnesses = self.evaluate_population(population, censuses)
+                    evaluations += len(population)
+                if self.staged is not None:
+                    rejection_rates = self.staged.take()
+                    self.staged.update_threshold(fitnesses)
+
+                if timer is not None:
+                    timer.exit()
+                    record_population = population
+
+                # Track best individual, among exact fitnesses only
+                if screening is None:
+                    max_fitness_idx = fitnesses.index(max(fitnesses))
+                else:
+                    max_fitness_idx = max(
+                        screening.exact_indices, key=fitnesses.__getitem__
+                    )
+                improved = fitnesses[max_fitness_idx] > best_fitness
+                if improved:
+                    best_fitness = fitnesses[max_fitness_idx]
+                    best_dungeon = self.retain(population[max_fitness_idx])
+                    generations_without_improvement = 0
+                else:
+                    generations_without_improvement += 1
+                self.fitness_trace.append(best_fitness)
+
+                # Early stopping
+                now = time.perf_counter()
+                diversity = None
+                if min_diversity is not None:
+                    diversity = len(set(map(self.genome_key, population))) / len(
+                        population
+                    )
+
+                stop_reason = None
+                # Until a generation has been bred, its evaluation is the
+                # best guess for the whole
+                next_generation_s = (
+                    last_generation_s
+                    if last_generation_s is not None
+                    else now - generation_start
+                )
+                if time_budget_s is not None and (
+                    now - start_time + next_generation_s > time_budget_s
+                ):
+                    stop_reason = f"time budget of {time_budget_s}s reached"
+                elif max_evaluations is not None and (
+                    evaluations + len(population) > max_evaluations
+                ):
+                    stop_reason = f"evaluation budget of {max_evaluations} reached"
+                elif (
+                    patience is not None and generations_without_improvement >= patience
+                ):
+                    stop_reason = f"no improvement for {patience} generations"
+                elif diversity is not None and diversity < min_diversity:  # type: ignore[operator]
+                    stop_reason = f"diversity collapsed to {diversity:.2f}"
+
+                if timer is not None:
+                    for observer in self.observers:
+                        observer.pause_generation()
+                yielded = time.perf_counter()
+                yield GenerationProgress(
+                    generation=generation,
+                    best_dungeon=best_dungeon,
+                    best_fitness=best_fitness,
+                    improved=improved,
+                    evaluations=evaluations,
+                    elapsed=now - start_time,
+                    diversity=diversity,
+                    stop_reason=stop_reason,
+                    evaluations_saved=screening.evaluations_saved if screening else 0,
+                    surrogate_error=screening.error if screening else None,
+                    rejection_rates=rejection_rates,
+                )
+                paused = time.perf_counter() - yielded
+                if timer is not None:
+                    for observer in self.observers:
+                        observer.resume_generation()
+
+                # Create next generation
+                if stop_reason is None:
+                    new_population, new_censuses, parent_indices = self.next_generation(
+                        population, censuses, fitnesses
+                    )
+
+                    if analyses:
+                        parents = [(population[i], analyses[i]) for i in parent_indices]
+                    population = new_population
+                    censuses = new_censuses
+                    last_generation_s = time.perf_counter() - generation_start - paused
+
+                if timer is not None:
+                    record = self._generation_record(
+                        generation, record_population, fitnesses, cache_stats, timer
+                    )
+                    if screening is not None:
+                        record.evaluations_saved = screening.evaluations_saved
+                        record.surrogate_error = screening.error
+                    record.rejection_rates = rejection_rates
+                    generation_open = False
+                    for observer in self.observers:
+                        observer.on_generation(record)
+
+                if stop_reason is not None:
+                    return
+        finally:
+            if timer is not None and generation_open:
+                for observer in self.observers:
+                    observer.pause_generation()
+            self.phase_timer = None
+
+    def evaluate_screened(
+        self,
+        population: List[List[List[str]]],
+        evaluate: Callable[
+            [List[List[List[str]]]], Tuple[List[float], Optional[List[bool]]]
+        ],
+    ) -> Tuple[List[float], "ScreeningResult"]:
+        """
+        Surrogate pre-screening: rank the population by predicted fitness and
+        `evaluate` only the top `surrogate.fraction` plus the individuals
+        whose fitness is cached anyway. The others keep their predicted
+        fitness. Until the model is trained everyone is evaluated.
+
+        `evaluate` also says which of its results are exact (None for all),
+        like `evaluate_cached_bounded`. The surrogate only learns from exact
+        ones, never from the bounds of staged fitness.
+        """
+        from minidungeon_pcg.pcg.surrogate import ScreeningResult
+
+        surrogate = self.surrogate
+        assert surrogate is not None
+        features = surrogate.features(self, population)
+        if not surrogate.trained:
+            fitnesses, exact = evaluate(population)
+            learned = [i for i in range(len(population)) if exact is None or exact[i]]
+            if learned:
+                surrogate.update(features[learned], [fitnesses[i] for i in learned])
+            return fitnesses, ScreeningResult(list(range(len(population))))
+
+        predicted = surrogate.predict(features).tolist()
+        cached = set()
+        if self.fitness_cache is not None:
+            cached = {
+                i
+                for i, dungeon in enumerate(population)
+                if self.genome_key(dungeon) in self.fitness_cache
+            }
+        ranked = sorted(
+            (i for i in range(len(population)) if i not in cached),
+            key=lambda i: -predicted[i],
+        )
+        scored = sorted(ranked[: math.ceil(surrogate.fraction * len(ranked))])
+        exact_indices = sorted(cached.union(scored))
+
+        computed, exact = evaluate([population[i] for i in exact_indices])
+        fitnesses = list(predicted)
+        for i, fitness in zip(exact_indices, computed):
+            fitnesses[i] = fitness
+
+        error = None
+        if exact is not None:
+            bounded = {i for i, is_exact in zip(exact_indices, exact) if not is_exact}
+            scored = [i for i in scored if i not in bounded]
+        if scored:
+            error = sum(abs(predicted[i] - fitnesses[i]) for i in scored) / len(scored)
+            surrogate.update(features[scored], [fitnesses[i] for i in scored])
+        return fitnesses, ScreeningResult(
+            exact_indices, len(population) - len(exact_indices), error
+        )
+
+    def _cache_stats(self) -> Tuple[int, int]:
+        if self.fitness_cache is None:
+            return 0, 0
+        return self.fitness_cache.hits, self.fitness_cache.misses
+
+    def _generation_record(
+        self,
+        generation: int,
+        population: List[List[List[str]]],
+        fitnesses: List[float],
+        cache_stats: Tuple[int, int],
+        timer: PhaseTimer,
+    ) -> GenerationRecord:
+        """Telemetry of one evaluated generation and the breeding after it"""
+        count = len(fitnesses)
+        mean = sum(fitnesses) / count
+        variance = sum((fitness - mean) ** 2 for fitness in fitnesses) / count
+
+        cache_hit_rate = None
+        if self.fitness_cache is not None:
+            hits, misses = self._cache_stats()
+            lookups = hits + misses - sum(cache_stats)
+            if lookups:
+                cache_hit_rate = (hits - cache_stats[0]) / lookups
+
+        phases = timer.take()
+        return GenerationRecord(
+            generation=generation,
+            population_size=count,
+            evaluation_s=phases["evaluation"],
+            selection_s=phases["selection"],
+            crossover_s=phases["crossover"],
+            mutation_s=phases["mutation"],
+            repair_s=phases["repair"],
+            best_fitness=max(fitnesses),
+            mean_fitness=mean,
+            std_fitness=variance**0.5,
+            unique_genomes=len(set(map(self.genome_key, population))),
+            cache_hit_rate=cache_hit_rate,
+        )
+
+    def retain(self, dungeon: List[List[str]]) -> List[List[str]]:
+        """
+        Reference to an evaluated dungeon that stays valid for the rest of
+        the run. Genomes are immutable here, so it is the dungeon itself.
+        """
+        return dungeon
+
+    def next_generation(
+        self,
+        population: List[List[List[str]]],
+        censuses: List[Optional[TileCensus]],
+        fitnesses: List[float],
+    ) -> Tuple[List[List[List[str]]], List[Optional[TileCensus]], List[int]]:
+        """
+        Breed the next population from an evaluated one: elites carried over,
+        the rest from tournament selection, crossover and mutation.
+        Returns the new population, its censuses (None for an individual
+        whose census a backend does not keep) and each individual's (first)
+        parent index.
+        """
+        new_population = []
+        new_censuses = []
+        parent_indices = []
+        timer = self.phase_timer
+        if timer is not None:
+            timer.enter("selection")
+
+        # Elitism: keep best individuals
+        elite_indices = sorted(
+            range(len(fitnesses)), key=lambda i: fitnesses[i], reverse=True
+        )[: self.elite_size]
+        for idx in elite_indices:
+            new_population.append(population[idx])
+            new_censuses.append(censuses[idx])
+            parent_indices.append(idx)
+
+        # Generate rest of population
+        while len(new_population) < self.population_size:
+            parent1_idx = self.tournament_index(fitnesses)
+            parent2_idx = self.tournament_index(fitnesses)
+            if timer is not None:
+                timer.switch("crossover")
+            child, census = self.crossover_with_census(
+                population[parent1_idx],
+                censuses[parent1_idx],
+                population[parent2_idx],
+                censuses[parent2_idx],
+            )
+            if timer is not None:
+                timer.switch("mutation")
+            child = self.mutate(child, census)
+            if timer is not None:
+                timer.switch("selection")
+            new_population.append(child)
+            new_censuses.append(census)
+            parent_indices.append(parent1_idx)
+
+        if timer is not None:
+            timer.exit()
+        return new_population, new_censuses, parent_indices
+
+    def evaluate_population(
+        self,
+        population: List[List[List[str]]],
+        censuses: Optional[List[Optional[TileCensus]]] = None,
+    ) -> List[float]:
+        """
+        Calculate the fitness of every individual in the population. The
+        censuses, when known, spare staged fitness a scan per individual.
+        """
+        return self.evaluate_population_bounded(population, censuses)[0]
+
+    def evaluate_population_bounded(
+        self,
+        population: List[List[List[str]]],
+        censuses: Optional[List[Optional[TileCensus]]] = None,
+    ) -> Tuple[List[float], List[bool]]:
+        """
+        `evaluate_population` that also says which fitnesses are exact.
+        Staged fitness leaves a bound for the individuals it rejects early.
+        """
+        staged = self.staged
+        if staged is None:
+            return self.evaluate_cached_bounded(
+                population,
+                lambda dungeons: (self.compute_fitness_many(dungeons), None),
+            )
+
+        by_id = {}
+        if censuses is not None:
+            by_id = {id(dungeon): c for dungeon, c in zip(population, censuses)}
+        return self.evaluate_cached_bounded(
+            population,
+            lambda missing: staged.evaluate_many(
+                self, missing, [by_id.get(id(dungeon)) for dungeon in missing]
+            ),
+        )
+
+    def evaluate_incremental(
+        self,
+        population: List[List[List[str]]],
+        parents: List[Optional[Tuple[List[List[str]], DungeonAnalysis]]],
+    ) -> Tuple[List[float], List[DungeonAnalysis]]:
+        """
+        Calculate fitnesses and analyses of the population, deriving each
+        individual's analysis from its parent's where one is given
+        """
+        fitnesses = []
+        analyses = []
+        for dungeon, parent in zip(population, parents):
+            analysis = None
+            if parent is not None:
+                parent_dungeon, parent_analysis = parent
+                changed = self.changed_cells(parent_dungeon, dungeon)
+                analysis = self.analyze_delta(
+                    parent_analysis, parent_dungeon, dungeon, changed
+                )
+            if analysis is None:
+                analysis = self.analyze_dungeon(dungeon)
+            fitnesses.append(self.fitness_from_analysis(analysis))
+            analyses.append(analysis)
+        return self.add_playtest(population, fitnesses), analyses
+
+    def compute_fitness_many(self, population: List[List[List[str]]]) -> List[float]:
+        """Uncached fitness of every individual in the population"""
+        return [self.compute_fitness(dungeon) for dungeon in population]
+
+    def evaluate_cached(
+        self,
+        population: List[List[List[str]]],
+        compute_many: Callable[[List[List[List[str]]]], List[float]],
+    ) -> List[float]:
+        """Serve fitnesses from the cache and run `compute_many` on the misses"""
+        return self.evaluate_cached_bounded(
+            population, lambda dungeons: (compute_many(dungeons), None)
+        )[0]
+
+    def evaluate_cached_bounded(
+        self,
+        population: List[List[List[str]]],
+        compute_many: Callable[
+            [List[List[List[str]]]], Tuple[List[float], Optional[List[bool]]]
+        ],
+    ) -> Tuple[List[float], List[bool]]:
+        """
+        `evaluate_cached` for a `compute_many` that also says which of its
+        results are exact (None for all). Only exact ones are cached, so
+        a bound never stands in for the fitness of a later lookup. Returns
+        the fitnesses and whether each one is exact.
+        """
+        if self.fitness_cache is None:
+            computed, exact = compute_many(population)
+            if exact is None:
+                exact = [True] * len(population)
+            return self.add_playtest(population, computed), exact
+
+        keys = [self.genome_key(dungeon) for dungeon in population]
+        fitnesses = [self.fitness_cache.get(key) for key in keys]
+        exact_flags = [True] * len(population)
+        missing = [i for i, fitness in enumerate(fitnesses) if fitness is None]
+        if missing:
+            dungeons = [population[i] for i in missing]
+            computed, exact = compute_many(dungeons)
+            computed = self.add_playtest(dungeons, computed)
+            if exact is None:
+                exact = [True] * len(missing)
+            for i, fitness, is_exact in zip(missing, computed, exact):
+                fitnesses[i] = fitness
+                exact_flags[i] = is_exact
+                if is_exact:
+                    self.fitness_cache.put(keys[i], fitness)
+        return fitnesses, exact_flags  # type: ignore[return-value]
+
+    def add_playtest(
+        self, population: List[List[List[str]]], fitnesses: List[float]
+    ) -> List[float]:
+        """Add the playtest score of every dungeon when playtesting is on"""
+        if self.playtest is None:
+            return fitnesses
+        scores = self.playtest.scores([self.to_rows(dungeon) for dungeon in population])
+        return [fitness + score for fitness, score in zip(fitnesses, scores)]
+
     def initialize_population(self) -> List[List[List[str]]]:
         """Create initial random population of dungeons"""
         population = []
@@ -113,16 +865,22 @@ class Generator:
             population.append(dungeon)
         return population
 
+    def new_grid(self, fill: str) -> List[List[str]]:
+        """Create an empty grid of the configured size filled with one tile"""
+        return [[fill for _ in range(self.width)] for _ in range(self.height)]
+
     def create_random_dungeon(self) -> List[List[str]]:
         """Create a single random dungeon with basic constraints"""
-        dungeon = [[self.FLOOR for _ in range(self.width)] for _ in range(self.height)]
+        dungeon = self.new_grid(self.FLOOR)
 
         # Add walls (50-60% of tiles)
-        wall_count = random.randint(
+        wall_count = self.rng.randint(
             int(self.width * self.height * 0.5), int(self.width * self.height * 0.6)
         )
         for _ in range(wall_count):
-            x, y = random.randint(0, self.height - 1), random.randint(0, self.width - 1)
+            x, y = self.rng.randint(0, self.height - 1), self.rng.randint(
+                0, self.width - 1
+            )
             dungeon[x][y] = self.WALL
 
         # Place start and exit at opposite corners/edges
@@ -132,8 +890,8 @@ class Generator:
             (self.height // 2, self.width - 1),
         ]
 
-        start_x, start_y = random.choice(start_positions)
-        exit_x, exit_y = random.choice(exit_positions)
+        start_x, start_y = self.rng.choice(start_positions)
+        exit_x, exit_y = self.rng.choice(exit_positions)
 
         dungeon[start_x][start_y] = self.START
         dungeon[exit_x][exit_y] = self.EXIT
@@ -161,38 +919,40 @@ class Generator:
     def create_structured_dungeon(self) -> List[List[str]]:
         """Create a dungeon with corridor-like structures for better maze feel"""
         # Start with all walls
-        dungeon = [[self.WALL for _ in range(self.width)] for _ in range(self.height)]
+        dungeon = self.new_grid(self.WALL)
 
         # Create random walk corridors
-        num_corridors = random.randint(3, 5)
+        num_corridors = self.rng.randint(3, 5)
         for _ in range(num_corridors):
             # Random starting point
-            x, y = random.randint(1, self.height - 2), random.randint(1, self.width - 2)
-            corridor_length = random.randint(8, 15)
+            x, y = self.rng.randint(1, self.height - 2), self.rng.randint(
+                1, self.width - 2
+            )
+            corridor_length = self.rng.randint(8, 15)
 
             for step in range(corridor_length):
                 # Carve out floor
                 dungeon[x][y] = self.FLOOR
 
                 # Sometimes carve adjacent tiles for wider corridors
-                if random.random() < 0.3:
+                if self.rng.random() < 0.3:
                     for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                         nx, ny = x + dx, y + dy
                         if 0 <= nx < self.height and 0 <= ny < self.width:
                             dungeon[nx][ny] = self.FLOOR
 
                 # Random walk
-                direction = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+                direction = self.rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
                 x = max(1, min(self.height - 2, x + direction[0]))
                 y = max(1, min(self.width - 2, y + direction[1]))
 
         # Create a few small rooms
-        num_rooms = random.randint(2, 4)
+        num_rooms = self.rng.randint(2, 4)
         for _ in range(num_rooms):
-            room_x = random.randint(1, self.height - 4)
-            room_y = random.randint(1, self.width - 4)
-            room_w = random.randint(2, 3)
-            room_h = random.randint(2, 3)
+            room_x = self.rng.randint(1, self.height - 4)
+            room_y = self.rng.randint(1, self.width - 4)
+            room_w = self.rng.randint(2, 3)
+            room_h = self.rng.randint(2, 3)
 
             for i in range(room_h):
                 for j in range(room_w):
@@ -206,8 +966,8 @@ class Generator:
             (self.height // 2, self.width - 2),
         ]
 
-        start_x, start_y = random.choice(start_positions)
-        exit_x, exit_y = random.choice(exit_positions)
+        start_x, start_y = self.rng.choice(start_positions)
+        exit_x, exit_y = self.rng.choice(exit_positions)
 
         dungeon[start_x][start_y] = self.START
         dungeon[exit_x][exit_y] = self.EXIT
@@ -242,13 +1002,31 @@ class Generator:
         """Find a random empty floor position"""
         attempts = 0
         while attempts < 100:
-            x, y = random.randint(0, self.height - 1), random.randint(0, self.width - 1)
+            x, y = self.rng.randint(0, self.height - 1), self.rng.randint(
+                0, self.width - 1
+            )
             if dungeon[x][y] == self.FLOOR:
                 return x, y
             attempts += 1
         return None, None  # type: ignore
 
+    def genome_key(self, dungeon: List[List[str]]) -> Hashable:
+        """Cheap hashable key identifying a dungeon's tiles"""
+        return "".join(["".join(row) for row in dungeon])
+
     def calculate_fitness(self, dungeon: List[List[str]]) -> float:
+        """Fitness of a dungeon, served from the fitness cache when possible"""
+        if self.fitness_cache is None:
+            return self.add_playtest([dungeon], [self.compute_fitness(dungeon)])[0]
+
+        key = self.genome_key(dungeon)
+        fitness = self.fitness_cache.get(key)
+        if fitness is None:
+            fitness = self.add_playtest([dungeon], [self.compute_fitness(dungeon)])[0]
+            self.fitness_cache.put(key, fitness)
+        return fitness
+
+    def compute_fitness(self, dungeon: List[List[str]]) -> float:
         """
         Calculate fitness score based on multiple criteria:
         - Path length (longer is better, but not too long)
@@ -257,19 +1035,207 @@ class Generator:
         - Resource availability
         - Playability (dead ends, open space)
         """
+        return self.fitness_from_analysis(self.analyze_dungeon(dungeon))
+
+    def analyze_dungeon(self, dungeon: List[List[str]]) -> DungeonAnalysis:
+        """
+        Gather every fitness input in one pass: a single scan for tile
+        positions, wall and dead-end counts, then one BFS from the start
+        that yields distances, predecessors and the start -> exit path.
+        """
+        height, width = self.height, self.width
+        wall, floor = self.WALL, self.FLOOR
+        positions: Dict[str, List[Tuple[int, int]]] = {}
+        wall_count = 0
+        dead_end_count = 0
+
+        for i in range(height):
+            row = dungeon[i]
+            above = dungeon[i - 1] if i > 0 else None
+            below = dungeon[i + 1] if i < height - 1 else None
+            for j in range(width):
+                tile = row[j]
+                if tile == wall:
+                    wall_count += 1
+                    continue
+                if tile != floor:
+                    positions.setdefault(tile, []).append((i, j))
+
+                open_neighbours = 0
+                if above is not None and above[j] != wall:
+                    open_neighbours += 1
+                if below is not None and below[j] != wall:
+                    open_neighbours += 1
+                if j > 0 and row[j - 1] != wall:
+                    open_neighbours += 1
+                if j < width - 1 and row[j + 1] != wall:
+                    open_neighbours += 1
+                if open_neighbours <= 1:  # Only one exit
+                    dead_end_count += 1
+
+        starts = positions.get(self.START)
+        exits = positions.get(self.EXIT)
+        analysis = DungeonAnalysis(
+            start=starts[0] if starts else None,
+            exit=exits[0] if exits else None,
+            positions=positions,
+            wall_count=wall_count,
+            floor_count=height * width - wall_count,
+            dead_end_count=dead_end_count,
+        )
+        if analysis.start is not None:
+            self.search_from_start(dungeon, analysis)
+        return analysis
+
+    def search_from_start(
+        self, dungeon: List[List[str]], analysis: DungeonAnalysis
+    ) -> None:
+        """Fill in the BFS results of an analysis with a known start"""
+        assert analysis.start is not None
+        analysis.distances, analysis.predecessors = self.bfs(dungeon, analysis.start)
+        analysis.path_tiles = []
+        if analysis.exit in analysis.distances:
+            analysis.path_tiles = self.trace_path(
+                analysis.predecessors, analysis.start, analysis.exit
+            )
+
+    def changed_cells(
+        self, before: List[List[str]], after: List[List[str]]
+    ) -> List[Tuple[int, int]]:
+        """Positions whose tile differs between two dungeons"""
+        changed = []
+        for i in range(self.height):
+            row_before, row_after = before[i], after[i]
+            if row_before == row_after:
+                continue
+            for j in range(self.width):
+                if row_before[j] != row_after[j]:
+                    changed.append((i, j))
+            if len(changed) > self.max_delta_cells:
+                break  # Too many for a delta update anyway
+        return changed
+
+    def analyze_delta(
+        self,
+        parent_analysis: DungeonAnalysis,
+        parent: List[List[str]],
+        child: List[List[str]],
+        changed: List[Tuple[int, int]],
+    ) -> Optional[DungeonAnalysis]:
+        """
+        Update a parent's analysis for a child that differs in `changed`.
+
+        Census, wall count and dead ends are patched locally. The BFS results
+        are reused unless a wall toggle touches the reachable region. Returns
+        None when the change is structural (start/exit moved or too many
+        cells changed) and the child needs a full `analyze_dungeon`.
+        """
+        if not changed:
+            return parent_analysis
+        if len(changed) > self.max_delta_cells:
+            return None
+
+        wall = self.WALL
+        structural = (self.START, self.EXIT)
+        distances = parent_analysis.distances
+        positions = dict(parent_analysis.positions)
+        copied_types = set()
+        wall_delta = 0
+        rerun_bfs = False
+        toggled_walls = []
+
+        for i, j in changed:
+            old, new = parent[i][j], child[i][j]
+            if old in structural or new in structural:
+                return None
+
+            for tile, add in ((old, False), (new, True)):
+                if tile == wall or tile == self.FLOOR:
+                    continue
+                if tile not in copied_types:
+                    positions[tile] = list(positions.get(tile, []))
+                    copied_types.add(tile)
+                if add:
+                    insort(positions[tile], (i, j))
+                else:
+                    positions[tile].remove((i, j))
+
+            if (old == wall) == (new == wall):
+                continue
+            toggled_walls.append((i, j))
+            if new == wall:
+                wall_delta += 1
+                rerun_bfs = rerun_bfs or (i, j) in distances
+            else:
+                wall_delta -= 1
+                rerun_bfs = rerun_bfs or any(
+                    neighbour in distances for neighbour in self.neighbours(i, j)
+                )
+
+        # Only tiles next to a toggled wall can change dead-end status
+        dead_end_count = parent_analysis.dead_end_count
+        affected = set(toggled_walls)
+        for i, j in toggled_walls:
+            affected.update(self.neighbours(i, j))
+        for i, j in affected:
+            dead_end_count += self.is_dead_end(child, i, j) - self.is_dead_end(
+                parent, i, j
+            )
+
+        wall_count = parent_analysis.wall_count + wall_delta
+        analysis = DungeonAnalysis(
+            start=parent_analysis.start,
+            exit=parent_analysis.exit,
+            positions={tile: tiles for tile, tiles in positions.items() if tiles},
+            wall_count=wall_count,
+            floor_count=self.height * self.width - wall_count,
+            dead_end_count=dead_end_count,
+            distances=parent_analysis.distances,
+            predecessors=parent_analysis.predecessors,
+            path_tiles=parent_analysis.path_tiles,
+        )
+        if rerun_bfs and analysis.start is not None:
+            self.search_from_start(child, analysis)
+        return analysis
+
+    def neighbours(self, i: int, j: int) -> List[Tuple[int, int]]:
+        """In-bounds 4-neighbours of a position"""
+        return [
+            (ni, nj)
+            for ni, nj in ((i, j + 1), (i, j - 1), (i + 1, j), (i - 1, j))
+            if 0 <= ni < self.height and 0 <= nj < self.width
+        ]
+
+    def is_dead_end(self, dungeon: List[List[str]], i: int, j: int) -> bool:
+        """Whether a non-wall tile has at most one non-wall neighbour"""
+        wall = self.WALL
+        row = dungeon[i]
+        if row[j] == wall:
+            return False
+        open_neighbours = 0
+        if i > 0 and dungeon[i - 1][j] != wall:
+            open_neighbours += 1
+        if i < self.height - 1 and dungeon[i + 1][j] != wall:
+            open_neighbours += 1
+        if j > 0 and row[j - 1] != wall:
+            open_neighbours += 1
+        if j < self.width - 1 and row[j + 1] != wall:
+            open_neighbours += 1
+        return open_neighbours <= 1
+
+    def fitness_from_analysis(self, analysis: DungeonAnalysis) -> float:
+        """Combine the fitness terms described in `compute_fitness`"""
         fitness = 0.0
 
-        # Find start and exit positions
-        start_pos = self.find_tile(dungeon, self.START)
-        exit_pos = self.find_tile(dungeon, self.EXIT)
+        start_pos = analysis.start
+        exit_pos = analysis.exit
 
         if not start_pos or not exit_pos:
             return -1000.0  # Invalid dungeon
 
         # 1. Path length fitness (weight: 30)
-        path_length, path_exists = self.calculate_path_length(
-            dungeon, start_pos, exit_pos
-        )
+        path_length = analysis.path_length
+        path_exists = analysis.path_exists
         if not path_exists:
             fitness -= 500  # Penalize unreachable exit
         else:
@@ -280,14 +1246,14 @@ class Generator:
                 fitness -= (self.min_path_length - path_length) * 5
 
         # 2. Connectivity fitness (weight: 25)
-        reachable_tiles = self.count_reachable_tiles(dungeon, start_pos)
-        total_floor_tiles = self.count_floor_tiles(dungeon)
+        reachable_tiles = analysis.reachable_count
+        total_floor_tiles = analysis.floor_count
         if total_floor_tiles > 0:
             connectivity_ratio = reachable_tiles / total_floor_tiles
             fitness += connectivity_ratio * 25
 
         # 3. Enemy distribution fitness (weight: 20)
-        monster_positions = self.find_all_tiles(dungeon, self.MONSTER)
+        monster_positions = analysis.positions.get(self.MONSTER, [])
         if len(monster_positions) > 0:
             # Reward monsters being spread out
             min_distance = self.calculate_min_distance_between_entities(
@@ -297,15 +1263,15 @@ class Generator:
 
             # Reward monsters along the path
             if path_exists:
-                monsters_on_path = self.count_entities_near_path(
-                    dungeon, start_pos, exit_pos, self.MONSTER, distance=2
+                monsters_on_path = self.count_positions_near_path(
+                    monster_positions, analysis.path_tiles, distance=2
                 )
                 fitness += monsters_on_path * 3
 
         # 4. Resource balance fitness (weight: 15)
-        potion_count = len(self.find_all_tiles(dungeon, self.POTION))
-        treasure_count = len(self.find_all_tiles(dungeon, self.TREASURE))
-        monster_count = len(self.find_all_tiles(dungeon, self.MONSTER))
+        potion_count = len(analysis.positions.get(self.POTION, []))
+        treasure_count = len(analysis.positions.get(self.TREASURE, []))
+        monster_count = len(monster_positions)
 
         # HEAVILY penalize too many monsters
         if monster_count > self.target_monster_count + 2:
@@ -319,13 +1285,11 @@ class Generator:
         fitness += max(0, 10 - abs(monster_count - self.target_monster_count) * 5)
 
         # 5. Playability fitness (weight: 10)
-        dead_end_count = self.count_dead_ends(dungeon)
-        fitness -= dead_end_count * 2  # Penalize too many dead ends
+        fitness -= analysis.dead_end_count * 2  # Penalize too many dead ends
 
         # 6. Maze-like quality (weight: 15) - NEW
-        wall_count = sum(row.count(self.WALL) for row in dungeon)
         total_tiles = self.width * self.height
-        wall_ratio = wall_count / total_tiles
+        wall_ratio = analysis.wall_count / total_tiles
 
         # Reward 50-65% wall coverage for maze feel
         if 0.50 <= wall_ratio <= 0.65:
@@ -360,8 +1324,8 @@ class Generator:
                 y -= 1
 
             # Occasionally move randomly for more interesting paths
-            if random.random() < 0.2:
-                direction = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+            if self.rng.random() < 0.2:
+                direction = self.rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
                 nx, ny = x + direction[0], y + direction[1]
                 if 0 <= nx < self.height and 0 <= ny < self.width:
                     x, y = nx, ny
@@ -424,6 +1388,10 @@ class Generator:
                     count += 1
         return count
 
+    def count_wall_tiles(self, dungeon: List[List[str]]) -> int:
+        """Count all wall tiles"""
+        return sum(row.count(self.WALL) for row in dungeon)
+
     def count_dead_ends(self, dungeon: List[List[str]]) -> int:
         """Count tiles with only one exit (dead ends)"""
         dead_ends = 0
@@ -495,9 +1463,18 @@ class Generator:
             return 0
 
         entity_positions = self.find_all_tiles(dungeon, entity_type)
+        return self.count_positions_near_path(entity_positions, path_tiles, distance)
+
+    def count_positions_near_path(
+        self,
+        positions: List[Tuple[int, int]],
+        path_tiles: List[Tuple[int, int]],
+        distance: int = 2,
+    ) -> int:
+        """Count positions within a Manhattan distance of any path tile"""
         count = 0
 
-        for entity_pos in entity_positions:
+        for entity_pos in positions:
             for path_pos in path_tiles:
                 manhattan_dist = abs(entity_pos[0] - path_pos[0]) + abs(
                     entity_pos[1] - path_pos[1]
@@ -512,67 +1489,129 @@ class Generator:
         self, dungeon: List[List[str]], start: Tuple[int, int], end: Tuple[int, int]
     ) -> List[Tuple[int, int]]:
         """Get tiles along the shortest path"""
-        queue = deque([(start, [start])])
-        visited = {start}
+        distances, predecessors = self.bfs(dungeon, start, end)
+        if end not in distances:
+            return []
+        return self.trace_path(predecessors, start, end)
 
-        while queue:
-            (x, y), path = queue.popleft()
+    def bfs(
+        self,
+        dungeon: List[List[str]],
+        start: Tuple[int, int],
+        end: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[Dict[Tuple[int, int], int], Dict[Tuple[int, int], Tuple[int, int]]]:
+        """
+        BFS from start over non-wall tiles, stopping early once `end` is
+        reached. Returns (distances, predecessors) keyed by position.
+        """
+        height, width, wall = self.height, self.width, self.WALL
+        distances = {start: 0}
+        predecessors: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        queue = deque([start])
 
-            if (x, y) == end:
-                return path
+        while queue:
+            position = queue.popleft()
+            if position == end:
+                break
+            x, y = position
+            dist = distances[position] + 1
 
             for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                 nx, ny = x + dx, y + dy
                 if (
-                    0 <= nx < self.height
-                    and 0 <= ny < self.width
-                    and (nx, ny) not in visited
-                    and dungeon[nx][ny] != self.WALL
+                    0 <= nx < height
+                    and 0 <= ny < width
+                    and (nx, ny) not in distances
+                    and dungeon[nx][ny] != wall
                 ):
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), path + [(nx, ny)]))
+                    distances[(nx, ny)] = dist
+                    predecessors[(nx, ny)] = position
+                    queue.append((nx, ny))
 
-        return []
+        return distances, predecessors
+
+    def trace_path(
+        self,
+        predecessors: Dict[Tuple[int, int], Tuple[int, int]],
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+    ) -> List[Tuple[int, int]]:
+        """Walk the predecessor map back from end to start"""
+        path = [end]
+        while path[-1] != start:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+        return path
 
     def selection(
         self, population: List[List[List[str]]], fitnesses: List[float]
     ) -> List[List[str]]:
-        """Tournament selection"""
+        """
+        Tournament selection. The winner is returned by reference: evaluated
+        genomes are treated as immutable and only fresh children get written.
+        """
+        return population[self.tournament_index(fitnesses)]
+
+    def tournament_index(self, fitnesses: List[float]) -> int:
+        """Index of the winner of one tournament"""
         tournament_size = 5
-        tournament_indices = random.sample(range(len(population)), tournament_size)
+        tournament_indices = self.rng.sample(range(len(fitnesses)), tournament_size)
         tournament_fitnesses = [fitnesses[i] for i in tournament_indices]
-        winner_idx = tournament_indices[
-            tournament_fitnesses.index(max(tournament_fitnesses))
-        ]
-        return copy.deepcopy(population[winner_idx])
+        return tournament_indices[tournament_fitnesses.index(max(tournament_fitnesses))]
+
+    def census_of(self, dungeon: List[List[str]]) -> TileCensus:
+        """Build the tile census of a dungeon with one scan"""
+        return TileCensus.from_dungeon(dungeon, self.WALL, self.FLOOR)
 
     def crossover(
         self, parent1: List[List[str]], parent2: List[List[str]]
     ) -> List[List[str]]:
         """Two-point crossover with repair"""
-        child = [[self.FLOOR for _ in range(self.width)] for _ in range(self.height)]
+        return self.crossover_with_census(parent1, None, parent2, None)[0]
 
+    def crossover_with_census(
+        self,
+        parent1: List[List[str]],
+        census1: Optional[TileCensus],
+        parent2: List[List[str]],
+        census2: Optional[TileCensus],
+    ) -> Tuple[List[List[str]], TileCensus]:
+        """
+        Crossover that also returns the child's census, merged from the
+        parents' censuses at the split row instead of rescanned
+        """
         # Random crossover point (horizontal split)
-        crossover_row = random.randint(1, self.height - 2)
+        crossover_row = self.rng.randint(1, self.height - 2)
 
-        # Copy top part from parent1, bottom from parent2
-        for i in range(self.height):
-            for j in range(self.width):
-                if i < crossover_row:
-                    child[i][j] = parent1[i][j]
-                else:
-                    child[i][j] = parent2[i][j]
+        # Copy top part from parent1, bottom from parent2. The parents are
+        # shared with the population, so the child gets its own rows.
+        child = [row[:] for row in parent1[:crossover_row]]
+        child.extend(row[:] for row in parent2[crossover_row:])
+
+        census = TileCensus.merge_rows(
+            census1 if census1 is not None else self.census_of(parent1),
+            census2 if census2 is not None else self.census_of(parent2),
+            crossover_row,
+        )
 
         # Repair: ensure exactly one start and one exit
-        self.repair_dungeon(child)
+        self.repair_dungeon(child, census)
 
-        return child
+        return child, census
+
+    def mutate(
+        self, dungeon: List[List[str]], census: Optional[TileCensus] = None
+    ) -> List[List[str]]:
+        """
+        Apply random mutations to the dungeon. A census passed in is kept in
+        sync with the mutated dungeon.
+        """
+        if census is None:
+            census = self.census_of(dungeon)
 
-    def mutate(self, dungeon: List[List[str]]) -> List[List[str]]:
-        """Apply random mutations to the dungeon"""
         for i in range(self.height):
             for j in range(self.width):
-                if random.random() < self.mutation_rate:
+                if self.rng.random() < self.mutation_rate:
                     current_tile = dungeon[i][j]
 
                     # Don't mutate start or exit
@@ -580,97 +1619,97 @@ class Generator:
                         continue
 
                     # Count current entities
-                    current_monsters = len(self.find_all_tiles(dungeon, self.MONSTER))
-                    current_potions = len(self.find_all_tiles(dungeon, self.POTION))
-                    current_treasures = len(self.find_all_tiles(dungeon, self.TREASURE))
+                    current_monsters = census.count(self.MONSTER)
+                    current_potions = census.count(self.POTION)
+                    current_treasures = census.count(self.TREASURE)
 
                     # Random mutation with constraints
-                    mutation_type = random.random()
+                    mutation_type = self.rng.random()
                     if mutation_type < 0.3:  # REDUCED from 0.4 - less wall removal
                         # Toggle wall/floor (but prefer keeping walls)
                         if current_tile == self.WALL:
                             # Only remove wall 30% of the time
-                            if random.random() < 0.3:
-                                dungeon[i][j] = self.FLOOR
+                            if self.rng.random() < 0.3:
+                                census.set_tile(dungeon, i, j, self.FLOOR)
                         else:
-                            dungeon[i][j] = self.WALL
+                            census.set_tile(dungeon, i, j, self.WALL)
                     elif (
                         mutation_type < 0.4
                         and current_monsters < self.target_monster_count + 2
                     ):
                         # Add monster only if under limit
-                        dungeon[i][j] = self.MONSTER
+                        census.set_tile(dungeon, i, j, self.MONSTER)
                     elif (
                         mutation_type < 0.5
                         and current_treasures < self.target_treasure_count + 1
                     ):
                         # Add treasure only if under limit
-                        dungeon[i][j] = self.TREASURE
+                        census.set_tile(dungeon, i, j, self.TREASURE)
                     elif (
                         mutation_type < 0.6
                         and current_potions < self.target_potion_count + 1
                     ):
                         # Add potion only if under limit
-                        dungeon[i][j] = self.POTION
+                        census.set_tile(dungeon, i, j, self.POTION)
                     else:
                         # Convert to floor (less often now)
                         if current_tile != self.WALL:
-                            dungeon[i][j] = self.FLOOR
+                            census.set_tile(dungeon, i, j, self.FLOOR)
 
         # Ensure valid dungeon after mutation
-        self.repair_dungeon(dungeon)
+        self.repair_dungeon(dungeon, census)
 
         return dungeon
 
-    def repair_dungeon(self, dungeon: List[List[str]]) -> None:
+    def repair_dungeon(
+        self, dungeon: List[List[str]], census: Optional[TileCensus] = None
+    ) -> None:
         """Repair dungeon to ensure it has exactly one start and one exit"""
+        timer = self.phase_timer
+        if timer is not None:
+            timer.enter("repair")
+        if census is None:
+            census = self.census_of(dungeon)
+
         # Find all starts and exits
-        starts = self.find_all_tiles(dungeon, self.START)
-        exits = self.find_all_tiles(dungeon, self.EXIT)
+        starts = census.sorted_positions(self.START)
+        exits = census.sorted_positions(self.EXIT)
 
         # Remove extra starts
         if len(starts) > 1:
             for i in range(1, len(starts)):
-                dungeon[starts[i][0]][starts[i][1]] = self.FLOOR
+                census.set_tile(dungeon, starts[i][0], starts[i][1], self.FLOOR)
         elif len(starts) == 0:
             # Add a start at top-left
             x, y = 0, 0
             while dungeon[x][y] == self.WALL and x < self.height - 1:
                 x += 1
-            dungeon[x][y] = self.START
+            census.set_tile(dungeon, x, y, self.START)
 
         # Remove extra exits
         if len(exits) > 1:
             for i in range(1, len(exits)):
-                dungeon[exits[i][0]][exits[i][1]] = self.FLOOR
+                census.set_tile(dungeon, exits[i][0], exits[i][1], self.FLOOR)
         elif len(exits) == 0:
             # Add an exit at bottom-right
             x, y = self.height - 1, self.width - 1
             while dungeon[x][y] == self.WALL and x > 0:
                 x -= 1
-            dungeon[x][y] = self.EXIT
-
-        # NEW: Remove excess monsters
-        monsters = self.find_all_tiles(dungeon, self.MONSTER)
-        if len(monsters) > self.target_monster_count + 2:
-            # Keep only target + 2 monsters, remove the rest
-            monsters_to_remove = monsters[self.target_monster_count + 2 :]
-            for pos in monsters_to_remove:
-                dungeon[pos[0]][pos[1]] = self.FLOOR
-
-        # NEW: Remove excess treasures
-        treasures = self.find_all_tiles(dungeon, self.TREASURE)
-        if len(treasures) > self.target_treasure_count + 1:
-            treasures_to_remove = treasures[self.target_treasure_count + 1 :]
-            for pos in treasures_to_remove:
-                dungeon[pos[0]][pos[1]] = self.FLOOR
-
-        # NEW: Remove excess potions
-        potions = self.find_all_tiles(dungeon, self.POTION)
-        if len(potions) > self.target_potion_count + 1:
-            potions_to_remove = potions[self.target_potion_count + 1 :]
-            for pos in potions_to_remove:
-                dungeon[pos[0]][pos[1]] = self.FLOOR
+            census.set_tile(dungeon, x, y, self.EXIT)
+
+        # Remove excess monsters, treasures and potions, keeping the first
+        # ones in row-major order
+        for tile, limit in (
+            (self.MONSTER, self.target_monster_count + 2),
+            (self.TREASURE, self.target_treasure_count + 1),
+            (self.POTION, self.target_potion_count + 1),
+        ):
+            if census.count(tile) > limit:
+                for pos in census.sorted_positions(tile)[limit:]:
+                    census.set_tile(dungeon, pos[0], pos[1], self.FLOOR)
+
+        if timer is not None:
+            timer.exit()
 
     def save_dungeon(self, dungeon: List[List[str]], stage_name: str) -> None:
         """Save dungeon to a .txt file in the stages directory"""
@@ -686,6 +1725,21 @@ class Generator:
         # Also save the config file
         self.save_config(stage_name)
 
+    def load_dungeon(self, stage_name: str) -> List[List[str]]:
+        """Load a dungeon from a .txt file in the stages directory"""
+        file_dir = path.dirname(__file__)
+        stage_file = path.join(file_dir, "stages", f"{stage_name}.txt")
+
+        with open(stage_file, "r") as f:
+            return [list(line.strip()) for line in f if line.strip()]
+
+    def to_rows(self, dungeon: List[List[str]]) -> List[str]:
+        """Dungeon as one string of tile characters per row"""
+        return ["".join(row) for row in dungeon]
+
+    def from_rows(self, rows: List[str]) -> List[List[str]]:
+        return [list(row) for row in rows]
+
     def print_dungeon(self, dungeon: List[List[str]]) -> None:
         """Print dungeon to console for debugging"""
         for row in dungeon:
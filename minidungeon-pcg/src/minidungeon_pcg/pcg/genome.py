@@ -0,0 +1,224 @@
+from typing import List, Sequence, Tuple
+import numpy as np
+
+
+# Tile codes used by the uint8 genome representation. The text characters
+# stay the on-disk format, see `encode` / `decode`.
+FLOOR = 0
+WALL = 1
+START = 2
+EXIT = 3
+MONSTER = 4
+POTION = 5
+TREASURE = 6
+
+TILE_CHARS = ".#SEMPT"
+NUM_TILE_TYPES = len(TILE_CHARS)
+CHAR_TO_CODE = {char: code for code, char in enumerate(TILE_CHARS)}
+
+_CODE_TO_CHAR = np.array(list(TILE_CHARS))
+
+
+def encode(dungeon: Sequence[Sequence[str]]) -> np.ndarray:
+    """Convert a dungeon of tile characters into an (H, W) uint8 array"""
+    return np.array(
+        [[CHAR_TO_CODE[tile] for tile in row] for row in dungeon], dtype=np.uint8
+    )
+
+
+def decode(grid: np.ndarray) -> List[List[str]]:
+    """Convert an (H, W) uint8 array back into rows of tile characters"""
+    return _CODE_TO_CHAR[grid].tolist()
+
+
+def tile_census(grid: np.ndarray) -> np.ndarray:
+    """Count every tile type, indexed by tile code"""
+    return np.bincount(grid.ravel(), minlength=NUM_TILE_TYPES)
+
+
+def open_neighbour_counts(grid: np.ndarray) -> np.ndarray:
+    """Number of non-wall 4-neighbours of every tile (out of bounds is wall).
+
+    Works on a single (H, W) grid or a stacked (..., H, W) population.
+    """
+    open_tiles = np.zeros(
+        grid.shape[:-2] + (grid.shape[-2] + 2, grid.shape[-1] + 2), dtype=np.uint8
+    )
+    open_tiles[..., 1:-1, 1:-1] = grid != WALL
+    return (
+        open_tiles[..., :-2, 1:-1]
+        + open_tiles[..., 2:, 1:-1]
+        + open_tiles[..., 1:-1, :-2]
+        + open_tiles[..., 1:-1, 2:]
+    )
+
+
+def count_dead_ends(grid: np.ndarray) -> int:
+    """Count non-wall tiles with at most one non-wall neighbour"""
+    dead_ends = (grid != WALL) & (open_neighbour_counts(grid) <= 1)
+    return int(np.count_nonzero(dead_ends))
+
+
+def count_dead_ends_batch(population: np.ndarray) -> np.ndarray:
+    """Dead-end count of every grid in a (P, H, W) population"""
+    dead_ends = (population != WALL) & (open_neighbour_counts(population) <= 1)
+    return np.count_nonzero(dead_ends, axis=(1, 2))
+
+
+def first_tile_index(population: np.ndarray, code: int) -> np.ndarray:
+    """Row-major flat index of the first tile with `code` per grid, -1 if absent"""
+    matches = (population == code).reshape(len(population), -1)
+    first = matches.argmax(axis=1)
+    return np.where(matches.any(axis=1), first, -1)
+
+
+def dilate(mask: np.ndarray) -> np.ndarray:
+    """Grow a (..., H, W) boolean mask by one step in the 4 directions"""
+    grown = mask.copy()
+    grown[..., 1:, :] |= mask[..., :-1, :]
+    grown[..., :-1, :] |= mask[..., 1:, :]
+    grown[..., :, 1:] |= mask[..., :, :-1]
+    grown[..., :, :-1] |= mask[..., :, 1:]
+    return grown
+
+
+# Neighbour order of the Generator BFS helpers as (row, col) offsets. The
+# batch flood fill mirrors it so ties between shortest paths break the same way.
+BFS_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def flood_fill_batch(
+    passable: np.ndarray, start: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Breadth-first flood fill over a whole (P, H, W) population at once.
+
+    `start` holds a flat start index per grid (-1 to skip the grid). Every
+    layer is expanded for all grids together with shifted boolean masks.
+
+    Returns (distances, predecessors): BFS distance per tile (-1 where not
+    reached) and the index into `BFS_DIRECTIONS` of the move that first
+    reached each tile, matching the discovery order of a FIFO queue BFS.
+    """
+    count, height, width = passable.shape
+    cells = height * width
+    unranked = 4 * cells + 4
+    rows = np.arange(count)
+
+    distances = np.full((count, height, width), -1, dtype=np.int32)
+    predecessors = np.full((count, height, width), -1, dtype=np.int8)
+    reached = np.zeros((count, height, width), dtype=bool)
+
+    # Queue position of every tile of the current frontier, padded so that
+    # out of bounds parents are never picked
+    rank = np.full((count, height + 2, width + 2), unranked, dtype=np.int64)
+
+    valid = start >= 0
+    start_rows, start_cols = np.divmod(start[valid], width)
+    distances[rows[valid], start_rows, start_cols] = 0
+    reached[rows[valid], start_rows, start_cols] = True
+    rank[rows[valid], start_rows + 1, start_cols + 1] = 0
+
+    layer = 0
+    while True:
+        best_key = np.full((count, height, width), unranked, dtype=np.int64)
+        best_direction = np.zeros((count, height, width), dtype=np.int8)
+        for direction, (dr, dc) in enumerate(BFS_DIRECTIONS):
+            parent_rank = rank[:, 1 - dr : 1 - dr + height, 1 - dc : 1 - dc + width]
+            key = parent_rank * 4 + direction
+            better = key < best_key
+            best_key[better] = key[better]
+            best_direction[better] = direction
+
+        discovered = (best_key < unranked) & passable & ~reached
+        if not discovered.any():
+            break
+
+        layer += 1
+        distances[discovered] = layer
+        predecessors[discovered] = best_direction[discovered]
+        reached |= discovered
+
+        # Dense queue order of the new layer within every grid
+        keys = np.where(discovered, best_key, unranked).reshape(count, cells)
+        order = np.argsort(keys, axis=1, kind="stable")
+        dense = np.empty_like(order)
+        dense[rows[:, None], order] = np.arange(cells)
+        rank[:, 1:-1, 1:-1] = np.where(
+            discovered, dense.reshape(count, height, width), unranked
+        )
+
+    return distances, predecessors
+
+
+def path_mask_batch(
+    predecessors: np.ndarray, distances: np.ndarray, end: np.ndarray
+) -> np.ndarray:
+    """Mark the tiles of the BFS path ending at flat index `end` per grid.
+
+    Grids whose end is -1 or unreached get an empty mask.
+    """
+    count, height, width = predecessors.shape
+    rows = np.arange(count)
+    path = np.zeros((count, height, width), dtype=bool)
+
+    end_rows, end_cols = np.divmod(np.maximum(end, 0), width)
+    remaining = np.where(end >= 0, distances[rows, end_rows, end_cols], -1)
+    offsets = np.array(BFS_DIRECTIONS)
+
+    active = remaining >= 0
+    while active.any():
+        path[rows[active], end_rows[active], end_cols[active]] = True
+        stepping = active & (remaining > 0)
+        direction = predecessors[rows[stepping], end_rows[stepping], end_cols[stepping]]
+        end_rows[stepping] -= offsets[direction, 0]
+        end_cols[stepping] -= offsets[direction, 1]
+        remaining -= 1
+        active = stepping
+
+    return path
+
+
+def min_pairwise_distance_batch(population: np.ndarray, code: int) -> np.ndarray:
+    """Minimum Manhattan distance between tiles with `code` per grid.
+
+    Grids with fewer than two such tiles get 0.
+    """
+    count = len(population)
+    grid_indices, rows, cols = np.nonzero(population == code)
+    counts = np.bincount(grid_indices, minlength=count)
+    slots_per_grid = int(counts.max(initial=0))
+    if slots_per_grid < 2:
+        return np.zeros(count, dtype=np.int64)
+
+    # Scatter the positions into (P, slots) arrays, unused slots stay masked
+    slots = np.arange(len(grid_indices)) - (np.cumsum(counts) - counts)[grid_indices]
+    used = np.zeros((count, slots_per_grid), dtype=bool)
+    pos_rows = np.zeros((count, slots_per_grid), dtype=np.int64)
+    pos_cols = np.zeros((count, slots_per_grid), dtype=np.int64)
+    used[grid_indices, slots] = True
+    pos_rows[grid_indices, slots] = rows
+    pos_cols[grid_indices, slots] = cols
+
+    distances = np.abs(pos_rows[:, :, None] - pos_rows[:, None, :]) + np.abs(
+        pos_cols[:, :, None] - pos_cols[:, None, :]
+    )
+    pairs = used[:, :, None] & used[:, None, :]
+    pairs &= ~np.eye(slots_per_grid, dtype=bool)
+    unset = population.shape[1] + population.shape[2]
+    nearest = np.where(pairs, distances, unset).min(axis=(1, 2))
+    return np.where(counts >= 2, nearest, 0)
+
+
+def find_all_tiles(grid: np.ndarray, code: int) -> List[Tuple[int, int]]:
+    """Row-major positions of every tile with the given code"""
+    rows, cols = np.nonzero(grid == code)
+    return list(zip(rows.tolist(), cols.tolist()))
+
+
+def find_tile(grid: np.ndarray, code: int) -> Tuple[int, int]:
+    """Row-major first position of a tile code, or None if absent"""
+    flat = np.flatnonzero(grid == code)
+    if flat.size == 0:
+        return None  # type: ignore
+    row, col = divmod(int(flat[0]), grid.shape[1])
+    return (row, col)
@@ -0,0 +1,182 @@
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import Manager
+from queue import Queue
+from typing import Any, List, Optional, Tuple
+import copy
+import time
+from minidungeon_pcg.pcg.census import TileCensus
+from minidungeon_pcg.pcg.generator import Generator
+
+# Longest wait for the neighbour's migrants before an island gives up
+MIGRATION_TIMEOUT_S = 600.0
+
+
+class IslandStopped(RuntimeError):
+    """Raised by an island that was told to stop because another one failed"""
+
+
+@dataclass
+class IslandReport:
+    """Outcome of an island-model run"""
+
+    best_dungeon: Any
+    best_fitness: float
+    best_island: int
+    # Best-so-far fitness per generation, for every island and overall
+    island_traces: List[List[float]] = field(default_factory=list)
+    global_trace: List[float] = field(default_factory=list)
+    evaluations: int = 0
+    wall_time: float = 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"Islands: {len(self.island_traces)}, evaluations: {self.evaluations}, "
+            f"wall time: {self.wall_time:.2f}s"
+        ]
+        for island, trace in enumerate(self.island_traces):
+            lines.append(f"  island {island}: best fitness {trace[-1]:.2f}")
+        lines.append(
+            f"  global: best fitness {self.best_fitness:.2f} (island {self.best_island})"
+        )
+        return "\n".join(lines)
+
+
+def _run_island(
+    generator: Generator,
+    island: int,
+    migration_interval: int,
+    migrants: int,
+    inbox: Queue,
+    outbox: Queue,
+    seed: Optional[int],
+    migration_timeout_s: float,
+) -> Tuple[int, Any, float, List[float], int]:
+    """
+    Evolve one sub-population, trading top individuals with the ring
+    neighbours. A None in the inbox means another island failed.
+    """
+    # Forked islands inherit the same RNG state, so always reseed
+    generator.rng.seed(f"{seed}:{island}" if seed is not None else None)
+
+    population = generator.initialize_population()
+    censuses: List[Optional[TileCensus]] = [
+        generator.census_of(dungeon) for dungeon in population
+    ]
+
+    best_fitness = float("-inf")
+    best_dungeon = None
+    trace = []
+    evaluations = 0
+
+    for generation in range(generator.generations):
+        fitnesses = generator.evaluate_population(population, censuses)
+        evaluations += len(population)
+
+        max_fitness_idx = fitnesses.index(max(fitnesses))
+        if fitnesses[max_fitness_idx] > best_fitness:
+            best_fitness = fitnesses[max_fitness_idx]
+            best_dungeon = generator.retain(population[max_fitness_idx])
+        trace.append(best_fitness)
+
+        last_generation = generation == generator.generations - 1
+        if (generation + 1) % migration_interval == 0 and not last_generation:
+            ranked = sorted(
+                range(len(fitnesses)), key=lambda i: fitnesses[i], reverse=True
+            )
+            outbox.put(
+                [
+                    (generator.retain(population[i]), fitnesses[i])
+                    for i in ranked[:migrants]
+                ]
+            )
+
+            immigrants = inbox.get(timeout=migration_timeout_s)
+            if immigrants is None:
+                raise IslandStopped(f"island {island} stopped: another island failed")
+
+            # Immigrants replace the worst individuals of this island
+            for i, (dungeon, fitness) in zip(reversed(ranked), immigrants):
+                population[i] = dungeon
+                censuses[i] = generator.census_of(dungeon)
+                fitnesses[i] = fitness
+
+        population, censuses, _ = generator.next_generation(
+            population, censuses, fitnesses
+        )
+
+    return island, best_dungeon, best_fitness, trace, evaluations
+
+
+def run_islands(
+    generator: Generator,
+    islands: int = 4,
+    migration_interval: int = 10,
+    migrants: int = 2,
+    seed: Optional[int] = None,
+    migration_timeout_s: float = MIGRATION_TIMEOUT_S,
+) -> IslandReport:
+    """
+    Island-model GA: `islands` sub-populations that together hold
+    population_size individuals (at least five each) evolve in separate
+    processes for `generator.generations` generations.
+    Every `migration_interval` generations each island sends its top
+    `migrants` individuals to the next island in a ring.
+
+    The first error of an island is raised here. The other islands are
+    told to stop through their inboxes, and an island waits at most
+    `migration_timeout_s` for migrants.
+    """
+    # The population is shared out evenly, the first islands take the rest
+    size, remainder = divmod(generator.population_size, islands)
+    island_generators = []
+    for island in range(islands):
+        island_generator = copy.copy(generator)
+        island_generator.population_size = max(
+            generator.elite_size + 1, 5, size + (1 if island < remainder else 0)
+        )
+        island_generators.append(island_generator)
+
+    start = time.perf_counter()
+    # Every island blocks on its neighbour, so all of them need a worker
+    with Manager() as manager, ProcessPoolExecutor(max_workers=islands) as pool:
+        queues: List[Queue] = [manager.Queue() for _ in range(islands)]
+        futures = [
+            pool.submit(
+                _run_island,
+                island_generators[island],
+                island,
+                migration_interval,
+                migrants,
+                queues[island],
+                queues[(island + 1) % islands],
+                seed,
+                migration_timeout_s,
+            )
+            for island in range(islands)
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        if any(future.exception() is not None for future in done):
+            for inbox in queues:
+                inbox.put(None)
+            wait(futures)
+            errors = [f.exception() for f in futures if f.exception() is not None]
+            # Raise the failure itself, not an island it stopped
+            raise next(
+                (error for error in errors if not isinstance(error, IslandStopped)),
+                errors[0],
+            )
+        outcomes = sorted(future.result() for future in futures)
+    wall_time = time.perf_counter() - start
+
+    island_traces = [outcome[3] for outcome in outcomes]
+    best_island = max(range(islands), key=lambda i: outcomes[i][2])
+    return IslandReport(
+        best_dungeon=outcomes[best_island][1],
+        best_fitness=outcomes[best_island][2],
+        best_island=best_island,
+        island_traces=island_traces,
+        global_trace=[max(values) for values in zip(*island_traces)],
+        evaluations=sum(outcome[4] for outcome in outcomes),
+        wall_time=wall_time,
+    )
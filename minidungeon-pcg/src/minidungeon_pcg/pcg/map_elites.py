@@ -0,0 +1,255 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import json
+import time
+from minidungeon_pcg.pcg.analysis import DungeonAnalysis
+from minidungeon_pcg.pcg.generator import Generator
+
+DESCRIPTORS = ("wall_ratio", "path_length", "monsters_on_path")
+
+Cell = Tuple[int, ...]
+
+
+@dataclass
+class Elite:
+    """Best dungeon found for one archive cell"""
+
+    rows: List[str]
+    fitness: float
+    wall_ratio: float
+    path_length: int
+    monsters_on_path: int
+
+    def descriptors(self) -> Tuple[float, ...]:
+        return tuple(getattr(self, name) for name in DESCRIPTORS)
+
+
+def describe(generator: Generator, analysis: DungeonAnalysis) -> Tuple[float, int, int]:
+    """
+    Behaviour descriptors of an analysed dungeon, measured the way the
+    fitness terms measure them: wall ratio, start -> exit path length and
+    monsters within distance 2 of that path.
+    """
+    wall_ratio = analysis.wall_count / (generator.width * generator.height)
+    monsters_on_path = 0
+    if analysis.path_exists:
+        monsters_on_path = generator.count_positions_near_path(
+            analysis.positions.get(generator.MONSTER, []),
+            analysis.path_tiles,
+            distance=2,
+        )
+    return wall_ratio, analysis.path_length, monsters_on_path
+
+
+class EliteArchive:
+    """
+    MAP-Elites archive: a grid over the DESCRIPTORS, each with a
+    (low, high, bins) range, holding the fittest dungeon seen per cell.
+    Descriptors outside a range fall into its first or last bin, so
+    `query` is a cell computation and one dict lookup.
+    """
+
+    def __init__(self, ranges: Dict[str, Tuple[float, float, int]]) -> None:
+        self.ranges = {name: tuple(ranges[name]) for name in DESCRIPTORS}
+        self.elites: Dict[Cell, Elite] = {}
+
+    @classmethod
+    def for_generator(cls, generator: Generator) -> "EliteArchive":
+        """Default ranges for the generator's map size and monster target"""
+        monsters = generator.target_monster_count + 2
+        return cls(
+            {
+                "wall_ratio": (0.3, 0.8, 10),
+                "path_length": (0, generator.width * generator.height // 2, 10),
+                "monsters_on_path": (0, monsters + 1, monsters + 1),
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.elites)
+
+    def __iter__(self) -> Iterator[Elite]:
+        return iter(self.elites.values())
+
+    @property
+    def size(self) -> int:
+        """Number of cells in the grid"""
+        size = 1
+        for _, _, bins in self.ranges.values():
+            size *= bins
+        return size
+
+    @property
+    def coverage(self) -> float:
+        return len(self.elites) / self.size
+
+    def cell(
+        self, wall_ratio: float, path_length: float, monsters_on_path: float
+    ) -> Cell:
+        cell = []
+        for value, (low, high, bins) in zip(
+            (wall_ratio, path_length, monsters_on_path), self.ranges.values()
+        ):
+            index = int((value - low) / (high - low) * bins)
+            cell.append(min(max(index, 0), bins - 1))
+        return tuple(cell)
+
+    def query(
+        self, wall_ratio: float, path_length: float, monsters_on_path: float
+    ) -> Optional[Elite]:
+        """Elite of the cell the descriptors fall into, None if still empty"""
+        return self.elites.get(self.cell(wall_ratio, path_length, monsters_on_path))
+
+    def insert(self, elite: Elite) -> bool:
+        """Keep `elite` if its cell is empty or holds a less fit one"""
+        cell = self.cell(*elite.descriptors())
+        current = self.elites.get(cell)
+        if current is not None and current.fitness >= elite.fitness:
+            return False
+        self.elites[cell] = elite
+        return True
+
+    def best(self) -> Optional[Elite]:
+        return max(self.elites.values(), key=lambda elite: elite.fitness, default=None)
+
+    def save(self, filename: str) -> None:
+        with open(filename, "w") as f:
+            json.dump(
+                {
+                    "ranges": self.ranges,
+                    "elites": [asdict(elite) for elite in self.elites.values()],
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, filename: str) -> "EliteArchive":
+        with open(filename, "r") as f:
+            data = json.load(f)
+        archive = cls(data["ranges"])
+        for elite in data["elites"]:
+            archive.insert(Elite(**elite))
+        return archive
+
+
+@dataclass
+class MapElitesReport:
+    """Outcome of a MAP-Elites run"""
+
+    archive: EliteArchive
+    iterations: int = 0
+    evaluations: int = 0
+    insertions: int = 0
+    wall_time: float = 0.0
+
+    def summary(self) -> str:
+        best = self.archive.best()
+        return (
+            f"MAP-Elites: {len(self.archive)}/{self.archive.size} cells filled "
+            f"({self.archive.coverage:.1%}), best fitness "
+            f"{best.fitness if best else float('-inf'):.2f}, "
+            f"{self.evaluations} evaluations, {self.insertions} insertions, "
+            f"wall time: {self.wall_time:.2f}s"
+        )
+
+
+def evaluate_elites(
+    generator: Generator,
+    dungeons: List[Any],
+    evaluate: Optional[Callable[[List[Any]], List[float]]] = None,
+) -> List[Elite]:
+    """
+    Fitness (with the playtest term, if any) and descriptors of each dungeon.
+    Fitness comes from `evaluate`, e.g. `ParallelEvaluator.evaluate`, or
+    else from the fitness cache, scoring the misses from the analyses the
+    descriptors need anyway.
+    """
+    analyses = [generator.analyze_dungeon(dungeon) for dungeon in dungeons]
+    if evaluate is None:
+        analysis_of = {id(d): analysis for d, analysis in zip(dungeons, analyses)}
+        fitnesses = generator.evaluate_cached(
+            dungeons,
+            lambda missing: [
+                generator.fitness_from_analysis(analysis_of[id(dungeon)])
+                for dungeon in missing
+            ],
+        )
+    else:
+        fitnesses = evaluate(dungeons)
+    return [
+        Elite(generator.to_rows(dungeon), fitness, *describe(generator, analysis))
+        for dungeon, analysis, fitness in zip(dungeons, analyses, fitnesses)
+    ]
+
+
+def run_map_elites(
+    generator: Generator,
+    iterations: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    archive: Optional[EliteArchive] = None,
+    seed: Optional[int] = None,
+    workers: int = 1,
+) -> MapElitesReport:
+    """
+    Fill an archive with the GA's own operators: an initial population,
+    then `iterations` (default generator.generations) batches of
+    `batch_size` (default population_size) children, each bred by
+    crossover and mutation of two elites drawn uniformly from the filled
+    cells. Passing an existing archive continues filling it.
+
+    workers > 1 scores fitness in a process pool, see `ParallelEvaluator`.
+    """
+    if seed is not None:
+        generator.rng.seed(seed)
+    iterations = generator.generations if iterations is None else iterations
+    batch_size = generator.population_size if batch_size is None else batch_size
+    archive = archive if archive is not None else EliteArchive.for_generator(generator)
+    report = MapElitesReport(archive)
+    start_time = time.perf_counter()
+
+    evaluator = None
+    if workers > 1:
+        from minidungeon_pcg.pcg.parallel import ParallelEvaluator
+
+        evaluator = ParallelEvaluator(generator, workers, seed=seed)
+    try:
+        _fill_archive(generator, archive, report, iterations, batch_size, evaluator)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+
+    report.wall_time = time.perf_counter() - start_time
+    return report
+
+
+def _fill_archive(
+    generator: Generator,
+    archive: EliteArchive,
+    report: MapElitesReport,
+    iterations: int,
+    batch_size: int,
+    evaluator: Any,
+) -> None:
+    evaluate = evaluator.evaluate if evaluator is not None else None
+    if not archive.elites:
+        population = generator.initialize_population()
+        for dungeon in population:
+            generator.repair_dungeon(dungeon)
+        for elite in evaluate_elites(generator, population, evaluate):
+            report.insertions += archive.insert(elite)
+        report.evaluations += len(population)
+
+    for _ in range(iterations):
+        elites = list(archive.elites.values())
+        children = []
+        for _ in range(batch_size):
+            parent1 = generator.from_rows(generator.rng.choice(elites).rows)
+            parent2 = generator.from_rows(generator.rng.choice(elites).rows)
+            child, census = generator.crossover_with_census(
+                parent1, None, parent2, None
+            )
+            children.append(generator.mutate(child, census))
+        for elite in evaluate_elites(generator, children, evaluate):
+            report.insertions += archive.insert(elite)
+        report.evaluations += len(children)
+        report.iterations += 1
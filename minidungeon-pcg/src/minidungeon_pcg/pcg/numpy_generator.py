@@ -0,0 +1,245 @@
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+from minidungeon_pcg.pcg import genome
+from minidungeon_pcg.pcg.analysis import DungeonAnalysis
+from minidungeon_pcg.pcg.census import TileCensus
+from minidungeon_pcg.pcg.generator import Generator
+
+
+class NumpyGenerator(Generator):
+    """
+    Generator backend where every dungeon is an (H, W) uint8 array of tile
+    codes (see `genome`). Grid metrics are vectorized; the text format is
+    only used when saving, loading and printing.
+    """
+
+    uses_tile_codes = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        # Tile types
+        self.WALL = genome.WALL
+        self.FLOOR = genome.FLOOR
+        self.START = genome.START
+        self.EXIT = genome.EXIT
+        self.MONSTER = genome.MONSTER
+        self.POTION = genome.POTION
+        self.TREASURE = genome.TREASURE
+
+    def compute_fitness_many(  # type: ignore[override]
+        self, population: List[np.ndarray]
+    ) -> List[float]:
+        if not population:
+            return []
+        return self.calculate_fitness_batch(np.stack(population)).tolist()
+
+    def genome_key(self, dungeon: np.ndarray) -> Hashable:  # type: ignore[override]
+        return dungeon.tobytes()
+
+    def calculate_fitness_batch(self, population: np.ndarray) -> np.ndarray:
+        """
+        Calculate `calculate_fitness` for a stacked (P, H, W) population at once.
+        Connectivity and path terms come from one flood fill over the whole
+        batch; every other term is a masked array reduction.
+        """
+        population = np.asarray(population, dtype=np.uint8)
+        count = len(population)
+        grids = np.arange(count)
+        total_tiles = self.width * self.height
+
+        start = genome.first_tile_index(population, self.START)
+        exit = genome.first_tile_index(population, self.EXIT)
+        valid = (start >= 0) & (exit >= 0)
+
+        passable = population != self.WALL
+        distances, predecessors = genome.flood_fill_batch(
+            passable, np.where(valid, start, -1)
+        )
+        exit_rows, exit_cols = np.divmod(np.maximum(exit, 0), self.width)
+        path_length = distances[grids, exit_rows, exit_cols]
+        path_exists = valid & (path_length >= 0)
+        path_length = np.maximum(path_length, 0)
+
+        fitness = np.zeros(count, dtype=np.float64)
+
+        # 1. Path length fitness
+        fitness -= np.where(path_exists, 0, 500)
+        long_enough = path_exists & (path_length >= self.min_path_length)
+        too_short = path_exists & ~long_enough
+        fitness += np.where(long_enough, np.minimum(30, path_length * 2), 0)
+        fitness -= np.where(too_short, (self.min_path_length - path_length) * 5, 0)
+
+        # 2. Connectivity fitness
+        reachable_tiles = np.count_nonzero(distances >= 0, axis=(1, 2))
+        total_floor_tiles = np.count_nonzero(passable, axis=(1, 2))
+        connectivity_ratio = reachable_tiles / np.maximum(total_floor_tiles, 1)
+        fitness += np.where(total_floor_tiles > 0, connectivity_ratio * 25, 0)
+
+        # 3. Enemy distribution fitness
+        monster_mask = population == self.MONSTER
+        monster_count = np.count_nonzero(monster_mask, axis=(1, 2))
+        min_distance = genome.min_pairwise_distance_batch(population, self.MONSTER)
+        fitness += np.where(monster_count > 0, np.minimum(20, min_distance * 4), 0)
+
+        path_tiles = genome.path_mask_batch(
+            predecessors, distances, np.where(path_exists, exit, -1)
+        )
+        near_path = genome.dilate(genome.dilate(path_tiles))
+        monsters_on_path = np.count_nonzero(monster_mask & near_path, axis=(1, 2))
+        fitness += np.where((monster_count > 0) & path_exists, monsters_on_path * 3, 0)
+
+        # 4. Resource balance fitness
+        potion_count = np.count_nonzero(population == self.POTION, axis=(1, 2))
+        treasure_count = np.count_nonzero(population == self.TREASURE, axis=(1, 2))
+
+        monster_limit = self.target_monster_count + 2
+        fitness -= np.where(
+            monster_count > monster_limit, (monster_count - monster_limit) * 50, 0
+        )
+        fitness += np.maximum(
+            0, 10 - np.abs(potion_count - self.target_potion_count) * 3
+        )
+        fitness += np.maximum(
+            0, 5 - np.abs(treasure_count - self.target_treasure_count) * 2
+        )
+        fitness += np.maximum(
+            0, 10 - np.abs(monster_count - self.target_monster_count) * 5
+        )
+
+        # 5. Playability fitness
+        fitness -= genome.count_dead_ends_batch(population) * 2
+
+        # 6. Maze-like quality
+        wall_ratio = np.count_nonzero(~passable, axis=(1, 2)) / total_tiles
+        maze_like = (0.50 <= wall_ratio) & (wall_ratio <= 0.65)
+        fitness += np.where(maze_like, 15, 0)
+        fitness -= np.where(maze_like, 0, np.abs(0.575 - wall_ratio) * 30)
+
+        long_path = path_exists & (path_length > self.min_path_length + 5)
+        fitness += np.where(
+            long_path,
+            np.minimum(10, (path_length - self.min_path_length) * 1.5),
+            0,
+        )
+
+        return np.where(valid, fitness, -1000.0)
+
+    def new_grid(self, fill: int) -> np.ndarray:  # type: ignore[override]
+        return np.full((self.height, self.width), fill, dtype=np.uint8)
+
+    def count_floor_tiles(self, dungeon: np.ndarray) -> int:  # type: ignore[override]
+        return int(np.count_nonzero(dungeon != self.WALL))
+
+    def count_wall_tiles(self, dungeon: np.ndarray) -> int:  # type: ignore[override]
+        return int(np.count_nonzero(dungeon == self.WALL))
+
+    def count_dead_ends(self, dungeon: np.ndarray) -> int:  # type: ignore[override]
+        return genome.count_dead_ends(dungeon)
+
+    def find_tile(self, dungeon: np.ndarray, tile_type: int) -> Tuple[int, int]:  # type: ignore[override]
+        return genome.find_tile(dungeon, tile_type)
+
+    def find_all_tiles(  # type: ignore[override]
+        self, dungeon: np.ndarray, tile_type: int
+    ) -> List[Tuple[int, int]]:
+        return genome.find_all_tiles(dungeon, tile_type)
+
+    # The BFS helpers walk the grid tile by tile, which is cheaper on nested
+    # lists than on array scalars, so they run on a list view of the codes.
+
+    def calculate_path_length(  # type: ignore[override]
+        self, dungeon: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]
+    ) -> Tuple[int, bool]:
+        return super().calculate_path_length(dungeon.tolist(), start, end)
+
+    def count_reachable_tiles(  # type: ignore[override]
+        self, dungeon: np.ndarray, start: Tuple[int, int]
+    ) -> int:
+        return super().count_reachable_tiles(dungeon.tolist(), start)
+
+    def analyze_dungeon(self, dungeon: np.ndarray) -> DungeonAnalysis:  # type: ignore[override]
+        """
+        `Generator.analyze_dungeon` with a vectorized scan: the wall count
+        from the tile census, dead ends from the neighbour sums and the
+        entity positions from one lookup of every tile that is neither
+        wall nor floor.
+        """
+        counts = genome.tile_census(dungeon)
+        entities = np.flatnonzero((dungeon != self.WALL) & (dungeon != self.FLOOR))
+        positions: Dict[Any, List[Tuple[int, int]]] = {}
+        for index, tile in zip(entities.tolist(), dungeon.ravel()[entities].tolist()):
+            positions.setdefault(tile, []).append(divmod(index, self.width))
+
+        starts = positions.get(self.START)
+        exits = positions.get(self.EXIT)
+        wall_count = int(counts[self.WALL])
+        analysis = DungeonAnalysis(
+            start=starts[0] if starts else None,
+            exit=exits[0] if exits else None,
+            positions=positions,
+            wall_count=wall_count,
+            floor_count=dungeon.size - wall_count,
+            dead_end_count=genome.count_dead_ends(dungeon),
+        )
+        if analysis.start is not None:
+            self.search_from_start(dungeon.tolist(), analysis)
+        return analysis
+
+    def changed_cells(  # type: ignore[override]
+        self, before: np.ndarray, after: np.ndarray
+    ) -> List[Tuple[int, int]]:
+        rows, cols = np.nonzero(before != after)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def analyze_delta(  # type: ignore[override]
+        self,
+        parent_analysis: DungeonAnalysis,
+        parent: np.ndarray,
+        child: np.ndarray,
+        changed: List[Tuple[int, int]],
+    ) -> Optional[DungeonAnalysis]:
+        return super().analyze_delta(
+            parent_analysis, parent.tolist(), child.tolist(), changed
+        )
+
+    def get_path_tiles(  # type: ignore[override]
+        self, dungeon: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        return super().get_path_tiles(dungeon.tolist(), start, end)
+
+    def census_of(self, dungeon: np.ndarray) -> TileCensus:  # type: ignore[override]
+        return TileCensus.from_dungeon(dungeon.tolist(), self.WALL, self.FLOOR)
+
+    def crossover_with_census(  # type: ignore[override]
+        self,
+        parent1: np.ndarray,
+        census1: Optional[TileCensus],
+        parent2: np.ndarray,
+        census2: Optional[TileCensus],
+    ) -> Tuple[np.ndarray, TileCensus]:
+        """Horizontal split crossover with repair"""
+        crossover_row = self.rng.randint(1, self.height - 2)
+        child = np.concatenate((parent1[:crossover_row], parent2[crossover_row:]))
+        census = TileCensus.merge_rows(
+            census1 if census1 is not None else self.census_of(parent1),
+            census2 if census2 is not None else self.census_of(parent2),
+            crossover_row,
+        )
+        self.repair_dungeon(child, census)  # type: ignore[arg-type]
+        return child, census
+
+    def save_dungeon(self, dungeon: np.ndarray, stage_name: str) -> None:  # type: ignore[override]
+        super().save_dungeon(genome.decode(dungeon), stage_name)
+
+    def load_dungeon(self, stage_name: str) -> np.ndarray:  # type: ignore[override]
+        return genome.encode(super().load_dungeon(stage_name))
+
+    def to_rows(self, dungeon: np.ndarray) -> List[str]:  # type: ignore[override]
+        return super().to_rows(genome.decode(dungeon))
+
+    def from_rows(self, rows: List[str]) -> np.ndarray:  # type: ignore[override]
+        return genome.encode(rows)
+
+    def print_dungeon(self, dungeon: np.ndarray) -> None:  # type: ignore[override]
+        super().print_dungeon(genome.decode(dungeon))
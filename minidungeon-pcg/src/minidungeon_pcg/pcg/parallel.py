@@ -0,0 +1,199 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from minidungeon_pcg.pcg import genome
+from minidungeon_pcg.pcg.generator import Generator
+
+
+# Per-process state of the evaluation workers
+_worker_generator: Optional[Generator] = None
+_worker_segments: Dict[str, SharedMemory] = {}
+
+
+def _init_worker(generator: Generator) -> None:
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _evaluate_chunk(
+    segment_name: str,
+    shape: Tuple[int, int, int],
+    start: int,
+    stop: int,
+    seed: Optional[int],
+) -> List[float]:
+    """Evaluate population[start:stop] straight from the shared memory block"""
+    assert _worker_generator is not None
+    if segment_name not in _worker_segments:
+        for segment in _worker_segments.values():
+            segment.close()
+        _worker_segments.clear()
+        _worker_segments[segment_name] = SharedMemory(name=segment_name, track=False)
+
+    buffer = _worker_segments[segment_name].buf
+    codes = np.ndarray(shape, dtype=np.uint8, buffer=buffer)[start:stop]
+
+    # Fitness is deterministic today, but stochastic terms must not depend
+    # on which process picked up the chunk
+    if seed is not None:
+        _worker_generator.rng.seed(seed)
+
+    if _worker_generator.uses_tile_codes:
+        population = list(codes.copy())
+    else:
+        population = [genome.decode(grid) for grid in codes]
+    return _worker_generator.compute_fitness_many(population)
+
+
+class ParallelEvaluator:
+    """
+    Spreads fitness evaluation over a pool of worker processes.
+
+    The population is written as uint8 tile codes into one shared memory
+    block that the workers read from, so only chunk bounds and fitness
+    values cross the process boundary.
+    """
+
+    def __init__(
+        self, generator: Generator, workers: int, seed: Optional[int] = None
+    ) -> None:
+        self.generator = generator
+        self.workers = workers
+        self.seed = seed
+        self.evaluations = 0
+        self._segment: Optional[SharedMemory] = None
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(generator,)
+        )
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def evaluate(self, population: Sequence) -> List[float]:
+        """Calculate the fitness of every individual in the population"""
+        return self.generator.evaluate_cached(list(population), self._evaluate_remote)
+
+    def _evaluate_remote(self, population: Sequence) -> List[float]:
+        if not population:
+            return []
+        shape = (len(population), self.generator.height, self.generator.width)
+        codes = self._shared_array(shape)
+        for i, dungeon in enumerate(population):
+            codes[i] = (
+                dungeon if self.generator.uses_tile_codes else genome.encode(dungeon)
+            )
+
+        assert self._segment is not None
+        futures = []
+        for chunk, (start, stop) in enumerate(self._chunks(len(population))):
+            seed = None
+            if self.seed is not None:
+                seed = hash((self.seed, self.evaluations, chunk))
+            futures.append(
+                self._pool.submit(
+                    _evaluate_chunk, self._segment.name, shape, start, stop, seed
+                )
+            )
+        self.evaluations += 1
+
+        fitnesses: List[float] = []
+        for future in futures:
+            fitnesses.extend(future.result())
+        return fitnesses
+
+    def close(self) -> None:
+        self._pool.shutdown()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+            self._segment = None
+
+    def _chunks(self, count: int) -> List[Tuple[int, int]]:
+        """Split the population into one contiguous chunk per worker"""
+        size, remainder = divmod(count, self.workers)
+        chunks = []
+        start = 0
+        for i in range(self.workers):
+            stop = start + size + (1 if i < remainder else 0)
+            if stop > start:
+                chunks.append((start, stop))
+            start = stop
+        return chunks
+
+    def _shared_array(self, shape: Tuple[int, int, int]) -> np.ndarray:
+        """View of the shared block, reallocated when the population grows"""
+        size = shape[0] * shape[1] * shape[2]
+        if self._segment is None or self._segment.size < size:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment.unlink()
+            self._segment = SharedMemory(create=True, size=max(size, 1))
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._segment.buf)
+
+
+@dataclass
+class GeneratedStage:
+    """One finished dungeon from `Generator.generate_many`"""
+
+    seed: int
+    dungeon: Any
+    fitness: float
+
+
+def _generate_stage(seed: int) -> GeneratedStage:
+    """Run one full, quiet GA in a worker process"""
+    assert _worker_generator is not None
+    return generate_stage(_worker_generator, seed)
+
+
+def generate_stage(generator: Generator, seed: int) -> GeneratedStage:
+    """Run one full, quiet GA with `generator` in this process"""
+    dungeon = generator.generate_dungeon(seed=seed, save=False, verbose=False)
+    return GeneratedStage(seed, dungeon, generator.calculate_fitness(dungeon))
+
+
+def generate_stages(
+    generator: Generator,
+    seeds: Iterable[int],
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[GeneratedStage]:
+    """
+    Yield one generated stage per seed in completion order. At most
+    `max_in_flight` runs are submitted at a time, so seeds are consumed
+    lazily and finished stages never pile up in the pool. Closing the
+    iterator early cancels the runs that have not started yet.
+    """
+    if workers <= 1:
+        for seed in seeds:
+            yield generate_stage(generator, seed)
+        return
+
+    limit = max_in_flight or 2 * workers
+    pending_seeds = iter(seeds)
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(generator,)
+    )
+    try:
+        in_flight: Set[Future] = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < limit:
+                seed = next(pending_seeds, None)
+                if seed is None:
+                    exhausted = True
+                else:
+                    in_flight.add(pool.submit(_generate_stage, seed))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # A consumer that stops early only waits for the runs already started
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+import random
+from minidungeon_pcg.envs.agent.md_treasure_agent import MdTreasureAgent
+
+
+@dataclass
+class PlaytestResult:
+    """Outcome of one headless MdTreasureAgent episode"""
+
+    exit_reached: bool
+    died: bool
+    hp: int
+    treasures: int
+    monsters_killed: int
+    steps: int
+
+
+def simulate(
+    rows: Sequence[Sequence[str]],
+    max_steps: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> PlaytestResult:
+    """
+    Play one stage with MdTreasureAgent exactly as `MdEnv.step` drives it
+    (select_action, then take_action on the live grid), without a renderer.
+
+    The episode ends on the exit, on death, when the agent has no feasible
+    action left (it would noop forever) or after max_steps (default four
+    times the number of tiles).
+
+    The agent breaks ties between actions with its own generator, seeded
+    with `seed` or else with the stage text, so a stage always plays out
+    the same way.
+    """
+    grid = [list(row) for row in rows]
+    rng = random.Random("\n".join(map("".join, grid)) if seed is None else seed)
+    height = len(grid)
+    width = max((len(row) for row in grid), default=0)
+    if max_steps is None:
+        max_steps = 4 * width * height
+
+    agent = MdTreasureAgent(rng=rng)
+    agent.position = next(
+        (
+            (x, y)
+            for y, row in enumerate(grid)
+            for x, tile in enumerate(row)
+            if tile == "S"
+        ),
+        (0, 0),
+    )
+    agent.hp = agent.max_hp
+    treasures = sum(row.count("T") for row in grid)
+    monsters = sum(row.count("M") for row in grid)
+
+    steps = 0
+    terminated = False
+    while steps < max_steps and not terminated:
+        selected = agent.select_action(agent.standard_vector, grid)
+        if selected is None:
+            break
+        _, _, terminated, _, _, grid, _ = agent.take_action(
+            selected, grid, width, height
+        )
+        steps += 1
+
+    return PlaytestResult(
+        exit_reached=terminated and agent.hp > 0,
+        died=agent.hp <= 0,
+        hp=agent.hp,
+        treasures=treasures - sum(row.count("T") for row in grid),
+        monsters_killed=monsters - sum(row.count("M") for row in grid),
+        steps=steps,
+    )
+
+
+def _simulate_many(
+    stages: List[Sequence[Sequence[str]]], max_steps: Optional[int]
+) -> List[PlaytestResult]:
+    return [simulate(rows, max_steps) for rows in stages]
+
+
+class PlaytestFitness:
+    """
+    Optional fitness component from headless playtests: pass one to
+    `Generator(playtest=...)` and every evaluated dungeon is played by
+    MdTreasureAgent, adding
+
+        weight * (EXIT * exit reached + TREASURE * treasures
+                  + KILL * monsters killed + DEAD * died)
+
+    to its static fitness. The rewards default to the REWARDS of the stage
+    config. With workers > 1 the episodes run in a process pool that lives
+    until `close`.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        weight: float = 1.0,
+        max_steps: Optional[int] = None,
+        rewards: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.workers = workers
+        self.weight = weight
+        self.max_steps = max_steps
+        self.rewards = rewards or {"EXIT": 20, "TREASURE": 3, "KILL": 4, "DEAD": -20}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __getstate__(self) -> Dict[str, object]:
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def __enter__(self) -> "PlaytestFitness":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def parameters(self) -> Dict[str, object]:
+        """Settings that change the score, for cache keys"""
+        return {"weight": self.weight, "max_steps": self.max_steps, **self.rewards}
+
+    def play(self, stages: List[Sequence[Sequence[str]]]) -> List[PlaytestResult]:
+        """Simulate every stage (rows of tile characters)"""
+        if self.workers <= 1 or len(stages) < 2:
+            return _simulate_many(stages, self.max_steps)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        size = -(-len(stages) // self.workers)
+        futures = [
+            self._pool.submit(_simulate_many, stages[i : i + size], self.max_steps)
+            for i in range(0, len(stages), size)
+        ]
+        results: List[PlaytestResult] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def score(self, result: PlaytestResult) -> float:
+        return self.weight * (
+            self.rewards["EXIT"] * result.exit_reached
+            + self.rewards["TREASURE"] * result.treasures
+            + self.rewards["KILL"] * result.monsters_killed
+            + self.rewards["DEAD"] * result.died
+        )
+
+    def scores(self, stages: List[Sequence[Sequence[str]]]) -> List[float]:
+        return [self.score(result) for result in self.play(stages)]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,89 @@
+from os import path
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+
+
+DEFAULT_CACHE_DIR = path.join(
+    path.expanduser("~"), ".cache", "minidungeon-pcg", "stages"
+)
+
+# Bump whenever the GA or fitness function changes in a way that alters the
+# result of a seeded run, so stale entries are never served
+CACHE_VERSION = 1
+
+
+class StageCache:
+    """
+    Content-addressed on-disk cache of finished GA runs. Entries are keyed by
+    a hash of the generator parameters, fitness constants and seed, and hold
+    the best dungeon as text rows plus the best-fitness trace.
+
+    The total size is capped at `max_bytes`; the least recently used entries
+    (by file modification time, refreshed on every hit) are evicted first.
+    """
+
+    def __init__(
+        self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(parameters: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"version": CACHE_VERSION, **parameters}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[List[str], List[float]]]:
+        """Return (dungeon rows, fitness trace) for a key, or None"""
+        entry_file = self._entry_file(key)
+        try:
+            with open(entry_file, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(entry_file)
+        return entry["dungeon"], entry["fitness_trace"]
+
+    def put(self, key: str, rows: List[str], fitness_trace: List[float]) -> None:
+        entry_file = self._entry_file(key)
+        temp_file = f"{entry_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as f:
+            json.dump({"dungeon": rows, "fitness_trace": fitness_trace}, f)
+        os.replace(temp_file, entry_file)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(path.join(self.directory, name))
+
+    def _entry_file(self, key: str) -> str:
+        return path.join(self.directory, f"{key}.json")
@@ -43,6 +43,7 @@ class StageRenderer:
         self.height = 0
         self.tile_size = 16
         self.start_pos: Optional[Tuple[int, int]] = None
+        self.stage_file: Optional[str] = None
         self.sprites: dict[str, Optional[pygame.Surface]] = {}
 
         current_dir = path.dirname(__file__)
@@ -51,6 +52,7 @@ class StageRenderer:
 
     def _load_file(self, current_dir: str, stage_name: str):
         stage_file = path.join(current_dir, "stages", f"{stage_name}.txt")
+        self.stage_file = stage_file
         with open(stage_file, "r") as f:
             texts = [s.strip() for s in f]
         self._load_from_lines(texts)
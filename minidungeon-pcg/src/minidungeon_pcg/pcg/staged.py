@@ -0,0 +1,194 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from minidungeon_pcg.pcg import bitboard
+from minidungeon_pcg.pcg.census import TileCensus
+
+if TYPE_CHECKING:
+    from minidungeon_pcg.pcg.generator import Generator
+
+STAGES = ("census", "connectivity", "analysis")
+
+# Below this many tiles (16x16) staging measured no faster than full evaluation
+MIN_TILES = 256
+
+
+class StagedFitness:
+    """
+    Fitness evaluation in three stages of increasing cost, each of which
+    can settle an individual:
+
+    1. census: tile counts give the entity and wall ratio terms exactly and
+       a bound on the rest in O(1); a missing start or exit is exact.
+    2. connectivity: a layered bitboard flood fill from the start gives
+       the reachable tiles, path length and dead ends exactly; only the
+       monsters near the path stay bounded.
+    3. analysis: the full `Generator.analyze_dungeon`.
+
+    An individual whose upper bound after stage 1 or 2 is below
+    `threshold` cannot reach the tournament-relevant range and gets the
+    bound as its fitness. The threshold is the `quantile` of the previous
+    generation's fitnesses, so the best individuals are always exact. With
+    the default median, a rejected individual could only have won a
+    5-way tournament against other rejected ones (about 1 in 32).
+    Bounds are reported as inexact so they never enter the fitness cache.
+
+    Maps under `min_tiles` tiles are evaluated in full: there the full
+    analysis costs about as much as the stages and staging does not pay.
+
+    Pass one as `Generator(staged=...)`; per-generation rejection rates go
+    to GenerationProgress.rejection_rates and the observers.
+    """
+
+    def __init__(self, quantile: float = 0.5, min_tiles: int = MIN_TILES) -> None:
+        self.quantile = quantile
+        self.min_tiles = min_tiles
+        self.threshold = float("-inf")
+        self.counts = [0] * len(STAGES)
+        self.totals = [0] * len(STAGES)
+
+    def parameters(self) -> Dict[str, object]:
+        """Settings that change the run, for cache keys"""
+        return {"quantile": self.quantile, "min_tiles": self.min_tiles}
+
+    def reset(self) -> None:
+        self.threshold = float("-inf")
+        self.counts = [0] * len(STAGES)
+        self.totals = [0] * len(STAGES)
+
+    def update_threshold(self, fitnesses: List[float]) -> None:
+        ranked = sorted(fitnesses)
+        self.threshold = ranked[int(self.quantile * (len(ranked) - 1))]
+
+    def take(self) -> Dict[str, float]:
+        """Share of the evaluations settled by each stage since the last call"""
+        evaluated = sum(self.counts)
+        rates = {
+            stage: count / evaluated if evaluated else 0.0
+            for stage, count in zip(STAGES, self.counts)
+        }
+        self.totals = [total + count for total, count in zip(self.totals, self.counts)]
+        self.counts = [0] * len(STAGES)
+        return rates
+
+    def summary(self) -> str:
+        evaluated = sum(self.totals)
+        settled = ", ".join(
+            f"{stage} {count / evaluated if evaluated else 0.0:.1%}"
+            for stage, count in zip(STAGES, self.totals)
+        )
+        return f"Staged fitness: {evaluated} evaluations settled by {settled}"
+
+    def evaluate_many(
+        self,
+        generator: "Generator",
+        population: List[Any],
+        censuses: Optional[List[Optional[TileCensus]]] = None,
+    ) -> Tuple[List[float], List[bool]]:
+        """Fitnesses of the population and whether each one is exact"""
+        if generator.width * generator.height < self.min_tiles:
+            self.counts[2] += len(population)
+            fitnesses = generator.compute_fitness_many(population)
+            return fitnesses, [True] * len(population)
+        if censuses is None:
+            censuses = [None] * len(population)
+        results = [
+            self.evaluate(generator, dungeon, census)
+            for dungeon, census in zip(population, censuses)
+        ]
+        return [fitness for fitness, _ in results], [exact for _, exact in results]
+
+    def evaluate(
+        self,
+        generator: "Generator",
+        dungeon: Any,
+        census: Optional[TileCensus] = None,
+    ) -> Tuple[float, bool]:
+        """
+        Fitness of one dungeon and True, or an upper bound below the
+        threshold and False
+        """
+        if census is None:
+            census = generator.census_of(dungeon)
+
+        # Stage 1: census
+        starts = census.positions.get(generator.START)
+        exits = census.positions.get(generator.EXIT)
+        if not starts or not exits:
+            self.counts[0] += 1
+            return -1000.0, True  # Invalid dungeon
+
+        monster_count = census.count(generator.MONSTER)
+        # Spread is worth at most 20, each monster near the path 3
+        monsters = 20 + monster_count * 3 if monster_count else 0
+        floor_count = generator.width * generator.height - census.wall_count
+        exact = self.census_terms(generator, census)
+        bound = exact + self.path_terms(generator, floor_count - 1) + 25 + monsters
+        if bound < self.threshold:
+            self.counts[0] += 1
+            return bound, False
+
+        # Stage 2: connectivity
+        stride = bitboard.stride_of(generator.width)
+        passable = bitboard.open_mask(dungeon, generator.WALL)
+        reached, path_length = bitboard.flood_distance(
+            passable,
+            bitboard.bit(*min(starts), stride),
+            bitboard.bit(*min(exits), stride),
+            stride,
+        )
+        exact += reached.bit_count() / floor_count * 25
+        exact -= bitboard.count_dead_ends(passable, stride) * 2
+        if monster_count:
+            exact += min(
+                20,
+                generator.calculate_min_distance_between_entities(
+                    list(census.positions[generator.MONSTER])
+                )
+                * 4,
+            )
+        if path_length >= 0:
+            bound = exact + self.path_terms(generator, path_length)
+            bound += monster_count * 3
+        else:
+            bound = exact - 500
+        if bound < self.threshold:
+            self.counts[1] += 1
+            return bound, False
+
+        # Stage 3: full analysis
+        self.counts[2] += 1
+        return generator.fitness_from_analysis(generator.analyze_dungeon(dungeon)), True
+
+    @staticmethod
+    def census_terms(generator: "Generator", census: TileCensus) -> float:
+        """The `Generator.fitness_from_analysis` terms that only need tile counts"""
+        monster_count = census.count(generator.MONSTER)
+        potion_count = census.count(generator.POTION)
+        treasure_count = census.count(generator.TREASURE)
+        fitness = 0.0
+        if monster_count > generator.target_monster_count + 2:
+            fitness -= (monster_count - generator.target_monster_count - 2) * 50
+        fitness += max(0, 10 - abs(potion_count - generator.target_potion_count) * 3)
+        fitness += max(0, 5 - abs(treasure_count - generator.target_treasure_count) * 2)
+        fitness += max(0, 10 - abs(monster_count - generator.target_monster_count) * 5)
+
+        wall_ratio = census.wall_count / (generator.width * generator.height)
+        if 0.50 <= wall_ratio <= 0.65:
+            fitness += 15
+        else:
+            fitness -= abs(0.575 - wall_ratio) * 30
+        return fitness
+
+    @staticmethod
+    def path_terms(generator: "Generator", path_length: int) -> float:
+        """
+        The path length terms for an existing path. They grow with the
+        length, so a bound on the length bounds them.
+        """
+        minimum = generator.min_path_length
+        if path_length >= minimum:
+            fitness = min(30, path_length * 2)
+        else:
+            fitness = -(minimum - path_length) * 5
+        if path_length > minimum + 5:
+            fitness += min(10, (path_length - minimum) * 1.5)
+        return fitness
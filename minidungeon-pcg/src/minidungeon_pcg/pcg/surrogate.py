@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+import numpy as np
+from minidungeon_pcg.pcg import genome
+
+if TYPE_CHECKING:
+    from minidungeon_pcg.pcg.generator import Generator
+
+
+@dataclass
+class ScreeningResult:
+    """How one generation was split between exact and surrogate scores"""
+
+    # Individuals whose fitness is exact (scored or served from the cache)
+    exact_indices: List[int]
+    evaluations_saved: int = 0
+    # Mean absolute surrogate error on the individuals scored this generation
+    error: Optional[float] = None
+
+
+def grid_features(generator: "Generator", codes: np.ndarray) -> np.ndarray:
+    """
+    Cheap per-grid features of a (P, H, W) population of tile codes that
+    follow the static fitness terms: entity counts against their targets,
+    wall ratio against the maze band, dead ends and the start/exit spread.
+    No flood fill, so connectivity is left to the exact evaluation.
+    """
+    count, height, width = codes.shape
+    census = np.stack(
+        [
+            np.count_nonzero(codes == code, axis=(1, 2))
+            for code in range(genome.NUM_TILE_TYPES)
+        ],
+        axis=1,
+    )
+    monsters = census[:, genome.MONSTER]
+    potions = census[:, genome.POTION]
+    treasures = census[:, genome.TREASURE]
+    wall_ratio = census[:, genome.WALL] / (height * width)
+
+    start = genome.first_tile_index(codes, genome.START)
+    exit = genome.first_tile_index(codes, genome.EXIT)
+    start_rows, start_cols = np.divmod(np.maximum(start, 0), width)
+    exit_rows, exit_cols = np.divmod(np.maximum(exit, 0), width)
+    spread = np.abs(start_rows - exit_rows) + np.abs(start_cols - exit_cols)
+    valid = (start >= 0) & (exit >= 0)
+
+    return np.column_stack(
+        [
+            np.ones(count),
+            valid,
+            np.where(valid, spread, 0),
+            np.abs(monsters - generator.target_monster_count),
+            np.maximum(0, monsters - generator.target_monster_count - 2),
+            np.abs(potions - generator.target_potion_count),
+            np.abs(treasures - generator.target_treasure_count),
+            monsters > 0,
+            wall_ratio,
+            (0.50 <= wall_ratio) & (wall_ratio <= 0.65),
+            np.abs(0.575 - wall_ratio),
+            genome.count_dead_ends_batch(codes),
+        ]
+    ).astype(np.float64)
+
+
+class LinearSurrogate:
+    """
+    Ridge regression from `grid_features` to fitness, refitted online on
+    the most recent `window` exact evaluations.
+
+    Pass one to `Generator(surrogate=...)`: once `min_samples` exact scores
+    are collected, each generation only the `fraction` of uncached children
+    ranked highest by the model gets exact fitness; the rest keep the
+    predicted fitness for selection.
+    """
+
+    def __init__(
+        self,
+        fraction: float = 0.25,
+        min_samples: int = 300,
+        window: int = 5000,
+        ridge: float = 1e-3,
+    ) -> None:
+        self.fraction = fraction
+        self.min_samples = min_samples
+        self.window = window
+        self.ridge = ridge
+        self.weights: Optional[np.ndarray] = None
+        self._features: List[np.ndarray] = []
+        self._targets: List[float] = []
+
+    def parameters(self) -> Dict[str, object]:
+        """Settings that change the run, for cache keys"""
+        return {
+            "fraction": self.fraction,
+            "min_samples": self.min_samples,
+            "window": self.window,
+            "ridge": self.ridge,
+        }
+
+    def reset(self) -> None:
+        self.weights = None
+        self._features.clear()
+        self._targets.clear()
+
+    @property
+    def trained(self) -> bool:
+        return self.weights is not None and len(self._targets) >= self.min_samples
+
+    def features(self, generator: "Generator", population: Sequence) -> np.ndarray:
+        if generator.uses_tile_codes:
+            codes = np.stack(population)
+        else:
+            codes = np.stack([genome.encode(dungeon) for dungeon in population])
+        return grid_features(generator, codes)
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        assert self.weights is not None
+        return features @ self.weights
+
+    def update(self, features: np.ndarray, fitnesses: Sequence[float]) -> None:
+        """Add exact evaluations and refit on the latest window"""
+        self._features.extend(features)
+        self._targets.extend(fitnesses)
+        if len(self._targets) > self.window:
+            del self._features[: -self.window]
+            del self._targets[: -self.window]
+
+        x = np.array(self._features)
+        y = np.array(self._targets)
+        gram = x.T @ x + self.ridge * len(y) * np.eye(x.shape[1])
+        self.weights = np.linalg.solve(gram, x.T @ y)
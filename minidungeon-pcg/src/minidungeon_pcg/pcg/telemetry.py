@@ -0,0 +1,188 @@
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from os import path
+from typing import Deque, Dict, Iterable, List, Optional
+import cProfile
+import json
+import os
+import pstats
+import time
+
+
+PHASES = ("evaluation", "selection", "crossover", "mutation", "repair")
+
+
+@dataclass
+class GenerationRecord:
+    """
+    Telemetry of one GA generation: the time spent evaluating its
+    population and breeding the next one, split by phase, and statistics
+    of its fitnesses.
+    """
+
+    generation: int
+    population_size: int
+    evaluation_s: float
+    selection_s: float
+    crossover_s: float
+    mutation_s: float
+    repair_s: float
+    best_fitness: float
+    mean_fitness: float
+    std_fitness: float
+    unique_genomes: int
+    # Fitness cache hit rate of this generation's lookups, None without a cache
+    cache_hit_rate: Optional[float] = None
+    # Surrogate screening, see `surrogate.LinearSurrogate`
+    evaluations_saved: int = 0
+    surrogate_error: Optional[float] = None
+    # Staged fitness: share of the evaluations settled by each stage
+    rejection_rates: Optional[Dict[str, float]] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+class PhaseTimer:
+    """
+    Accumulates exclusive wall time per phase. Phases nest: entering a phase
+    pauses the enclosing one, so repair inside crossover is only counted as
+    repair.
+    """
+
+    def __init__(self) -> None:
+        self.totals: Dict[str, float] = defaultdict(float)
+        self._stack: List[List] = []
+
+    def enter(self, phase: str) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.totals[parent[0]] += now - parent[1]
+        self._stack.append([phase, now])
+
+    def exit(self) -> None:
+        now = time.perf_counter()
+        phase, start = self._stack.pop()
+        self.totals[phase] += now - start
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def switch(self, phase: str) -> None:
+        self.exit()
+        self.enter(phase)
+
+    def take(self) -> Dict[str, float]:
+        """Return the totals so far and start counting from zero"""
+        totals = {phase: self.totals.get(phase, 0.0) for phase in PHASES}
+        self.totals.clear()
+        return totals
+
+
+class GenerationObserver:
+    """
+    Receives one GenerationRecord per generation from `Generator.evolve`.
+    Register with `Generator.add_observer`; without observers the GA loop
+    does no timing or statistics work at all.
+    """
+
+    def start_generation(self, generation: int) -> None:
+        """Called before the population of `generation` is evaluated"""
+
+    def pause_generation(self) -> None:
+        """
+        Called while control is with the caller of `evolve` between
+        evaluation and breeding, and when the run ends during a generation
+        (stopped early or failed), in which case `on_generation` never comes
+        """
+
+    def resume_generation(self) -> None:
+        """Called when the caller hands control back to `evolve`"""
+
+    def on_generation(self, record: GenerationRecord) -> None:
+        """Called once the generation has been evaluated and bred"""
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesSink(GenerationObserver):
+    """Appends every record as one JSON object per line"""
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._file = open(filename, "a")
+
+    def __enter__(self) -> "JsonLinesSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def on_generation(self, record: GenerationRecord) -> None:
+        self._file.write(json.dumps(record.to_dict()) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class RingBufferSink(GenerationObserver):
+    """Keeps the last `capacity` records in memory"""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.records: Deque[GenerationRecord] = deque(maxlen=capacity)
+
+    def on_generation(self, record: GenerationRecord) -> None:
+        self.records.append(record)
+
+
+class ProfileHook(GenerationObserver):
+    """
+    Runs cProfile over chosen generations: those listed in `generations`
+    and, with `every`, each generation divisible by it. Only the GA's own
+    work is profiled, not the caller's code between evaluation and
+    breeding. Profiles are dumped to `directory` as generation_<n>.prof
+    when given, and kept in `profiles`; a generation the run never finished
+    leaves none.
+    """
+
+    def __init__(
+        self,
+        generations: Iterable[int] = (),
+        every: Optional[int] = None,
+        directory: Optional[str] = None,
+    ) -> None:
+        self.generations = set(generations)
+        self.every = every
+        self.directory = directory
+        self.profiles: Dict[int, pstats.Stats] = {}
+        self._profiler: Optional[cProfile.Profile] = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def start_generation(self, generation: int) -> None:
+        if generation in self.generations or (
+            self.every is not None and generation % self.every == 0
+        ):
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def pause_generation(self) -> None:
+        if self._profiler is not None:
+            self._profiler.disable()
+
+    def resume_generation(self) -> None:
+        if self._profiler is not None:
+            self._profiler.enable()
+
+    def on_generation(self, record: GenerationRecord) -> None:
+        if self._profiler is None:
+            return
+        self._profiler.disable()
+        self.profiles[record.generation] = pstats.Stats(self._profiler)
+        if self.directory is not None:
+            self._profiler.dump_stats(
+                path.join(self.directory, f"generation_{record.generation}.prof")
+            )
+        self._profiler = None
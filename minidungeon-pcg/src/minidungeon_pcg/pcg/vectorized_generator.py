@@ -0,0 +1,231 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from minidungeon_pcg.pcg.census import TileCensus
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+
+
+class VectorizedGenerator(NumpyGenerator):
+    """
+    NumpyGenerator whose breeding step works on the whole population at
+    once. A generation lives in one preallocated (P, H, W) buffer and the
+    next one is bred into a second buffer; the two swap every generation.
+
+    - tournament selection draws a (children, 5) index matrix (with
+      replacement) and takes the fittest of every row
+    - crossover splits every child at its own row with a mask
+    - mutation applies the per-tile rules of `mutate`, entity limits
+      included, to every grid at once
+    - start/exit and the entity limits are restored by a batch repair
+      after crossover and after mutation, like `repair_dungeon`
+
+    The operators follow the same rules as the per-child ones but draw
+    from a different random stream, so seeded runs differ from
+    NumpyGenerator. No tile censuses are kept, so the returned censuses
+    are None. Population entries are views into the buffers and are
+    overwritten two generations later; use `retain` to keep one.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._buffers: Optional[np.ndarray] = None
+        self._scratch: Optional[np.ndarray] = None
+        self._front = 0
+        self._views: List[np.ndarray] = []
+
+    def retain(self, dungeon: np.ndarray) -> np.ndarray:  # type: ignore[override]
+        return dungeon.copy()
+
+    def next_generation(  # type: ignore[override]
+        self,
+        population: List[np.ndarray],
+        censuses: List[Optional[TileCensus]],
+        fitnesses: List[float],
+    ) -> Tuple[List[np.ndarray], List[Optional[TileCensus]], List[int]]:
+        """
+        Breed the next population into the back buffer. No censuses are
+        kept; the returned list holds None for every individual.
+        """
+        timer = self.phase_timer
+        if timer is not None:
+            timer.enter("selection")
+
+        count = len(population)
+        front = self._front_buffer(population)
+        back = self._buffers[1 - self._front]  # type: ignore[index]
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        scores = np.asarray(fitnesses, dtype=np.float64)
+
+        # Elitism, ties broken by index like the stable sort of the base class
+        elite_count = min(self.elite_size, count)
+        elites = np.argsort(-scores, kind="stable")[:elite_count]
+        back[:elite_count] = front[elites]
+
+        # Tournament selection for both parents of every child
+        children = self.population_size - elite_count
+        entrants = rng.integers(0, count, size=(2 * children, 5))
+        winners = entrants[np.arange(2 * children), np.argmax(scores[entrants], axis=1)]
+        first_parents, second_parents = winners[:children], winners[children:]
+
+        if timer is not None:
+            timer.switch("crossover")
+        offspring = back[elite_count : self.population_size]
+        scratch = self._scratch[:children]  # type: ignore[index]
+        np.take(front, first_parents, axis=0, out=offspring)
+        np.take(front, second_parents, axis=0, out=scratch)
+        split_rows = rng.integers(1, self.height - 1, size=children)
+        lower = np.arange(self.height)[None, :, None] >= split_rows[:, None, None]
+        np.copyto(offspring, scratch, where=lower)
+        # Mutation counts entities against their limits, as after crossover
+        self.repair_batch(offspring)
+
+        if timer is not None:
+            timer.switch("mutation")
+        self.mutate_batch(offspring, rng)
+
+        if timer is not None:
+            timer.switch("repair")
+        self.repair_batch(offspring)
+
+        if timer is not None:
+            timer.exit()
+
+        self._front = 1 - self._front
+        self._views = list(back[: self.population_size])
+        parent_indices = elites.tolist() + first_parents.tolist()
+        new_censuses: List[Optional[TileCensus]] = [None] * len(self._views)
+        return self._views, new_censuses, parent_indices
+
+    def mutate_batch(self, population: np.ndarray, rng: np.random.Generator) -> None:
+        """
+        Vectorized `mutate`: every non start/exit tile mutates with
+        probability mutation_rate and goes through the same rules as in
+        `mutate`, entity limits and fall-through included.
+
+        Only entity placements depend on the counts left by earlier
+        mutations of the same grid. Every other outcome is decided at once;
+        placements are then decided in row-major order per grid, the k-th
+        placement of every grid in one step.
+        """
+        count = len(population)
+        flat = population.reshape(count, -1)
+        mutating = rng.random(flat.shape) < self.mutation_rate
+        mutating &= (flat != self.START) & (flat != self.EXIT)
+
+        # Mutations in row-major order, grid by grid
+        grids, cells = np.nonzero(mutating)
+        old = flat[grids, cells]
+        kinds = rng.random(len(grids))
+        wall = old == self.WALL
+        # Toggles (walls open only 30% of the time) and conversions to floor
+        new = np.where(
+            kinds < 0.3,
+            np.where(wall & (rng.random(len(grids)) < 0.3), self.FLOOR, self.WALL),
+            np.where(wall, self.WALL, self.FLOOR),
+        ).astype(np.uint8)
+        placing = (kinds >= 0.3) & (kinds < 0.6)
+
+        entities = (
+            (self.MONSTER, 0.4, self.target_monster_count + 2),
+            (self.TREASURE, 0.5, self.target_treasure_count + 1),
+            (self.POTION, 0.6, self.target_potion_count + 1),
+        )
+        # Per entity, the grid's count in front of every mutation from the
+        # other mutations; placements are added in as they are decided
+        first_of_grid = np.searchsorted(grids, grids)
+        counts_before = []
+        placed = []
+        for tile, _, _ in entities:
+            change = (~placing & (new == tile)).astype(np.int32) - (old == tile)
+            before = np.cumsum(change) - change
+            before += (flat == tile).sum(axis=1)[grids] - before[first_of_grid]
+            counts_before.append(before)
+            placed.append(np.zeros(count, dtype=np.int32))
+
+        placements = np.flatnonzero(placing)
+        placement_grids = grids[placements]
+        ranks = np.arange(len(placements)) - np.searchsorted(
+            placement_grids, placement_grids
+        )
+        order = np.argsort(ranks, kind="stable")
+        for step in np.split(
+            placements[order], np.flatnonzero(np.diff(ranks[order])) + 1
+        ):
+            if not len(step):
+                continue
+            # The first entity type under its limit, else the fall-through
+            kind = kinds[step]
+            tiles = new[step]
+            undecided = np.ones(len(step), dtype=bool)
+            for (tile, below, limit), before, added in zip(
+                entities, counts_before, placed
+            ):
+                # Earlier ranks hold every earlier placement of the grid
+                chosen = undecided & (kind < below)
+                chosen &= before[step] + added[grids[step]] < limit
+                tiles[chosen] = tile
+                added[grids[step[chosen]]] += 1
+                undecided &= ~chosen
+            new[step] = tiles
+
+        flat[grids, cells] = new
+
+    def repair_batch(self, population: np.ndarray) -> None:
+        """
+        Vectorized `repair_dungeon`: exactly one start and one exit per grid
+        (the first in row-major order is kept, missing ones are placed like
+        `repair_dungeon` does) and no more entities than the limits allow.
+        """
+        count, height, width = population.shape
+        flat = population.reshape(count, -1)
+        grids = np.arange(count)
+
+        for tile in (self.START, self.EXIT):
+            matches = flat == tile
+            first = matches.argmax(axis=1)
+            extra = matches.copy()
+            extra[grids, first] = False
+            flat[extra] = self.FLOOR
+
+            missing = ~matches.any(axis=1)
+            if missing.any():
+                if tile == self.START:
+                    # First non-wall tile down the left column
+                    column = population[missing, :, 0] != self.WALL
+                    rows = np.where(
+                        column.any(axis=1), column.argmax(axis=1), height - 1
+                    )
+                    population[grids[missing], rows, 0] = tile
+                else:
+                    # First non-wall tile up the right column
+                    column = population[missing, ::-1, width - 1] != self.WALL
+                    rows = np.where(
+                        column.any(axis=1), height - 1 - column.argmax(axis=1), 0
+                    )
+                    population[grids[missing], rows, width - 1] = tile
+
+        for tile, limit in (
+            (self.MONSTER, self.target_monster_count + 2),
+            (self.TREASURE, self.target_treasure_count + 1),
+            (self.POTION, self.target_potion_count + 1),
+        ):
+            matches = flat == tile
+            flat[matches & (np.cumsum(matches, axis=1) > limit)] = self.FLOOR
+
+    def _front_buffer(self, population: List[np.ndarray]) -> np.ndarray:
+        """The buffer holding `population`, copied in unless it already is"""
+        shape = (max(len(population), self.population_size), self.height, self.width)
+        if self._buffers is None or self._buffers.shape[1:] != shape:
+            self._buffers = np.empty((2,) + shape, dtype=np.uint8)
+            self._scratch = np.empty(shape, dtype=np.uint8)
+            self._front = 0
+            self._views = []
+
+        front = self._buffers[self._front]
+        # Skip the copy when the population is still the views handed out
+        # by the last generation (islands swap immigrants into the list)
+        if len(population) != len(self._views) or any(
+            dungeon is not view for dungeon, view in zip(population, self._views)
+        ):
+            for i, dungeon in enumerate(population):
+                front[i] = dungeon
+        return front[: len(population)]
@@ -0,0 +1,355 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
+import copy
+import time
+import numpy as np
+from minidungeon_pcg.pcg import bitboard
+from minidungeon_pcg.pcg.analysis import DungeonAnalysis, Position
+from minidungeon_pcg.pcg.census import TileCensus
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.parallel import GeneratedStage, generate_stage
+
+# Smallest chunk side the structured initial dungeons fit in
+MIN_CHUNK_SIZE = 5
+
+
+class ChunkGenerator(Generator):
+    """
+    Generator for one chunk of a large world. `doors` are border tiles shared
+    with a neighbouring chunk: repair keeps them open and the fitness
+    penalises every door that is not reachable from the start.
+
+    This class runs on the list genome; `chunk_class` gives the chunk
+    generator of any other backend.
+    """
+
+    def __init__(
+        self,
+        *args,
+        doors: Sequence[Position] = (),
+        door_penalty: float = 50.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.doors = list(doors)
+        self.door_penalty = door_penalty
+
+    def initialize_population(self) -> List[List[List[str]]]:
+        population = super().initialize_population()
+        for dungeon in population:
+            self.repair_dungeon(dungeon)
+        return population
+
+    def repair_dungeon(
+        self, dungeon: List[List[str]], census: Optional[TileCensus] = None
+    ) -> None:
+        if census is None:
+            census = self.census_of(dungeon)
+        super().repair_dungeon(dungeon, census)
+        for i, j in self.doors:
+            if dungeon[i][j] == self.WALL:
+                census.set_tile(dungeon, i, j, self.FLOOR)
+
+    def repair_batch(self, population: Any) -> None:
+        # Only VectorizedGenerator breeds through a batch repair
+        super().repair_batch(population)  # type: ignore[misc]
+        for i, j in self.doors:
+            column = population[:, i, j]
+            column[column == self.WALL] = self.FLOOR
+
+    def fitness_from_analysis(self, analysis: DungeonAnalysis) -> float:
+        fitness = super().fitness_from_analysis(analysis)
+        closed = sum(1 for door in self.doors if door not in analysis.distances)
+        return fitness - closed * self.door_penalty
+
+    def calculate_fitness_batch(self, population: Any) -> Any:
+        # The batch fitness of the tile-code backends skips fitness_from_analysis
+        fitness = super().calculate_fitness_batch(population)  # type: ignore[misc]
+        closed = [self.closed_doors(dungeon) for dungeon in population]
+        return fitness - np.array(closed) * self.door_penalty
+
+    def closed_doors(self, dungeon: Any) -> int:
+        """Doors not reachable from the start (all of them without a start)"""
+        start = self.find_tile(dungeon, self.START)
+        if start is None:
+            return len(self.doors)
+        stride = bitboard.stride_of(self.width)
+        reached = bitboard.flood(
+            bitboard.open_mask(dungeon, self.WALL),
+            bitboard.bit(*start, stride),
+            stride,
+        )
+        return sum(1 for i, j in self.doors if not reached & bitboard.bit(i, j, stride))
+
+    def __reduce__(self):
+        # Classes made by chunk_class are rebuilt from their backend
+        backend = next(
+            base for base in type(self).__mro__ if not issubclass(base, ChunkGenerator)
+        )
+        return _rebuild_chunk, (backend, self.__getstate__())
+
+
+_CHUNK_CLASSES: Dict[type, Type[ChunkGenerator]] = {Generator: ChunkGenerator}
+
+
+def chunk_class(backend: Type[Generator]) -> Type[ChunkGenerator]:
+    """The ChunkGenerator that runs on the genome of a generator backend"""
+    if issubclass(backend, ChunkGenerator):
+        return backend
+    cls = _CHUNK_CLASSES.get(backend)
+    if cls is None:
+        cls = type(f"Chunk{backend.__name__}", (ChunkGenerator, backend), {})
+        _CHUNK_CLASSES[backend] = cls
+    return cls
+
+
+def _rebuild_chunk(backend: Type[Generator], state: Dict[str, object]) -> Generator:
+    chunk = chunk_class(backend).__new__(chunk_class(backend))
+    chunk.__dict__.update(state)
+    return chunk
+
+
+@dataclass
+class WorldReport:
+    """Outcome of a chunked world generation"""
+
+    dungeon: List[List[str]]
+    chunk_rows: int
+    chunk_cols: int
+    chunk_fitnesses: List[float] = field(default_factory=list)
+    # Wall tiles opened by the global connectivity pass
+    carved: int = 0
+    path_length: int = 0
+    path_exists: bool = False
+    reachable_ratio: float = 0.0
+    wall_time: float = 0.0
+
+    def summary(self) -> str:
+        mean_fitness = sum(self.chunk_fitnesses) / max(1, len(self.chunk_fitnesses))
+        return (
+            f"World {len(self.dungeon[0])}x{len(self.dungeon)} from "
+            f"{self.chunk_rows}x{self.chunk_cols} chunks in {self.wall_time:.2f}s\n"
+            f"  mean chunk fitness {mean_fitness:.2f}, {self.carved} tiles carved\n"
+            f"  path length {self.path_length if self.path_exists else 'none'}, "
+            f"{self.reachable_ratio:.1%} of floor reachable"
+        )
+
+
+def chunk_bounds(total: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Split 0..total into near equal spans of at least chunk_size tiles (one
+    span if total is shorter)
+    """
+    count = max(1, total // chunk_size)
+    return [(total * i // count, total * (i + 1) // count) for i in range(count)]
+
+
+def place_doors(
+    generator: Generator,
+    row_bounds: List[Tuple[int, int]],
+    col_bounds: List[Tuple[int, int]],
+    doors_per_seam: int,
+) -> Dict[Tuple[int, int], List[Position]]:
+    """
+    Pick door tiles on every seam between neighbouring chunks. Each door is
+    a pair of facing border tiles, one in each chunk, given in chunk-local
+    coordinates per (chunk row, chunk col). Doors never sit on a chunk
+    corner, so a seam shorter than doors_per_seam + 2 gets fewer doors.
+    """
+    doors: Dict[Tuple[int, int], List[Position]] = {
+        (r, c): [] for r in range(len(row_bounds)) for c in range(len(col_bounds))
+    }
+    for r, (top, bottom) in enumerate(row_bounds):
+        for c, (left, right) in enumerate(col_bounds):
+            height, width = bottom - top, right - left
+            # Seam with the chunk below
+            if r + 1 < len(row_bounds):
+                seam = range(1, width - 1)
+                for j in generator.rng.sample(seam, min(doors_per_seam, len(seam))):
+                    doors[(r, c)].append((height - 1, j))
+                    doors[(r + 1, c)].append((0, j))
+            # Seam with the chunk to the right
+            if c + 1 < len(col_bounds):
+                seam = range(1, height - 1)
+                for i in generator.rng.sample(seam, min(doors_per_seam, len(seam))):
+                    doors[(r, c)].append((i, width - 1))
+                    doors[(r, c + 1)].append((i, 0))
+    return doors
+
+
+def connect_world(
+    generator: Generator,
+    world: List[List[str]],
+    start: Position,
+    exit: Position,
+    connect_all: bool = True,
+) -> int:
+    """
+    Global connectivity pass over a stitched world. A 0-1 BFS from the start
+    (entering a wall costs 1) finds the tunnel through the fewest walls to
+    every tile; the walls on the tunnel to the exit, and with connect_all to
+    every stranded floor pocket, are opened. Returns the number of tiles opened.
+    """
+    height, width, wall = len(world), len(world[0]), generator.WALL
+    cost = {start: 0}
+    predecessors: Dict[Position, Position] = {}
+    queue = deque([start])
+
+    while queue:
+        position = queue.popleft()
+        x, y = position
+        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < height and 0 <= ny < width):
+                continue
+            step = 1 if world[nx][ny] == wall else 0
+            new_cost = cost[position] + step
+            if new_cost < cost.get((nx, ny), new_cost + 1):
+                cost[(nx, ny)] = new_cost
+                predecessors[(nx, ny)] = position
+                if step:
+                    queue.append((nx, ny))
+                else:
+                    queue.appendleft((nx, ny))
+
+    targets = [exit]
+    if connect_all:
+        targets += [
+            (i, j)
+            for i in range(height)
+            for j in range(width)
+            if world[i][j] != wall and cost[(i, j)] > 0
+        ]
+
+    carved = 0
+    connected: Set[Position] = set()
+    for target in targets:
+        position = target
+        while cost[position] > 0 and position not in connected:
+            connected.add(position)
+            if world[position[0]][position[1]] == wall:
+                world[position[0]][position[1]] = generator.FLOOR
+                carved += 1
+            position = predecessors[position]
+    return carved
+
+
+def generate_world(
+    generator: Generator,
+    chunk_size: int = 16,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    doors_per_seam: int = 1,
+    connect_all: bool = True,
+) -> WorldReport:
+    """
+    Generate a generator.width x generator.height world as a grid of chunks
+    of at least chunk_size tiles, each evolved by its own GA run on the
+    generator's backend with its settings, playtest, surrogate and staged
+    fitness included (in `workers` processes). Neighbouring chunks share
+    door tiles on their seam. The stitched world keeps the start of the
+    top-left chunk and the exit of the bottom-right one, then goes through
+    `connect_world`.
+
+    Raises ValueError when chunk_size, or the world itself, is smaller than
+    MIN_CHUNK_SIZE tiles on a side.
+    """
+    if min(chunk_size, generator.width, generator.height) < MIN_CHUNK_SIZE:
+        raise ValueError(
+            f"chunks and the world need at least {MIN_CHUNK_SIZE} tiles a side, "
+            f"got chunk_size={chunk_size} for a "
+            f"{generator.width}x{generator.height} world"
+        )
+    start_time = time.perf_counter()
+    generator.rng.seed(seed)
+
+    row_bounds = chunk_bounds(generator.height, chunk_size)
+    col_bounds = chunk_bounds(generator.width, chunk_size)
+    doors = place_doors(generator, row_bounds, col_bounds, doors_per_seam)
+
+    chunks: List[Tuple[Tuple[int, int], ChunkGenerator, int]] = []
+    for r, (top, bottom) in enumerate(row_bounds):
+        for c, (left, right) in enumerate(col_bounds):
+            chunk_generator = chunk_class(type(generator))(
+                width=right - left,
+                height=bottom - top,
+                population_size=generator.population_size,
+                generations=generator.generations,
+                mutation_rate=generator.mutation_rate,
+                elite_size=generator.elite_size,
+                fitness_cache_size=(
+                    generator.fitness_cache.max_size
+                    if generator.fitness_cache is not None
+                    else 0
+                ),
+                incremental_fitness=generator.incremental_fitness,
+                playtest=generator.playtest,
+                surrogate=copy.deepcopy(generator.surrogate),
+                staged=copy.deepcopy(generator.staged),
+                doors=doors[(r, c)],
+            )
+            chunk_generator.min_path_length = generator.min_path_length
+            chunk_generator.target_monster_count = generator.target_monster_count
+            chunk_generator.target_potion_count = generator.target_potion_count
+            chunk_generator.target_treasure_count = generator.target_treasure_count
+            chunks.append(((r, c), chunk_generator, generator.rng.randrange(2**32)))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(generate_stage, chunk_generator, chunk_seed)
+                for _, chunk_generator, chunk_seed in chunks
+            ]
+            stages: List[GeneratedStage] = [future.result() for future in futures]
+    else:
+        stages = [
+            generate_stage(chunk_generator, chunk_seed)
+            for _, chunk_generator, chunk_seed in chunks
+        ]
+
+    # The stitched world always uses the text tiles
+    world_generator = Generator(
+        width=generator.width, height=generator.height, fitness_cache_size=0
+    )
+    floor, start_tile, exit_tile = (
+        world_generator.FLOOR,
+        world_generator.START,
+        world_generator.EXIT,
+    )
+
+    # Stitch the chunks, keeping the first start and the last exit
+    world = world_generator.new_grid(floor)
+    starts: List[Position] = []
+    exits: List[Position] = []
+    for ((r, c), chunk_generator, _), stage in zip(chunks, stages):
+        top, left = row_bounds[r][0], col_bounds[c][0]
+        for i, row in enumerate(chunk_generator.to_rows(stage.dungeon)):
+            for j, tile in enumerate(row):
+                if tile == start_tile:
+                    starts.append((top + i, left + j))
+                    tile = floor
+                elif tile == exit_tile:
+                    exits.append((top + i, left + j))
+                    tile = floor
+                world[top + i][left + j] = tile
+    start, exit = starts[0], exits[-1]
+    world[start[0]][start[1]] = start_tile
+    world[exit[0]][exit[1]] = exit_tile
+
+    carved = connect_world(world_generator, world, start, exit, connect_all)
+
+    distances, _ = world_generator.bfs(world, start)
+    floor_tiles = world_generator.count_floor_tiles(world)
+    return WorldReport(
+        dungeon=world,
+        chunk_rows=len(row_bounds),
+        chunk_cols=len(col_bounds),
+        chunk_fitnesses=[stage.fitness for stage in stages],
+        carved=carved,
+        path_length=distances.get(exit, 0),
+        path_exists=exit in distances,
+        reachable_ratio=len(distances) / max(1, floor_tiles),
+        wall_time=time.perf_counter() - start_time,
+    )
@@ -0,0 +1,36 @@
+from typing import List
+from minidungeon_pcg.pcg.generator import Generator
+
+
+def dungeon_corpus(generator: Generator, bred: int = 60) -> List[List[List[str]]]:
+    """
+    Seeded list-genome dungeons: the initial population (structured and
+    random), bred children, and invalid ones without a start or an exit
+    """
+    corpus = generator.initialize_population()
+    for _ in range(bred):
+        parent1 = corpus[generator.rng.randrange(len(corpus))]
+        parent2 = corpus[generator.rng.randrange(len(corpus))]
+        corpus.append(generator.mutate(generator.crossover(parent1, parent2)))
+    for tile in (generator.START, generator.EXIT):
+        invalid = [row[:] for row in corpus[0]]
+        for row in invalid:
+            row[:] = [generator.FLOOR if t == tile else t for t in row]
+        corpus.append(invalid)
+    return corpus
+
+
+def stage_grids(generator: Generator, ragged_every: int = 3) -> List[List[List[str]]]:
+    """
+    Repaired dungeons of a seeded population as Pather grids, every
+    `ragged_every`-th with a row cut short
+    """
+    grids = []
+    for number, dungeon in enumerate(generator.initialize_population()):
+        generator.repair_dungeon(dungeon)
+        grid = [list(row) for row in generator.to_rows(dungeon)]
+        if number % ragged_every == ragged_every - 1:
+            row = generator.rng.randrange(len(grid))
+            grid[row] = grid[row][: generator.rng.randrange(1, generator.width)]
+        grids.append(grid)
+    return grids
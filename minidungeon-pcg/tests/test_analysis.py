@@ -0,0 +1,55 @@
+from minidungeon_pcg.pcg import genome
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+from tests.corpus import dungeon_corpus
+
+
+def test_fused_analysis_matches_the_metric_functions():
+    generator = Generator(width=12, height=10, population_size=40, seed=4)
+    for dungeon in dungeon_corpus(generator):
+        analysis = generator.analyze_dungeon(dungeon)
+
+        for tile in (generator.MONSTER, generator.TREASURE, generator.POTION):
+            assert analysis.positions.get(tile, []) == generator.find_all_tiles(
+                dungeon, tile
+            )
+        assert analysis.start == generator.find_tile(dungeon, generator.START)
+        assert analysis.exit == generator.find_tile(dungeon, generator.EXIT)
+        assert analysis.floor_count == generator.count_floor_tiles(dungeon)
+        assert analysis.dead_end_count == generator.count_dead_ends(dungeon)
+        if analysis.start is None or analysis.exit is None:
+            continue
+
+        assert analysis.reachable_count == generator.count_reachable_tiles(
+            dungeon, analysis.start
+        )
+        length, exists = generator.calculate_path_length(
+            dungeon, analysis.start, analysis.exit
+        )
+        assert (analysis.path_length, analysis.path_exists) == (length, exists)
+        if exists:
+            path = analysis.path_tiles
+            assert (path[0], path[-1]) == (analysis.start, analysis.exit)
+            assert all(dungeon[i][j] != generator.WALL for i, j in path)
+            assert all(
+                abs(i1 - i2) + abs(j1 - j2) == 1
+                for (i1, j1), (i2, j2) in zip(path, path[1:])
+            )
+
+
+def test_numpy_analysis_matches_the_list_backend():
+    reference = Generator(width=12, height=10, population_size=40, seed=4)
+    codes = NumpyGenerator(width=12, height=10, seed=4)
+    for dungeon in dungeon_corpus(reference):
+        expected = reference.analyze_dungeon(dungeon)
+        analysis = codes.analyze_dungeon(genome.encode(dungeon))
+
+        assert {
+            genome.TILE_CHARS[tile]: tiles for tile, tiles in analysis.positions.items()
+        } == expected.positions
+        assert (analysis.start, analysis.exit) == (expected.start, expected.exit)
+        assert analysis.wall_count == expected.wall_count
+        assert analysis.floor_count == expected.floor_count
+        assert analysis.dead_end_count == expected.dead_end_count
+        assert analysis.distances == expected.distances
+        assert analysis.path_tiles == expected.path_tiles
@@ -0,0 +1,59 @@
+from minidungeon_pcg.pcg.bitboard_generator import BitboardGenerator
+from minidungeon_pcg.pcg.generator import Generator
+from tests.corpus import dungeon_corpus
+
+
+def test_bitboard_metrics_match_bfs():
+    for width, height in ((9, 9), (13, 7)):
+        reference = Generator(width=width, height=height, population_size=40, seed=8)
+        bitboards = BitboardGenerator(width=width, height=height, seed=8)
+        for dungeon in dungeon_corpus(reference):
+            assert bitboards.count_floor_tiles(dungeon) == reference.count_floor_tiles(
+                dungeon
+            )
+            assert bitboards.count_dead_ends(dungeon) == reference.count_dead_ends(
+                dungeon
+            )
+            start = reference.find_tile(dungeon, reference.START)
+            exit = reference.find_tile(dungeon, reference.EXIT)
+            if start is None:
+                continue
+            assert bitboards.count_reachable_tiles(
+                dungeon, start
+            ) == reference.count_reachable_tiles(dungeon, start)
+            ends = [(0, 0), (height - 1, width - 1)]
+            if exit is not None:
+                ends.append(exit)
+            for end in ends:
+                assert bitboards.calculate_path_length(
+                    dungeon, start, end
+                ) == reference.calculate_path_length(dungeon, start, end)
+
+
+def test_bitboard_analysis_matches_bfs():
+    for width, height in ((9, 9), (13, 7)):
+        reference = Generator(width=width, height=height, population_size=40, seed=5)
+        bitboards = BitboardGenerator(width=width, height=height, seed=5)
+        for dungeon in dungeon_corpus(reference):
+            expected = reference.analyze_dungeon(dungeon)
+            analysis = bitboards.analyze_dungeon(dungeon)
+            assert analysis.start == expected.start
+            assert analysis.exit == expected.exit
+            assert analysis.positions == expected.positions
+            assert analysis.wall_count == expected.wall_count
+            assert analysis.dead_end_count == expected.dead_end_count
+            assert analysis.distances == expected.distances
+            assert analysis.path_tiles == expected.path_tiles
+            assert bitboards.compute_fitness(dungeon) == reference.compute_fitness(
+                dungeon
+            )
+
+
+def test_bitboard_backend_generates_the_same_dungeon():
+    dungeons = [
+        backend(population_size=20, generations=8, seed=8).generate_dungeon(
+            save=False, verbose=False
+        )
+        for backend in (Generator, BitboardGenerator)
+    ]
+    assert dungeons[0] == dungeons[1]
@@ -0,0 +1,19 @@
+import time
+from minidungeon_pcg.pcg.generator import Generator
+
+
+class SlowBreedingGenerator(Generator):
+    def next_generation(self, population, censuses, fitnesses):
+        time.sleep(0.3)
+        return super().next_generation(population, censuses, fitnesses)
+
+
+def test_time_budget_counts_breeding():
+    generator = SlowBreedingGenerator(population_size=10, generations=10, seed=0)
+    start = time.perf_counter()
+
+    *_, last = generator.evolve(time_budget_s=0.75)
+
+    assert time.perf_counter() - start < 0.75
+    assert last.stop_reason is not None
+    assert last.generation == 2
@@ -0,0 +1,53 @@
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+
+BACKENDS = (Generator, NumpyGenerator)
+
+
+def assert_census_matches(generator, census, dungeon):
+    fresh = generator.census_of(dungeon)
+    # Tile types that were removed again may leave an empty set behind
+    assert {tile: tiles for tile, tiles in census.positions.items() if tiles} == (
+        fresh.positions
+    )
+    assert census.wall_rows == fresh.wall_rows
+    assert census.wall_count == fresh.wall_count
+
+
+def test_operators_keep_the_census_in_sync():
+    for backend in BACKENDS:
+        generator = backend(width=11, height=9, population_size=40, seed=5)
+        generator.mutation_rate = 0.4
+        population = generator.initialize_population()
+        censuses = [generator.census_of(dungeon) for dungeon in population]
+        for i in range(len(population)):
+            j = (i * 7 + 3) % len(population)
+            # The second parent's census is rebuilt when it is not passed
+            child, census = generator.crossover_with_census(
+                population[i],
+                censuses[i],
+                population[j],
+                None if i % 2 else censuses[j],
+            )
+            assert_census_matches(generator, census, child)
+
+            child = generator.mutate(child, census)
+            assert_census_matches(generator, census, child)
+
+            generator.repair_dungeon(child, census)
+            assert_census_matches(generator, census, child)
+            assert census.count(generator.START) == census.count(generator.EXIT) == 1
+
+
+def test_bred_generations_carry_matching_censuses():
+    for backend in BACKENDS:
+        generator = backend(population_size=30, seed=9)
+        population = generator.initialize_population()
+        censuses = [generator.census_of(dungeon) for dungeon in population]
+        for _ in range(5):
+            fitnesses = generator.evaluate_population(population, censuses)
+            population, censuses, _ = generator.next_generation(
+                population, censuses, fitnesses
+            )
+            for dungeon, census in zip(population, censuses):
+                assert_census_matches(generator, census, dungeon)
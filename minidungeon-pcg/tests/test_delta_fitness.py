@@ -0,0 +1,43 @@
+from minidungeon_pcg.pcg.generator import Generator
+from tests.corpus import dungeon_corpus
+
+
+def test_delta_analysis_matches_full_analysis():
+    generator = Generator(
+        width=16, height=16, population_size=30, mutation_rate=0.02, seed=6
+    )
+    deltas = 0
+    for parent in dungeon_corpus(generator)[:-2]:
+        generator.repair_dungeon(parent)
+        parent_analysis = generator.analyze_dungeon(parent)
+        for _ in range(5):
+            child = generator.mutate([row[:] for row in parent])
+            changed = generator.changed_cells(parent, child)
+
+            analysis = generator.analyze_delta(parent_analysis, parent, child, changed)
+
+            if analysis is not None:
+                deltas += 1
+                assert analysis == generator.analyze_dungeon(child)
+    assert deltas > 100
+
+
+def test_incremental_fitness_does_not_change_the_run():
+    runs = []
+    for incremental_fitness in (False, True):
+        generator = Generator(
+            width=16,
+            height=16,
+            population_size=20,
+            generations=6,
+            mutation_rate=0.02,
+            seed=6,
+            incremental_fitness=incremental_fitness,
+        )
+        runs.append(
+            [
+                (progress.best_fitness, progress.best_dungeon)
+                for progress in generator.evolve()
+            ]
+        )
+    assert runs[0] == runs[1]
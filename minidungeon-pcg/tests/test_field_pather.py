@@ -0,0 +1,28 @@
+import random
+from minidungeon_pcg.envs.agent.field_pather import DistanceField, FieldPather
+from minidungeon_pcg.pcg.generator import Generator
+from tests.corpus import stage_grids
+from tests.test_pathers import QUERIES, pick_up
+
+
+def test_repaired_fields_equal_rebuilt_fields():
+    rng = random.Random(0)
+    generator = Generator(width=10, height=8, population_size=12, seed=3)
+    for grid in stage_grids(generator):
+        fields = FieldPather()
+        for _ in range(6):
+            # Fields cover the whole grid whatever the query position
+            for targets, avoid in QUERIES:
+                fields.distance_to_nearest(grid, (0, 0), targets, avoid)
+            for (targets, avoid), field in fields._fields.items():
+                rebuilt = DistanceField(
+                    fields._field_layout,
+                    fields._field_passable[avoid],
+                    fields._field_tiles,
+                    targets,
+                )
+                assert field.distance == rebuilt.distance
+                assert field.sources == rebuilt.sources
+            if not pick_up(grid, rng, fields):
+                break
+        assert fields.field_builds == len(QUERIES)
@@ -0,0 +1,20 @@
+import numpy as np
+from minidungeon_pcg.pcg import genome
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+from tests.corpus import dungeon_corpus
+
+
+def test_batch_fitness_matches_scalar_fitness():
+    for width, height in ((9, 9), (14, 11)):
+        generator = Generator(width=width, height=height, population_size=40, seed=2)
+        corpus = dungeon_corpus(generator)
+        batched = NumpyGenerator(width=width, height=height, seed=2)
+
+        fitnesses = batched.calculate_fitness_batch(
+            np.stack([genome.encode(dungeon) for dungeon in corpus])
+        )
+
+        assert fitnesses.tolist() == [
+            generator.compute_fitness(dungeon) for dungeon in corpus
+        ]
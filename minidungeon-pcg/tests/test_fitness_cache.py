@@ -0,0 +1,54 @@
+from minidungeon_pcg.pcg.fitness_cache import FitnessCache
+from minidungeon_pcg.pcg.generator import Generator
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FitnessCache(max_size=2)
+    cache.put("a", 1.0)
+    cache.put("b", 2.0)
+
+    assert cache.get("a") == 1.0  # "b" is now the least recently used
+    cache.put("c", 3.0)
+
+    assert "b" not in cache
+    assert ("a" in cache, "c" in cache) == (True, True)
+    assert len(cache) == 2
+
+
+def test_membership_leaves_order_and_stats_alone():
+    cache = FitnessCache(max_size=2)
+    cache.put("a", 1.0)
+    cache.put("b", 2.0)
+
+    assert "a" in cache
+    cache.put("c", 3.0)
+
+    assert "a" not in cache
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_hits_and_misses_are_counted():
+    cache = FitnessCache(max_size=4)
+    cache.put("a", 0.0)  # a zero fitness is still a hit
+
+    assert cache.get("a") == 0.0
+    assert cache.get("b") is None
+    assert cache.get("a") == 0.0
+
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_rate == 2 / 3
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses, cache.hit_rate) == (0, 0, 0, 0.0)
+
+
+def test_repeated_genomes_are_served_from_the_cache():
+    generator = Generator(population_size=20, seed=0)
+    population = generator.initialize_population()
+
+    first = generator.evaluate_population(population)
+    assert generator.fitness_cache.hits == 0
+    second = generator.evaluate_population(population)
+
+    assert first == second
+    assert generator.fitness_cache.hits == len(population)
+    assert generator.fitness_cache.misses == len(population)
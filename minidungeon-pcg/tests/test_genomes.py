@@ -0,0 +1,31 @@
+import copy
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+
+
+def test_breeding_leaves_evaluated_genomes_untouched():
+    for backend in (Generator, NumpyGenerator):
+        generator = backend(population_size=30, mutation_rate=0.3, seed=7)
+        population = generator.initialize_population()
+        censuses = [generator.census_of(dungeon) for dungeon in population]
+        for _ in range(5):
+            fitnesses = generator.evaluate_population(population, censuses)
+            snapshot = copy.deepcopy(population)
+
+            bred, censuses, _ = generator.next_generation(
+                population, censuses, fitnesses
+            )
+
+            for dungeon, before in zip(population, snapshot):
+                assert generator.genome_key(dungeon) == generator.genome_key(before)
+            population = bred
+
+
+def test_best_dungeon_is_not_written_after_it_is_kept():
+    generator = Generator(population_size=20, generations=10, seed=7)
+    kept = []
+    for progress in generator.evolve():
+        if progress.improved:
+            kept.append((progress.best_dungeon, copy.deepcopy(progress.best_dungeon)))
+    for dungeon, snapshot in kept:
+        assert dungeon == snapshot
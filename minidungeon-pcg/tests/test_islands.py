@@ -0,0 +1,34 @@
+import pytest
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.islands import run_islands
+from minidungeon_pcg.pcg.vectorized_generator import VectorizedGenerator
+
+
+class FailingGenerator(Generator):
+    def evaluate_population(self, population, censuses=None):
+        if self.rng.random() < 0.1:
+            raise ValueError("evaluation failed")
+        return super().evaluate_population(population, censuses)
+
+
+def test_island_failure_reaches_the_caller():
+    generator = FailingGenerator(population_size=20, generations=40)
+    with pytest.raises(ValueError, match="evaluation failed"):
+        run_islands(generator, islands=3, migration_interval=2, seed=0)
+
+
+def test_vectorized_islands_return_the_scored_dungeon():
+    # Population entries are views that later generations overwrite
+    generator = VectorizedGenerator(population_size=60, generations=30)
+
+    report = run_islands(generator, islands=3, migration_interval=5, seed=2)
+
+    assert generator.compute_fitness(report.best_dungeon) == report.best_fitness
+
+
+def test_islands_share_the_whole_population():
+    generator = Generator(population_size=22, generations=4, elite_size=2)
+
+    report = run_islands(generator, islands=4, migration_interval=2, seed=0)
+
+    assert report.evaluations == 22 * 4
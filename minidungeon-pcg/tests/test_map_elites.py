@@ -0,0 +1,81 @@
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.map_elites import (
+    Elite,
+    EliteArchive,
+    evaluate_elites,
+    run_map_elites,
+)
+
+
+def archive():
+    return EliteArchive(
+        {
+            "wall_ratio": (0.3, 0.8, 10),
+            "path_length": (0, 40, 10),
+            "monsters_on_path": (0, 5, 5),
+        }
+    )
+
+
+def elite(fitness, wall_ratio=0.5, path_length=10, monsters_on_path=1):
+    return Elite(["S.E"], fitness, wall_ratio, path_length, monsters_on_path)
+
+
+def test_out_of_range_descriptors_clamp_to_the_edge_cells():
+    cells = archive()
+
+    assert cells.cell(0.0, -5, -1) == (0, 0, 0)
+    assert cells.cell(0.99, 400, 9) == (9, 9, 4)
+    assert cells.cell(0.55, 20, 2) == (5, 5, 2)
+
+
+def test_insert_keeps_the_fittest_elite_per_cell():
+    cells = archive()
+
+    assert cells.insert(elite(10.0))
+    assert not cells.insert(elite(10.0, wall_ratio=0.51))
+    assert not cells.insert(elite(5.0))
+    assert cells.insert(elite(12.0, path_length=11))
+    assert cells.insert(elite(1.0, wall_ratio=0.9))
+
+    assert len(cells) == 2
+    assert cells.query(0.5, 10, 1).fitness == 12.0
+    assert cells.query(0.1, 10, 1) is None
+    assert cells.best().fitness == 12.0
+
+
+def test_archive_survives_a_save_and_load(tmp_path):
+    generator = Generator(population_size=20, generations=3, seed=0)
+    report = run_map_elites(generator, seed=0)
+    filename = tmp_path / "archive.json"
+
+    report.archive.save(str(filename))
+    loaded = EliteArchive.load(str(filename))
+
+    assert loaded.ranges == report.archive.ranges
+    assert loaded.elites == report.archive.elites
+
+
+def test_seeded_runs_fill_the_same_archive():
+    archives = [
+        run_map_elites(Generator(population_size=20), iterations=4, seed=3).archive
+        for _ in range(2)
+    ]
+
+    assert archives[0].elites == archives[1].elites
+    for cell, found in archives[0].elites.items():
+        assert archives[0].cell(*found.descriptors()) == cell
+
+
+def test_elites_are_scored_through_the_fitness_cache():
+    generator = Generator(population_size=20, seed=1)
+    population = generator.initialize_population()
+
+    first = evaluate_elites(generator, population)
+    second = evaluate_elites(generator, population)
+
+    assert generator.fitness_cache.hits >= len(population)
+    assert [e.fitness for e in first] == [e.fitness for e in second]
+    assert [e.fitness for e in first] == [
+        generator.compute_fitness(dungeon) for dungeon in population
+    ]
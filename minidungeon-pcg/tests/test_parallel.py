@@ -0,0 +1,49 @@
+import time
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.parallel import generate_stages
+
+
+class SlowGenerator(Generator):
+    def generate_dungeon(self, *args, **kwargs):
+        time.sleep(0.5)
+        return super().generate_dungeon(*args, **kwargs)
+
+
+def test_stages_stream_one_per_seed():
+    generator = Generator(population_size=10, generations=3)
+
+    serial = [stage.seed for stage in generator.generate_many(5)]
+    pooled = list(generate_stages(generator, range(5), workers=2, max_in_flight=3))
+
+    assert serial == [0, 1, 2, 3, 4]
+    assert sorted(stage.seed for stage in pooled) == serial
+    for stage in pooled:
+        assert generator.calculate_fitness(stage.dungeon) == stage.fitness
+
+
+def test_seeds_are_consumed_lazily():
+    generator = Generator(population_size=10, generations=3)
+    pulled = []
+
+    def seeds():
+        for seed in range(100):
+            pulled.append(seed)
+            yield seed
+
+    stages = generate_stages(generator, seeds(), workers=2, max_in_flight=3)
+    next(stages)
+    stages.close()
+
+    assert len(pulled) <= 4
+
+
+def test_early_break_skips_queued_runs():
+    generator = SlowGenerator(population_size=10, generations=3)
+    stages = generate_stages(generator, range(100), workers=2, max_in_flight=12)
+    next(stages)
+
+    start = time.perf_counter()
+    stages.close()
+
+    # Only the runs already started are waited for, not the ten queued ones
+    assert time.perf_counter() - start < 1.5
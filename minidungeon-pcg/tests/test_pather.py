@@ -0,0 +1,99 @@
+import random
+from collections import deque
+from minidungeon_pcg.envs.agent.pather import Pather
+from minidungeon_pcg.pcg.generator import Generator
+from tests.corpus import stage_grids
+
+TARGETS = ({"M"}, {"T"}, {"P"}, {"E"}, {"T", "P"})
+
+
+def dict_bfs(grid, start, avoid_monsters):
+    """The dict-based BFS Pather used before the flat-array kernel"""
+    width = max(len(row) for row in grid)
+    distances, previous = {start: 0}, {}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < len(grid)):
+                continue
+            tile = grid[ny][nx] if nx < len(grid[ny]) else " "
+            if (nx, ny) in distances or tile == "#" or avoid_monsters and tile == "M":
+                continue
+            distances[(nx, ny)] = distances[(x, y)] + 1
+            previous[(nx, ny)] = (x, y)
+            queue.append((nx, ny))
+    return distances, previous
+
+
+def nearest_path(grid, start, targets, avoid_monsters):
+    distances, previous = dict_bfs(grid, start, avoid_monsters)
+    reached = [
+        (distances[(x, y)], y, x)
+        for y, row in enumerate(grid)
+        for x, tile in enumerate(row)
+        if tile in targets and (x, y) != start and (x, y) in distances
+    ]
+    if not reached:
+        return []
+    _, y, x = min(reached)
+    path = [(x, y)]
+    while path[-1] != start:
+        path.append(previous[path[-1]])
+    return path[::-1]
+
+
+def test_flat_bfs_matches_dict_bfs():
+    rng = random.Random(0)
+    for width, height in ((9, 9), (12, 7)):
+        generator = Generator(width=width, height=height, population_size=20, seed=1)
+        for grid in stage_grids(generator):
+            pather = Pather()
+            for _ in range(4):
+                start = (rng.randrange(width), rng.randrange(height))
+                for avoid in (False, True):
+                    assert pather.bfs(grid, start, avoid) == dict_bfs(
+                        grid, start, avoid
+                    )
+                    for targets in TARGETS:
+                        path = nearest_path(grid, start, targets, avoid)
+                        assert pather.shortest_path(grid, start, targets, avoid) == path
+                        assert pather.distance_to_nearest(
+                            grid, start, targets, avoid
+                        ) == (len(path) - 1 if path else 1000)
+                # Queries after a write must see the new grid
+                x, y = start
+                if x < len(grid[y]) and grid[y][x] != "#":
+                    grid[y][x] = "M" if grid[y][x] == "." else "."
+                    pather.mark_grid_changed((x, y))
+
+
+def test_queries_of_one_step_share_trees_until_the_grid_changes():
+    grid = [list(row) for row in ("#######", "#S.T.E#", "#.#M#.#", "#######")]
+    pather = Pather()
+    start = (1, 1)
+    for avoid in (False, True):
+        assert pather.shortest_path(grid, start, {"T"}, avoid) == [
+            (1, 1),
+            (2, 1),
+            (3, 1),
+        ]
+        assert pather.next_action(grid, start, {"E"}, avoid) == 4
+        assert pather.distance_to_nearest(grid, start, {"M"}, avoid) == (
+            1000 if avoid else 3
+        )
+    assert pather.bfs_runs == 2
+
+    # Unannounced writes are not seen, announced ones are
+    grid[1][2] = "#"
+    assert pather.distance_to_nearest(grid, start, {"T"}) == 2
+    pather.mark_grid_changed((2, 1))
+    assert pather.distance_to_nearest(grid, start, {"T"}) == 1000
+    assert pather.next_action(grid, start, {"E"}) == 0
+    assert pather.bfs_runs == 3
+
+    # Moving on drops the trees of the previous position
+    assert pather.distance_to_nearest(grid, (3, 1), {"E"}) == 2
+    assert pather.distance_to_nearest(grid, start, {"T"}) == 1000
+    assert pather.bfs_runs == 5
@@ -0,0 +1,83 @@
+import random
+import pytest
+from minidungeon_pcg.envs.agent.field_pather import FieldPather
+from minidungeon_pcg.envs.agent.pather import Pather
+from minidungeon_pcg.envs.agent.route_table import RoutePather, RouteTable
+from minidungeon_pcg.pcg.generator import Generator
+from tests.corpus import stage_grids
+
+QUERIES = (
+    ({"M"}, False),
+    ({"T"}, False),
+    ({"T"}, True),
+    ({"P"}, True),
+    ({"E"}, False),
+    ({"E"}, True),
+)
+MOVES = {1: (0, -1), 2: (0, 1), 3: (-1, 0), 4: (1, 0)}
+
+
+def tile_at(grid, x, y):
+    return grid[y][x] if x < len(grid[y]) else " "
+
+
+def pick_up(grid, rng, *pathers):
+    """Clear a random entity tile as the agent would, False if none is left"""
+    entities = [
+        (x, y)
+        for y, row in enumerate(grid)
+        for x, tile in enumerate(row)
+        if tile in "MTPE"
+    ]
+    if not entities:
+        return False
+    x, y = rng.choice(entities)
+    grid[y][x] = "."
+    for pather in pathers:
+        pather.mark_grid_changed((x, y))
+    return True
+
+
+@pytest.mark.parametrize(
+    "make_pather, same_ties",
+    [
+        pytest.param(lambda grid: FieldPather(), False, id="fields"),
+        pytest.param(
+            lambda grid: RoutePather(RouteTable.build(grid)), True, id="routes"
+        ),
+    ],
+)
+def test_pathers_match_pather_while_tiles_are_picked_up(make_pather, same_ties):
+    rng = random.Random(0)
+    generator = Generator(width=10, height=8, population_size=12, seed=3)
+    for grid in stage_grids(generator):
+        fast, pather = make_pather(grid), Pather()
+        width = max(len(row) for row in grid)
+        for _ in range(6):
+            for y in range(len(grid)):
+                for x in range(width):
+                    for targets, avoid in QUERIES:
+                        distance = pather.distance_to_nearest(
+                            grid, (x, y), targets, avoid
+                        )
+                        assert (
+                            fast.distance_to_nearest(grid, (x, y), targets, avoid)
+                            == distance
+                        )
+                        action = fast.next_action(grid, (x, y), targets, avoid)
+                        expected = pather.next_action(grid, (x, y), targets, avoid)
+                        assert (action == 0) == (expected == 0)
+                        if same_ties and not avoid:
+                            assert action == expected
+                        if action and tile_at(grid, x, y) not in targets:
+                            # Otherwise any shortest move will do
+                            dx, dy = MOVES[action]
+                            if tile_at(grid, x + dx, y + dy) not in targets:
+                                assert (
+                                    pather.distance_to_nearest(
+                                        grid, (x + dx, y + dy), targets, avoid
+                                    )
+                                    == distance - 1
+                                )
+            if not pick_up(grid, rng, pather, fast):
+                break
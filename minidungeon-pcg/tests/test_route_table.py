@@ -0,0 +1,28 @@
+from minidungeon_pcg.envs.agent.route_table import RoutePather, RouteTable
+
+
+def test_moved_walls_fall_back_to_search():
+    grid = [list(row) for row in ("#######", "#S..#E#", "#.#...#", "#######")]
+    routes = RoutePather(RouteTable.build(grid))
+    assert routes.distance_to_nearest(grid, (1, 1), {"E"}) == 6
+
+    grid[2][3] = "#"
+    routes.mark_grid_changed((3, 2))
+
+    assert routes.distance_to_nearest(grid, (1, 1), {"E"}) == 1000
+    assert routes.fallbacks == 1
+
+
+def test_tables_are_cached_per_stage_file(tmp_path):
+    rows = ["#########", "#S..T..E#", "#.M.#.P.#", "#########"]
+    stage_file = tmp_path / "stage.txt"
+    stage_file.write_text("\n".join(rows))
+    grid = [list(row) for row in rows]
+
+    built = RouteTable.for_stage(str(stage_file), grid, str(tmp_path / "routes"))
+    loaded = RouteTable.for_stage(str(stage_file), grid, str(tmp_path / "routes"))
+
+    assert [path.suffix for path in (tmp_path / "routes").iterdir()] == [".npz"]
+    assert (loaded.cells == built.cells).all()
+    assert (loaded.distance == built.distance).all()
+    assert (loaded.next_hop == built.next_hop).all()
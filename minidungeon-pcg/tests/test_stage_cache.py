@@ -0,0 +1,64 @@
+import os
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.stage_cache import StageCache
+
+
+class CountingGenerator(Generator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.runs = 0
+
+    def evolve(self, *args, **kwargs):
+        self.runs += 1
+        return super().evolve(*args, **kwargs)
+
+
+def run(generator, seed):
+    return generator.generate_dungeon(seed=seed, save=False, verbose=False)
+
+
+def test_seeded_runs_are_reproducible():
+    first, second = (Generator(population_size=20, generations=10) for _ in range(2))
+
+    assert run(first, 4) == run(second, 4)
+    assert first.fitness_trace == second.fitness_trace
+    assert run(first, 4) == run(second, 4)  # reseeding resets the stream
+
+
+def test_seeded_runs_are_served_from_the_stage_cache(tmp_path):
+    cache = StageCache(str(tmp_path))
+    generator = CountingGenerator(population_size=20, generations=10, stage_cache=cache)
+
+    dungeon = run(generator, 4)
+    trace = generator.fitness_trace
+    assert run(generator, 4) == dungeon
+
+    assert generator.runs == 1
+    assert generator.fitness_trace == trace
+    assert run(Generator(population_size=20, generations=10), 4) == dungeon
+
+
+def test_cache_misses_on_other_parameters_and_unseeded_runs(tmp_path):
+    cache = StageCache(str(tmp_path))
+    generator = CountingGenerator(population_size=20, generations=10, stage_cache=cache)
+
+    run(generator, 4)
+    generator.mutation_rate = 0.3
+    run(generator, 4)
+    run(generator, None)
+
+    assert generator.runs == 3
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = StageCache(str(tmp_path), max_bytes=250)
+    rows = ["#" * 20] * 5
+    for key in ("a", "b", "c"):
+        cache.put(key, rows, [1.0])
+        os.utime(tmp_path / f"{key}.json", (0, {"a": 1, "b": 2, "c": 3}[key]))
+
+    cache.evict()
+
+    assert cache.get("a") is None
+    assert cache.get("c") == (rows, [1.0])
@@ -0,0 +1,58 @@
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.staged import StagedFitness
+from minidungeon_pcg.pcg.surrogate import LinearSurrogate
+
+
+def test_bounds_stay_out_of_the_fitness_cache():
+    generator = Generator(
+        width=24,
+        height=16,
+        population_size=30,
+        generations=8,
+        seed=3,
+        staged=StagedFitness(),
+    )
+    for _ in generator.evolve():
+        pass
+
+    assert sum(generator.staged.totals[:2]) > 0  # some individuals were cut short
+    entries = generator.fitness_cache._entries
+    assert entries
+    for key, fitness in entries.items():
+        rows = [
+            key[i : i + generator.width] for i in range(0, len(key), generator.width)
+        ]
+        assert fitness == generator.compute_fitness([list(row) for row in rows])
+
+
+def test_small_maps_are_evaluated_in_full():
+    generator = Generator(width=9, height=9, population_size=20, seed=1)
+    staged = StagedFitness()
+    staged.threshold = float("inf")
+    population = generator.initialize_population()
+
+    fitnesses, exact = staged.evaluate_many(generator, population)
+
+    assert all(exact)
+    assert fitnesses == [generator.compute_fitness(d) for d in population]
+
+
+def test_the_surrogate_only_learns_exact_fitness():
+    surrogate = LinearSurrogate(fraction=0.5, min_samples=20)
+    generator = Generator(population_size=40, seed=2, surrogate=surrogate)
+    bound = -12345.0
+
+    def evaluate(population):
+        # Every other individual is cut short with a bound, as staged does
+        fitnesses = [generator.compute_fitness(d) for d in population]
+        exact = [i % 2 == 0 for i in range(len(population))]
+        return [f if e else bound for f, e in zip(fitnesses, exact)], exact
+
+    population = generator.initialize_population()
+    generator.evaluate_screened(population, evaluate)  # trains on 20 exact scores
+    assert surrogate.trained
+    _, screening = generator.evaluate_screened(population, evaluate)
+
+    assert bound not in surrogate._targets
+    assert len(surrogate._targets) > 20
+    assert screening.error is not None and screening.error < abs(bound)
@@ -0,0 +1,72 @@
+import math
+import numpy as np
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.surrogate import LinearSurrogate
+
+
+def samples(weights, count, seed):
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(count, len(weights)))
+    return features, (features @ weights).tolist()
+
+
+def test_refit_follows_the_latest_window():
+    surrogate = LinearSurrogate(min_samples=50, window=100, ridge=1e-9)
+    old, new = np.array([1.0, -2.0, 0.5]), np.array([-3.0, 0.0, 4.0])
+
+    surrogate.update(*samples(old, 40, seed=0))
+    assert not surrogate.trained
+    surrogate.update(*samples(old, 40, seed=1))
+    assert surrogate.trained
+    assert np.allclose(surrogate.weights, old)
+
+    # The window only keeps the last 100 samples, all from the new relation
+    surrogate.update(*samples(new, 100, seed=2))
+    assert len(surrogate._targets) == 100
+    assert np.allclose(surrogate.weights, new)
+
+    surrogate.reset()
+    assert not surrogate.trained
+
+
+def test_screening_scores_the_top_fraction_and_cached_genomes():
+    surrogate = LinearSurrogate(fraction=0.25, min_samples=40)
+    generator = Generator(population_size=40, seed=6, surrogate=surrogate)
+    population = generator.initialize_population()
+    evaluate = generator.evaluate_population_bounded
+    generator.evaluate_screened(population, evaluate)
+    assert surrogate.trained
+
+    generator.fitness_cache.clear()
+    cached = population[:4]
+    generator.evaluate_population(cached)
+    # Screening refits the model, so predict with the one it ranks by
+    predicted = surrogate.predict(surrogate.features(generator, population))
+    fitnesses, screening = generator.evaluate_screened(population, evaluate)
+
+    scored = math.ceil(0.25 * (len(population) - len(cached)))
+    assert set(range(4)) <= set(screening.exact_indices)
+    assert len(screening.exact_indices) == len(cached) + scored
+    assert screening.evaluations_saved == len(population) - len(cached) - scored
+    assert screening.error is not None
+    for i, dungeon in enumerate(population):
+        if i in screening.exact_indices:
+            assert fitnesses[i] == generator.compute_fitness(dungeon)
+        else:
+            assert fitnesses[i] == predicted[i]
+    # The scored ones are the ones the model ranked highest
+    ranked = sorted(range(4, len(population)), key=lambda i: -predicted[i])
+    assert set(screening.exact_indices) - set(range(4)) == set(ranked[:scored])
+
+
+def test_screened_runs_save_evaluations_and_keep_an_exact_best():
+    surrogate = LinearSurrogate(fraction=0.25, min_samples=60)
+    generator = Generator(population_size=30, generations=12, seed=1)
+    generator.surrogate = surrogate
+
+    progress = list(generator.evolve())
+
+    last = progress[-1]
+    assert last.evaluations < 30 * 12
+    assert sum(step.evaluations_saved for step in progress) > 0
+    assert generator.compute_fitness(last.best_dungeon) == last.best_fitness
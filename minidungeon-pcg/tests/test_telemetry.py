@@ -0,0 +1,42 @@
+import cProfile
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.telemetry import ProfileHook
+
+
+def caller_work():
+    return sum(range(1000))
+
+
+def profiled_functions(stats):
+    return {function for _, _, function in stats.stats}
+
+
+def test_profiles_leave_out_the_caller():
+    generator = Generator(population_size=10, generations=3, seed=0)
+    hook = ProfileHook(every=1)
+    generator.add_observer(hook)
+
+    for _ in generator.evolve():
+        caller_work()
+
+    assert sorted(hook.profiles) == [0, 1, 2]
+    for stats in hook.profiles.values():
+        functions = profiled_functions(stats)
+        assert "next_generation" in functions
+        assert "caller_work" not in functions
+
+
+def test_stopping_early_disables_the_profiler():
+    generator = Generator(population_size=10, generations=3, seed=0)
+    hook = ProfileHook(every=1)
+    generator.add_observer(hook)
+
+    progress = generator.evolve()
+    next(progress)
+    progress.close()
+
+    assert hook.profiles == {}
+    # Only one profiler can be active at a time
+    profiler = cProfile.Profile()
+    profiler.enable()
+    profiler.disable()
@@ -0,0 +1,76 @@
+import numpy as np
+from minidungeon_pcg.pcg.staged import StagedFitness
+from minidungeon_pcg.pcg.vectorized_generator import VectorizedGenerator
+
+
+class RecordingRng:
+    """np.random.Generator that keeps every array it hands out"""
+
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+        self.draws = []
+
+    def random(self, shape):
+        self.draws.append(self.rng.random(shape))
+        return self.draws[-1]
+
+
+class ScriptedRng:
+    """Stands in for random.Random, handing out prepared numbers"""
+
+    def __init__(self, draws):
+        self.draws = list(draws)
+
+    def random(self):
+        return self.draws.pop(0)
+
+
+def test_mutate_batch_follows_the_scalar_rules():
+    generator = VectorizedGenerator(population_size=60, mutation_rate=0.4, seed=9)
+    population = np.stack(generator.initialize_population())
+    generator.repair_batch(population)
+    flat = population.reshape(len(population), -1)
+
+    batched = population.copy()
+    rng = RecordingRng(9)
+    generator.mutate_batch(batched, rng)
+    generator.repair_batch(batched)
+
+    # The batch draws the mutating tiles, then a mutation type and a wall
+    # opening for each of them; `mutate` draws the same per tile
+    mutation = rng.draws[0]
+    mutating = mutation < generator.mutation_rate
+    mutating &= (flat != generator.START) & (flat != generator.EXIT)
+    kind, opening = np.zeros((2,) + flat.shape)
+    kind[mutating], opening[mutating] = rng.draws[1:]
+    for i, dungeon in enumerate(population):
+        scalar_draws = []
+        for cell, tile in enumerate(flat[i]):
+            scalar_draws.append(mutation[i, cell])
+            if mutation[i, cell] >= generator.mutation_rate:
+                continue
+            if tile in (generator.START, generator.EXIT):
+                continue
+            scalar_draws.append(kind[i, cell])
+            if kind[i, cell] < 0.3 and tile == generator.WALL:
+                scalar_draws.append(opening[i, cell])
+        generator.rng = ScriptedRng(scalar_draws)
+
+        child = generator.mutate(dungeon.copy())
+
+        assert not generator.rng.draws
+        assert (child == batched[i]).all()
+
+
+def test_evolve_handles_missing_censuses():
+    generator = VectorizedGenerator(
+        population_size=20, generations=5, seed=9, staged=StagedFitness(min_tiles=0)
+    )
+    population = generator.initialize_population()
+    fitnesses = generator.evaluate_population(population)
+
+    _, censuses, _ = generator.next_generation(population, [None] * 20, fitnesses)
+
+    assert censuses == [None] * 20
+    best = [progress.best_fitness for progress in generator.evolve()]
+    assert len(best) == 5
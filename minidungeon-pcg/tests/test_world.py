@@ -0,0 +1,61 @@
+import pickle
+import pytest
+from minidungeon_pcg.pcg import genome
+from minidungeon_pcg.pcg.generator import Generator
+from minidungeon_pcg.pcg.numpy_generator import NumpyGenerator
+from minidungeon_pcg.pcg.world import (
+    ChunkGenerator,
+    chunk_bounds,
+    chunk_class,
+    generate_world,
+    place_doors,
+)
+
+
+def test_narrow_seams_get_fewer_doors():
+    generator = Generator(width=40, height=9, seed=0)
+    row_bounds = chunk_bounds(generator.height, 3)
+    col_bounds = chunk_bounds(generator.width, 4)
+
+    doors = place_doors(generator, row_bounds, col_bounds, doors_per_seam=3)
+
+    for (r, c), chunk_doors in doors.items():
+        height = row_bounds[r][1] - row_bounds[r][0]
+        width = col_bounds[c][1] - col_bounds[c][0]
+        for i, j in chunk_doors:
+            # A door is on one border and never on a corner
+            assert (i in (0, height - 1)) != (j in (0, width - 1))
+        below = [j for i, j in chunk_doors if i == height - 1]
+        if r + 1 < len(row_bounds):
+            assert len(below) == min(3, width - 2)
+
+
+def test_chunks_run_on_the_generator_backend():
+    doors = [(0, 3), (4, 0), (5, 7)]
+    reference = ChunkGenerator(width=8, height=6, population_size=30, doors=doors)
+    chunk = chunk_class(NumpyGenerator)(width=8, height=6, doors=doors)
+    population = reference.initialize_population()
+
+    fitnesses = chunk.compute_fitness_many([genome.encode(d) for d in population])
+
+    assert isinstance(chunk, NumpyGenerator)
+    assert fitnesses == [reference.compute_fitness(d) for d in population]
+    assert pickle.loads(pickle.dumps(chunk)).doors == doors
+
+
+def test_world_from_a_numpy_generator():
+    generator = NumpyGenerator(width=12, height=10, population_size=10, generations=3)
+
+    report = generate_world(generator, chunk_size=5, workers=2, seed=0)
+
+    assert (report.chunk_rows, report.chunk_cols) == (2, 2)
+    tiles = "".join("".join(row) for row in report.dungeon)
+    assert set(tiles) <= set(genome.TILE_CHARS)
+    assert (tiles.count("S"), tiles.count("E")) == (1, 1)
+    assert report.path_exists
+
+
+def test_chunks_below_the_minimum_are_rejected():
+    generator = Generator(width=20, height=20)
+    with pytest.raises(ValueError, match="at least 5 tiles"):
+        generate_world(generator, chunk_size=4)